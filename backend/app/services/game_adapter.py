@@ -4,6 +4,7 @@ import asyncio
 import logging
 from typing import Any, Dict, List, Optional, Tuple
 
+from ..core.config import settings
 from ..models.bots import BotInterface
 from ..models.actions import Move, MoveResult, SpellAction
 from ..models.results import GameResult, GameResultType, PlayerGameStats
@@ -27,6 +28,7 @@ class GameEngineAdapter:
         self.engine = None
         self.bot1 = None
         self.bot2 = None
+        self.decisions = None
         self._turn_events = []
         self._game_started = False
 
@@ -45,12 +47,27 @@ class GameEngineAdapter:
                 from game.engine import GameEngine as _GameEngine
 
                 GameEngine = _GameEngine
+            from game.decisions import WORKER_PROCESS, WORKER_THREAD, DecisionRunner
+            from game.snapshots import SNAPSHOT_PER_TURN
 
             self.bot1 = bot1
             self.bot2 = bot2
 
             # Create the game engine with bot instances
             self.engine = GameEngine(bot1, bot2)
+            # Streaming reads live engine state; keep only end-of-turn snapshots
+            self.engine.snapshot_policy = SNAPSHOT_PER_TURN
+            # Bound each decide call; a bot that overruns plays an idle turn. Built-in bots run in
+            # worker processes under the memory cap; player bots get their actions set in this
+            # process, so they decide on threads
+            both_builtin = bot1.is_builtin and bot2.is_builtin
+            self.decisions = DecisionRunner(
+                timeout=settings.bot_execution_timeout,
+                cpu_timeout=settings.bot_execution_timeout,
+                workers=WORKER_PROCESS if both_builtin else WORKER_THREAD,
+                memory_limit_mb=settings.max_bot_memory_mb,
+            )
+            self.engine.decisions = self.decisions
             self._game_started = True
             self._turn_events = []
 
@@ -75,7 +92,10 @@ class GameEngineAdapter:
             current_turn = self.engine.turn
 
             # Execute the turn using the existing game engine
+            overruns_before = sum(self.decisions.overruns.values()) if self.decisions else 0
             self.engine.run_turn()
+            if self.decisions and sum(self.decisions.overruns.values()) > overruns_before:
+                logger.warning(f"Bot decision overran its time budget: {dict(self.decisions.overruns)}")
 
             # Get the current game state after turn execution
             game_state = self.get_game_state()
@@ -181,6 +201,15 @@ class GameEngineAdapter:
             logger.error(f"Error checking game over: {e}")
             return None
 
+    def get_overrun_counts(self) -> Dict[str, int]:
+        """Get how many decisions each bot failed to make within the time budget."""
+        return dict(self.decisions.overruns) if self.decisions else {}
+
+    def close(self) -> None:
+        """Release the bot decision workers."""
+        if self.decisions:
+            self.decisions.close()
+
     def get_turn_events(self) -> List[TurnEvent]:
         """Get all turn events from the current game."""
         return self._turn_events.copy()
@@ -280,10 +280,11 @@ class SessionManager:
             if self._sse:
                 await self._sse.close_session_streams(ctx.session_id)
         finally:
+            # Stop the adapter's decision workers
+            ctx.adapter.close()
             # NOTE: Visualizer is NOT terminated automatically when session ends.
             # It remains open to show the final game state.
             # Admin can manually terminate via cleanup_session() API or user can close the window.
-            pass
 
     async def get_session(self, session_id: str) -> SessionContext:
         async with self._lock:
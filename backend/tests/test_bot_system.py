@@ -414,6 +414,39 @@ class TestGameEngineAdapter:
         assert adapter._game_started == True
         mock_game_engine.assert_called_once_with(bot1, bot2)
 
+    @patch("backend.app.services.game_adapter.GameEngine")
+    def test_initialize_match_budgets_decisions(self, mock_game_engine):
+        """Test that decisions get the configured time and memory budget."""
+        from backend.app.core.config import settings
+        from game.decisions import WORKER_PROCESS, WORKER_THREAD
+
+        class TestBot(BotInterface):
+            def decide(self, state):
+                return {"move": [0, 0]}
+
+        def make_bot(player_id, is_builtin):
+            player = Player(
+                player_id=player_id,
+                player_name=player_id,
+                submitted_from="test",
+                is_builtin=is_builtin,
+                created_at=datetime.now(),
+            )
+            return TestBot(player)
+
+        adapter = GameEngineAdapter()
+        adapter.initialize_match(make_bot("b1", True), make_bot("b2", True))
+        assert adapter.decisions.timeout == settings.bot_execution_timeout
+        assert adapter.decisions.memory_limit_mb == settings.max_bot_memory_mb
+        assert adapter.decisions.workers == WORKER_PROCESS
+        adapter.close()
+
+        # Player bots get their actions in this process, so they stay on threads
+        adapter = GameEngineAdapter()
+        adapter.initialize_match(make_bot("b1", True), make_bot("p1", False))
+        assert adapter.decisions.workers == WORKER_THREAD
+        adapter.close()
+
     def test_get_game_state_without_engine(self):
         """Test getting game state without initialized engine."""
         adapter = GameEngineAdapter()
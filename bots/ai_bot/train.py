@@ -7,6 +7,7 @@ from collections import defaultdict
 import torch
 import torch.optim as optim
 
+from game.snapshots import SNAPSHOT_PER_TURN
 from simulator.match import run_match
 from bots.ai_bot.ai_bot import AIBot
 from bots.sample_bot1.sample_bot_1 import SampleBot1
@@ -137,7 +138,7 @@ def evaluate_bot(bot1, bot2, num_matches=10):
     print(f"\nEvaluating {bot1.name} vs {bot2.name} for {num_matches} matches")
     
     for match_num in range(num_matches):
-        winner, logger = run_match(bot1, bot2, max_turns=100)
+        winner, logger = run_match(bot1, bot2, max_turns=100, snapshot_policy=SNAPSHOT_PER_TURN)
         results[winner] += 1
         print(f"Match {match_num + 1}: Winner = {winner}")
         
@@ -0,0 +1,83 @@
+from operator import index
+from typing import NamedTuple, Optional
+
+from game.rules import SPELL_IDS, SPELL_NAMES
+from game.spells import SPELL_HANDLERS
+
+NO_SPELL = -1
+
+
+class Action(NamedTuple):
+    """One bot's decision for a turn, parsed and validated.
+
+    ``move`` is ``(dx, dy)`` with both in -1..1, or None to stay put without moving (an explicit
+    ``(0, 0)`` still counts as a move, e.g. for collisions). ``spell`` is a spell id
+    (``game.rules.Spell``) or NO_SPELL, and ``target`` an ``(x, y)`` tuple or None. Bots may
+    return an Action instead of a dict to skip parsing.
+    """
+
+    move: Optional[tuple] = None
+    spell: int = NO_SPELL
+    target: Optional[tuple] = None
+
+    @property
+    def spell_name(self):
+        return None if self.spell == NO_SPELL else SPELL_NAMES[self.spell]
+
+
+IDLE = Action()
+
+
+def parse_action(raw, logger=None):
+    """Turn a bot's action dict into an Action, logging and dropping anything malformed.
+
+    Invalid moves become ``(0, 0)`` as they always have. An unknown spell, or a targeted spell
+    without a valid target, is dropped instead of failing later in the engine.
+    """
+    if type(raw) is Action:
+        return raw
+    if not isinstance(raw, dict):
+        _log(logger, "Invalid action: Must be a dict.")
+        return IDLE
+
+    move = raw.get("move")
+    if move:
+        if isinstance(move, (list, tuple)) and len(move) == 2 and all(isinstance(i, int) for i in move):
+            if -1 <= move[0] <= 1 and -1 <= move[1] <= 1:
+                move = (move[0], move[1])
+            else:
+                _log(logger, "Invalid move: Out of bounds.")
+                move = (0, 0)
+        else:
+            _log(logger, "Invalid move: Must be an array of two integers.")
+            move = (0, 0)
+    else:
+        move = None
+
+    spell = raw.get("spell")
+    if not spell:
+        return Action(move)
+    try:
+        spell_id = SPELL_IDS[spell["name"]]
+    except (KeyError, TypeError):
+        _log(logger, f"Invalid spell: {spell!r}")
+        return Action(move)
+    target = _position(spell.get("target"))
+    if target is None and SPELL_HANDLERS[spell_id].targeted:
+        _log(logger, f"Invalid spell target: {spell.get('target')!r}")
+        return Action(move)
+    return Action(move, spell_id, target)
+
+
+def _position(value):
+    """Return ``(x, y)`` for a pair of integers (NumPy integers included), else None."""
+    try:
+        x, y = value
+        return index(x), index(y)
+    except (TypeError, ValueError):
+        return None
+
+
+def _log(logger, message):
+    if logger is not None:
+        logger.log(message)
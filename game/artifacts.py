@@ -1,9 +1,63 @@
 import random
-from game.rules import BOARD_SIZE
+from game import board
+from game.rules import BOARD_SIZE, MAX_HP, MAX_MANA
+from game.state import ArtifactState
+from game.zobrist import artifact_hash
+
+ARTIFACT_TYPES = ("health", "mana", "cooldown")
+HEALTH_ARTIFACT_HP = 20
+MANA_ARTIFACT_MANA = 30
+MAX_OCCUPIED_FOR_SPAWN = 10  # no spawn once more tiles than this are taken
 
 class ArtifactManager:
-    def __init__(self):
-        self.artifacts = []  # List of dicts with position and type
+    def __init__(self, rng=None):
+        # (x, y) -> artifact dict with position, type and spawn turn. Dicts keep insertion order,
+        # so iterating gives the artifacts in spawn order.
+        self._by_position = {}
+        self.occupied = 0  # bitboard of artifact tiles (see game.board)
+        self._list = []  # cached spawn-ordered list, rebuilt after a change
+        self.zobrist = 0  # XOR of game.zobrist.artifact_hash over the active artifacts
+        self.rng = rng if rng is not None else random.Random(random.getrandbits(64))
+
+    @property
+    def artifacts(self):
+        """Active artifacts in spawn order; treat the list as read-only."""
+        if self._list is None:
+            self._list = list(self._by_position.values())
+        return self._list
+
+    @artifacts.setter
+    def artifacts(self, artifacts):
+        self._by_position = {(a["position"][0], a["position"][1]): a for a in artifacts}
+        self.occupied = board.to_mask(self._by_position)
+        self._list = None
+        self.zobrist = 0
+        for artifact in self._by_position.values():
+            self.zobrist ^= artifact_hash(artifact["type"], artifact["position"])
+
+    def copy(self, rng=None):
+        # Artifact dicts are never modified after spawning, so only the index is copied
+        clone = ArtifactManager(rng if rng is not None else self.rng)
+        clone._by_position = dict(self._by_position)
+        clone.occupied = self.occupied
+        clone._list = self._list
+        clone.zobrist = self.zobrist
+        return clone
+
+    def at(self, pos):
+        """Return the artifact on a tile, or None."""
+        return self._by_position.get((pos[0], pos[1]))
+
+    def to_state(self):
+        return tuple(ArtifactState(a["type"], tuple(a["position"]), a["spawn_turn"]) for a in self.artifacts)
+
+    @classmethod
+    def from_state(cls, artifacts, rng=None):
+        manager = cls(rng)
+        manager.artifacts = [
+            {"type": a.type, "position": list(a.position), "spawn_turn": a.spawn_turn} for a in artifacts
+        ]
+        return manager
 
     def spawn_random(self, occupied_positions=[], turn=0):
         """
@@ -12,59 +66,61 @@ class ArtifactManager:
 
         Args:
             occupied_positions: List of positions that are already occupied
+            turn: Turn number recorded as the artifact's ``spawn_turn``
 
         Returns:
             bool: True if artifact was spawned, False otherwise
         """
-        # Convert occupied positions to a set of tuples for faster lookup
-        occupied = {tuple(pos) for pos in occupied_positions}
+        return self.spawn_in(board.to_mask(occupied_positions), turn)
 
+    def spawn_in(self, occupied, turn=0):
+        """Same as ``spawn_random`` with the occupied tiles given as a bitboard (see game.board)."""
         # Add existing artifact positions
-        for artifact in self.artifacts:
-            occupied.add(tuple(artifact["position"]))
+        occupied |= self.occupied
 
         # Check if there are more than 10 occupied positions
-        if len(occupied) > 10:
+        if board.popcount(occupied) > MAX_OCCUPIED_FOR_SPAWN:
             return False
 
-        # Generate all possible positions
-        all_positions = [(x, y) for x in range(BOARD_SIZE) for y in range(BOARD_SIZE)]
-
-        # Filter out occupied positions
-        free_positions = [pos for pos in all_positions if pos not in occupied]
-
-        if not free_positions:
+        free = board.FULL_BOARD & ~occupied
+        free_count = board.popcount(free)
+        if not free_count:
             return False
 
-        # Choose a random free position
-        x, y = random.choice(free_positions)
+        # Choose a random free position; drawing an index is the same draw as choosing from the
+        # list of free positions in board order
+        x, y = divmod(board.nth(free, self.rng.choice(range(free_count))), BOARD_SIZE)
 
-        artifact_type = random.choice(["health", "mana", "cooldown"])
-        self.artifacts.append({
+        artifact_type = self.rng.choice(ARTIFACT_TYPES)
+        self._by_position[(x, y)] = {
             "type": artifact_type,
             "position": [x, y],
             "spawn_turn": turn
-        })
+        }
+        self.occupied |= 1 << board.square((x, y))
+        self._list = None
+        self.zobrist ^= artifact_hash(artifact_type, (x, y))
         return True
 
     def check_pickup(self, wizard):
-        for artifact in self.artifacts:
-            if artifact["position"] == wizard.position:
-                self.apply_effect(wizard, artifact["type"])
-                self.artifacts.remove(artifact)
-                return artifact
-
-        return None
+        position = wizard.position
+        artifact = self._by_position.pop((position[0], position[1]), None)
+        if artifact is None:
+            return None
+        self.occupied &= ~board.bit(position)
+        self._list = None
+        self.zobrist ^= artifact_hash(artifact["type"], artifact["position"])
+        self.apply_effect(wizard, artifact["type"])
+        return artifact
 
     def apply_effect(self, wizard, kind):
         if kind == "health":
-            wizard.hp = min(100, wizard.hp + 20)
+            wizard.hp = min(MAX_HP, wizard.hp + HEALTH_ARTIFACT_HP)
         elif kind == "mana":
-            wizard.mana = min(100, wizard.mana + 30)
+            wizard.mana = min(MAX_MANA, wizard.mana + MANA_ARTIFACT_MANA)
         elif kind == "cooldown":
-            for spell in wizard.cooldowns:
-                if wizard.cooldowns[spell] > 0:
-                    wizard.cooldowns[spell] -= 1
+            wizard.reduce_cooldowns()
 
     def active_artifacts(self):
-        return self.artifacts
+        """Copies of the active artifacts in spawn order, safe to hand to bots."""
+        return [dict(a, position=list(a["position"])) for a in self.artifacts]
@@ -0,0 +1,515 @@
+import random
+from typing import NamedTuple
+
+import numpy as np
+
+from game.actions import NO_SPELL, parse_action
+from game.artifacts import (
+    ARTIFACT_TYPES,
+    HEALTH_ARTIFACT_HP,
+    MANA_ARTIFACT_MANA,
+    MAX_OCCUPIED_FOR_SPAWN,
+)
+from game.board import FIRST_MINION_ORDER
+from game.minion import MINION_DAMAGE, MINION_HP
+from game.rules import (
+    ARTIFACT_SPAWN_RATE,
+    BOARD_SIZE,
+    DIRECTIONS,
+    FIREBALL_SPLASH_DAMAGE,
+    MANA_REGEN,
+    MAX_HP,
+    MAX_MANA,
+    MELEE_DAMAGE,
+    SPELL_COOLDOWNS,
+    SPELL_COSTS,
+    SPELL_NAMES,
+    SPELLS,
+    Spell,
+)
+from game.state import ArtifactState, GameState, MinionState, WizardState
+
+# Entity slots in the per-match entity arrays: the two wizards, then one minion per owner (a wizard
+# can only summon while it has no live minion, so each owner has at most one).
+WIZARD1 = 0
+WIZARD2 = 1
+MINION1 = 2  # owned by wizard1
+MINION2 = 3  # owned by wizard2
+NO_ENTITY = -1
+
+# Values of BatchGameEngine.winner
+NO_WINNER = -1
+DRAW = 2
+
+# Neighbours in the order the engine scans them (splash damage and collision bounces skip the centre)
+_NEIGHBOURS = np.array([d for d in DIRECTIONS if d != (0, 0)])
+_SCATTER_DIRECTIONS = tuple(d for d in DIRECTIONS if d != (0, 0))
+_DIRECTIONS = np.array(DIRECTIONS)
+
+_COSTS = np.array(SPELL_COSTS)
+_COOLDOWNS = np.array(SPELL_COOLDOWNS)
+_SHIELD_BLOCK = SPELLS["shield"]["block"]
+_UNORDERED = np.iinfo(np.int64).max
+
+
+class BatchActions(NamedTuple):
+    """One turn of actions for every match in a batch, indexed ``[match, player]``."""
+
+    moves: np.ndarray  # int (N, 2, 2): dx, dy
+    has_move: np.ndarray  # bool (N, 2): False where the bot sent no move
+    spells: np.ndarray  # int (N, 2): game.rules.Spell id or NO_SPELL
+    targets: np.ndarray  # int (N, 2, 2): spell target, ignored by untargeted spells
+
+
+def encode_action(action):
+    """Return ``(move, has_move, spell, target)`` for a bot action dict or ``game.actions.Action``.
+
+    Actions go through ``game.actions.parse_action`` like in ``GameEngine``: a malformed or out of
+    range move becomes ``(0, 0)`` and a malformed spell is dropped.
+    """
+    move, spell, target = parse_action(action)
+    return move or (0, 0), move is not None, spell, target or (0, 0)
+
+
+def encode_actions(pairs):
+    """Build BatchActions from a list of ``(action1, action2)`` bot action dicts, one per match."""
+    encoded = [encode_action(action) for pair in pairs for action in pair]
+    n = len(pairs)
+    return BatchActions(
+        np.array([e[0] for e in encoded], dtype=np.int64).reshape(n, 2, 2),
+        np.array([e[1] for e in encoded], dtype=bool).reshape(n, 2),
+        np.array([e[2] for e in encoded], dtype=np.int64).reshape(n, 2),
+        np.array([e[3] for e in encoded], dtype=np.int64).reshape(n, 2, 2),
+    )
+
+
+def _on_board(pos):
+    return ((pos >= 0) & (pos < BOARD_SIZE)).all(-1)
+
+
+def _chebyshev(a, b):
+    return np.abs(a - b).max(-1)
+
+
+def _manhattan(a, b):
+    return np.abs(a - b).sum(-1)
+
+
+class BatchGameEngine:
+    """Play many matches in lockstep with the state of all of them held in NumPy arrays.
+
+    Rules are those of ``GameEngine``, resolved for the whole batch per phase instead of per match.
+    Every match draws from its own ``random.Random`` in the same order ``GameEngine`` draws from
+    its ``rng``, so a batch seeded like a set of engines plays the same games; ``get_state(i)``
+    returns the ``GameState`` the engine would hold. The only per-match Python work left is the
+    RNG draws for artifact spawns and collisions.
+
+    Entities are addressed by slot (WIZARD1, WIZARD2, MINION1, MINION2) rather than by name, so the
+    two wizards of a match must have different names. Only the core spells of ``game.rules.Spell``
+    are supported, not ones added with ``game.spells.register_spell``. Matches with a winner are
+    frozen; ``step`` only advances the ones still running. Nothing is logged.
+    """
+
+    def __init__(self, names, rngs=None):
+        """``names`` holds one ``(wizard1 name, wizard2 name)`` pair per match."""
+        n = len(names)
+        self.names = [tuple(pair) for pair in names]
+        if any(a == b for a, b in self.names):
+            raise ValueError("Wizards in a match must have different names")
+        self.rngs = list(rngs) if rngs is not None else [random.Random() for _ in range(n)]
+        if len(self.rngs) != n:
+            raise ValueError("Need one RNG per match")
+
+        self.turn = np.zeros(n, dtype=np.int64)
+        self.hp = np.zeros((n, 4), dtype=np.int64)  # per entity slot
+        self.position = np.zeros((n, 4, 2), dtype=np.int64)  # per entity slot
+        self.mana = np.full((n, 2), MAX_MANA, dtype=np.int64)
+        self.cooldowns = np.zeros((n, 2, len(Spell)), dtype=np.int64)
+        self.shield = np.zeros((n, 2), dtype=bool)
+        self.minion_present = np.zeros((n, 2), dtype=bool)
+        self.minion_ready = np.zeros((n, 2), dtype=bool)
+        self.minion_order = np.zeros((n, 2), dtype=np.int64)
+        self.minion_number = np.zeros((n, 2), dtype=np.int64)  # id is f"{owner}-{number}"
+        self.next_minion_order = np.full(n, FIRST_MINION_ORDER, dtype=np.int64)
+        self.minion_counter = np.zeros(n, dtype=np.int64)
+        self.artifact_type = np.full((n, BOARD_SIZE * BOARD_SIZE), -1, dtype=np.int64)  # index into ARTIFACT_TYPES
+        self.artifact_turn = np.zeros((n, BOARD_SIZE * BOARD_SIZE), dtype=np.int64)
+        self.winner = np.full(n, NO_WINNER, dtype=np.int64)  # WIZARD1, WIZARD2, DRAW or NO_WINNER
+
+        self.hp[:, :2] = MAX_HP
+        self.position[:, WIZARD2] = BOARD_SIZE - 1
+        self._rows = np.arange(n)
+
+    def __len__(self):
+        return len(self.names)
+
+    @classmethod
+    def from_states(cls, states, rngs=None):
+        """Build a batch positioned at the given GameStates, one per match."""
+        batch = cls([(s.wizard1.name, s.wizard2.name) for s in states], rngs)
+        for i, state in enumerate(states):
+            batch.set_state(i, state)
+        return batch
+
+    @property
+    def done(self):
+        return self.winner != NO_WINNER
+
+    # State conversion
+
+    def set_state(self, i, state):
+        names = self.names[i] = (state.wizard1.name, state.wizard2.name)
+        self.turn[i] = state.turn
+        for slot, wizard in enumerate((state.wizard1, state.wizard2)):
+            self.hp[i, slot] = wizard.hp
+            self.position[i, slot] = wizard.position
+            self.mana[i, slot] = wizard.mana
+            self.cooldowns[i, slot] = wizard.cooldowns
+            self.shield[i, slot] = wizard.shield_active
+        self.minion_present[i] = False
+        for minion in state.minions:
+            owner = names.index(minion.owner)
+            self.hp[i, MINION1 + owner] = minion.hp
+            self.position[i, MINION1 + owner] = minion.position
+            self.minion_present[i, owner] = True
+            self.minion_ready[i, owner] = minion.is_ready
+            self.minion_order[i, owner] = minion.order
+            self.minion_number[i, owner] = int(minion.id.rsplit("-", 1)[1])
+        self.next_minion_order[i] = state.next_minion_order
+        self.minion_counter[i] = state.minion_counter
+        self.artifact_type[i] = -1
+        for artifact in state.artifacts:
+            cell = artifact.position[0] * BOARD_SIZE + artifact.position[1]
+            self.artifact_type[i, cell] = ARTIFACT_TYPES.index(artifact.type)
+            self.artifact_turn[i, cell] = artifact.spawn_turn
+        self.winner[i] = NO_WINNER
+
+    def get_state(self, i):
+        """Return match ``i`` as the GameState ``GameEngine.get_state()`` would give."""
+        names = self.names[i]
+        wizards = tuple(
+            WizardState(
+                names[slot],
+                int(self.hp[i, slot]),
+                int(self.mana[i, slot]),
+                tuple(int(v) for v in self.position[i, slot]),
+                tuple(int(v) for v in self.cooldowns[i, slot]),
+                bool(self.shield[i, slot]),
+            )
+            for slot in (WIZARD1, WIZARD2)
+        )
+        return GameState(
+            int(self.turn[i]),
+            wizards[0],
+            wizards[1],
+            tuple(self._minion_state(i, owner) for owner in self._minion_owners(i)),
+            tuple(
+                ArtifactState(
+                    ARTIFACT_TYPES[self.artifact_type[i, cell]],
+                    divmod(int(cell), BOARD_SIZE),
+                    int(self.artifact_turn[i, cell]),
+                )
+                for cell in sorted(np.flatnonzero(self.artifact_type[i] >= 0), key=lambda c: self.artifact_turn[i, c])
+            ),
+            int(self.next_minion_order[i]),
+            int(self.minion_counter[i]),
+        )
+
+    def _minion_owners(self, i):
+        """Owners of match ``i``'s minions in creation order."""
+        return sorted((o for o in (0, 1) if self.minion_present[i, o]), key=lambda o: self.minion_order[i, o])
+
+    def _minion_state(self, i, owner):
+        name = self.names[i][owner]
+        return MinionState(
+            f"{name}-{self.minion_number[i, owner]}",
+            name,
+            int(self.hp[i, MINION1 + owner]),
+            tuple(int(v) for v in self.position[i, MINION1 + owner]),
+            bool(self.minion_ready[i, owner]),
+            int(self.minion_order[i, owner]),
+        )
+
+    def build_input(self, i, player):
+        """Return the bot-facing state dict for ``player`` (0 or 1) in match ``i``, as GameEngine builds it."""
+        state = self.get_state(i)
+        wizards = (state.wizard1, state.wizard2)
+        return {
+            "turn": state.turn,
+            "board_size": BOARD_SIZE,
+            "self": _wizard_dict(wizards[player]),
+            "opponent": _wizard_dict(wizards[1 - player]),
+            "artifacts": [
+                {"type": a.type, "position": list(a.position), "spawn_turn": a.spawn_turn} for a in state.artifacts
+            ],
+            "minions": [
+                {"id": m.id, "owner": m.owner, "hp": m.hp, "position": list(m.position)}
+                for m in state.minions if m.hp > 0
+            ],
+        }
+
+    # Turn resolution
+
+    def step(self, actions):
+        """Play one turn of every running match and return the ``winner`` array.
+
+        ``actions`` is a BatchActions or a list of ``(action1, action2)`` dicts, one per match;
+        entries for finished matches are ignored.
+        """
+        if not isinstance(actions, BatchActions):
+            actions = encode_actions(actions)
+        active = ~self.done
+        self.turn[active] += 1
+        self._spawn_artifacts(active & (self.turn % ARTIFACT_SPAWN_RATE == 0))
+
+        collided = self._move_wizards(active, actions)
+        for slot in (WIZARD1, WIZARD2):
+            self._pick_up(active, slot)
+
+        casting = active & ~collided
+        for slot in (WIZARD1, WIZARD2):
+            self._cast(casting, slot, actions.spells[:, slot], actions.targets[:, slot])
+            self._remove_dead_minions()
+
+        self._move_minions(active)
+
+        self.mana[active] = np.minimum(MAX_MANA, self.mana[active] + MANA_REGEN)
+        self.cooldowns[active] = np.maximum(self.cooldowns[active] - 1, 0)
+
+        dead1 = active & (self.hp[:, WIZARD1] <= 0)
+        dead2 = active & (self.hp[:, WIZARD2] <= 0)
+        self.winner[dead1 & dead2] = DRAW
+        self.winner[dead1 & ~dead2] = WIZARD2
+        self.winner[dead2 & ~dead1] = WIZARD1
+        return self.winner
+
+    def _spawn_artifacts(self, mask):
+        if not mask.any():
+            return
+        occupied = self.artifact_type >= 0
+        rows = self._rows
+        for slot in (WIZARD1, WIZARD2, MINION1, MINION2):
+            cells = self.position[:, slot, 0] * BOARD_SIZE + self.position[:, slot, 1]
+            live = np.ones(len(rows), dtype=bool) if slot < MINION1 else self._minion_alive(slot - MINION1)
+            occupied[rows[live], cells[live]] = True
+        mask = mask & (occupied.sum(1) <= MAX_OCCUPIED_FOR_SPAWN)
+        spawning = np.flatnonzero(mask)
+        if not len(spawning):
+            return
+        free = ~occupied[spawning]
+        free_count = free.sum(1)
+        picks = np.empty((len(spawning), 2), dtype=np.int64)
+        for k, i in enumerate(spawning):
+            # Same draws as ArtifactManager.spawn_random: a free tile, then a type
+            rng = self.rngs[i]
+            picks[k] = rng.choice(range(free_count[k])), ARTIFACT_TYPES.index(rng.choice(ARTIFACT_TYPES))
+        cells = (free.cumsum(1) > picks[:, :1]).argmax(1)
+        self.artifact_type[spawning, cells] = picks[:, 1]
+        self.artifact_turn[spawning, cells] = self.turn[spawning]
+
+    def _move_wizards(self, active, actions):
+        wizards = self.position[:, :2]
+        target = wizards + actions.moves
+        moving = active[:, None] & actions.has_move & _on_board(target)
+        collided = moving.all(1) & (target[:, 0] == target[:, 1]).all(-1)
+        moving &= ~collided[:, None]
+        self.position[:, :2] = np.where(moving[..., None], target, wizards)
+        for i in np.flatnonzero(collided):
+            self._collide(i, WIZARD1, WIZARD2, target[i, 0])
+        return collided
+
+    def _pick_up(self, mask, slot):
+        rows = self._rows
+        cells = self.position[:, slot, 0] * BOARD_SIZE + self.position[:, slot, 1]
+        kind = np.where(mask, self.artifact_type[rows, cells], -1)
+        health = kind == ARTIFACT_TYPES.index("health")
+        mana = kind == ARTIFACT_TYPES.index("mana")
+        cooldown = kind == ARTIFACT_TYPES.index("cooldown")
+        self.hp[health, slot] = np.minimum(MAX_HP, self.hp[health, slot] + HEALTH_ARTIFACT_HP)
+        self.mana[mana, slot] = np.minimum(MAX_MANA, self.mana[mana, slot] + MANA_ARTIFACT_MANA)
+        self.cooldowns[cooldown, slot] = np.maximum(self.cooldowns[cooldown, slot] - 1, 0)
+        picked = kind >= 0
+        self.artifact_type[rows[picked], cells[picked]] = -1
+
+    def _cast(self, mask, slot, spells, targets):
+        rows = self._rows
+        spell = np.where(mask, spells, NO_SPELL)
+        known = spell >= 0
+        spell_index = np.where(known, spell, 0)
+        caster = self.position[:, slot]
+
+        cast = known & (self.mana[:, slot] >= _COSTS[spell_index]) & (self.cooldowns[rows, slot, spell_index] == 0)
+        cast &= (spell != Spell.MELEE_ATTACK) | (_manhattan(caster, targets) == 1)
+        self.mana[cast, slot] -= _COSTS[spell_index[cast]]
+        self.cooldowns[rows[cast], slot, spell_index[cast]] = _COOLDOWNS[spell_index[cast]]
+
+        fireball = cast & (spell == Spell.FIREBALL) & (_chebyshev(caster, targets) <= SPELLS["fireball"]["range"])
+        hit = self._entity_at(targets)
+        direct = fireball & (hit != NO_ENTITY)
+        self._damage(direct, hit, SPELLS["fireball"]["damage"], shield_breaks=True)
+        splash = fireball & (hit == NO_ENTITY)
+        if splash.any():
+            for offset in _NEIGHBOURS:
+                tile = targets + offset
+                entity = self._entity_at(tile)
+                enemy = (entity != NO_ENTITY) & (entity != slot) & (entity != MINION1 + slot)
+                self._damage(splash & _on_board(tile) & enemy, entity, FIREBALL_SPLASH_DAMAGE, shield_breaks=False)
+
+        melee = cast & (spell == Spell.MELEE_ATTACK)
+        hit = self._entity_at(targets)
+        self._damage(melee & (hit != NO_ENTITY), hit, SPELLS["melee_attack"]["damage"], shield=False)
+
+        self.shield[cast & (spell == Spell.SHIELD), slot] = True
+        heal = cast & (spell == Spell.HEAL)
+        self.hp[heal, slot] = np.minimum(self.hp[heal, slot] + SPELLS["heal"]["heal"], MAX_HP)
+
+        jump = cast & _on_board(targets) & (
+            (spell == Spell.TELEPORT)
+            | ((spell == Spell.BLINK) & (_chebyshev(caster, targets) <= SPELLS["blink"]["distance"]))
+        )
+        if jump.any():
+            self.position[jump, slot] = targets[jump]
+            self._pick_up(jump, slot)
+
+        summon = cast & (spell == Spell.SUMMON) & ~self._minion_alive(slot)
+        if summon.any():
+            self._summon(summon, slot)
+
+    def _summon(self, mask, slot):
+        # First free tile around the caster in DIRECTIONS order
+        tiles = self.position[:, slot, None, :] + _DIRECTIONS
+        free = np.stack(
+            [_on_board(tiles[:, d]) & (self._entity_at(tiles[:, d]) == NO_ENTITY) for d in range(len(DIRECTIONS))],
+            axis=1,
+        )
+        mask = mask & free.any(1)
+        first = free.argmax(1)
+        minion = MINION1 + slot
+        self.position[mask, minion] = tiles[mask, first[mask]]
+        self.hp[mask, minion] = MINION_HP
+        self.minion_present[mask, slot] = True
+        self.minion_ready[mask, slot] = False
+        self.minion_order[mask, slot] = self.next_minion_order[mask]
+        self.next_minion_order[mask] += 1
+        self.minion_counter[mask] += 1
+        self.minion_number[mask, slot] = self.minion_counter[mask]
+
+    def _move_minions(self, active):
+        rows = self._rows
+        alive = self.minion_alive
+        # Minions act in creation order; the second pass handles matches with two minions.
+        order = np.where(alive, self.minion_order, _UNORDERED)
+        first = order.argmin(1)
+        passes = [
+            (first, active & alive.any(1)),
+            (1 - first, active & alive.all(1)),
+        ]
+        moved_to = np.full((len(rows), 2), -1, dtype=np.int64)  # tile a minion stepped onto this phase
+        for owner, mask in passes:
+            minion = MINION1 + owner
+            mask = mask & (self.hp[rows, minion] > 0) & self.minion_present[rows, owner]
+            waking = mask & ~self.minion_ready[rows, owner]
+            self.minion_ready[rows[waking], owner[waking]] = True
+            mask &= ~waking
+            if not mask.any():
+                continue
+
+            # Closest of the enemy wizard and the enemy minion; ties go to the wizard
+            enemy = 1 - owner
+            enemy_minion = MINION1 + enemy
+            position = self.position[rows, minion]
+            to_wizard = _manhattan(position, self.position[rows, enemy])
+            to_minion = _manhattan(position, self.position[rows, enemy_minion])
+            enemy_minion_alive = self.minion_present[rows, enemy] & (self.hp[rows, enemy_minion] > 0)
+            target = np.where(enemy_minion_alive & (to_minion < to_wizard), enemy_minion, enemy)
+
+            walking = mask & (_manhattan(position, self.position[rows, target]) > 1)
+            step = position + np.sign(self.position[rows, target] - position)
+            bumps_minion = walking & (moved_to == step).all(-1)
+            bumps_wizard1 = walking & ~bumps_minion & (step == self.position[:, WIZARD1]).all(-1)
+            bumps_wizard2 = walking & ~bumps_minion & ~bumps_wizard1 & (step == self.position[:, WIZARD2]).all(-1)
+            free = walking & ~(bumps_minion | bumps_wizard1 | bumps_wizard2)
+            self.position[rows[free], minion[free]] = step[free]
+            moved_to[free] = step[free]
+            for bumped, other in ((bumps_minion, MINION1 + enemy), (bumps_wizard1, WIZARD1), (bumps_wizard2, WIZARD2)):
+                other = np.broadcast_to(other, rows.shape)
+                for i in np.flatnonzero(bumped):
+                    self._collide(i, minion[i], other[i], step[i])
+
+            # Even a minion that just died in a collision still strikes an adjacent target
+            attack = mask & (_manhattan(self.position[rows, minion], self.position[rows, target]) <= 1)
+            self.hp[rows[attack], target[attack]] -= MINION_DAMAGE
+
+        self._remove_dead_minions()
+
+    def _collide(self, i, first, second, position):
+        """Melee collision of two entities of match ``i`` on ``position``, drawing from its RNG."""
+        rng = self.rngs[i]
+        damage = [rng.randint(0, MELEE_DAMAGE), rng.randint(0, MELEE_DAMAGE)]
+        for k, entity in enumerate((first, second)):
+            if entity < MINION1 and self.shield[i, entity]:
+                damage[k] = max(0, damage[k] - _SHIELD_BLOCK)
+                self.shield[i, entity] = False
+        self.hp[i, first] -= damage[0]
+        self.hp[i, second] -= damage[1]
+
+        directions = list(_SCATTER_DIRECTIONS)
+        rng.shuffle(directions)
+        x, y = int(position[0]), int(position[1])
+        tiles = [(x + dx, y + dy) for dx, dy in directions if 0 <= x + dx < BOARD_SIZE and 0 <= y + dy < BOARD_SIZE]
+        if len(tiles) >= 2:
+            self.position[i, first] = tiles[0]
+            self.position[i, second] = tiles[1]
+        else:
+            self.position[i, first] = position
+            self.position[i, second] = position
+        self.minion_present[i] &= self.hp[i, MINION1:] > 0
+
+    def _damage(self, mask, entity, amount, shield=True, shield_breaks=False):
+        """Deal ``amount`` to ``entity`` in the masked matches; a wizard's shield blocks up to its strength."""
+        rows = self._rows[mask]
+        entity = entity[mask]
+        damage = np.full(len(rows), amount, dtype=np.int64)
+        if shield:
+            wizard = entity < MINION1
+            shielded = np.zeros(len(rows), dtype=bool)
+            shielded[wizard] = self.shield[rows[wizard], entity[wizard]]
+            damage[shielded] = max(0, amount - _SHIELD_BLOCK)
+            if shield_breaks:
+                self.shield[rows[shielded], entity[shielded]] = False
+        self.hp[rows, entity] -= damage
+
+    def _entity_at(self, pos):
+        """Slot of the entity the engine finds first on each match's tile ``pos``, or NO_ENTITY."""
+        cells = self.position[..., 0] * BOARD_SIZE + self.position[..., 1]
+        cell = np.where(_on_board(pos), pos[:, 0] * BOARD_SIZE + pos[:, 1], -1)
+        on_tile = cells == cell[:, None]
+        on_tile[:, MINION1:] &= self.minion_alive
+        rank = np.where(on_tile[:, MINION1:], self.minion_order, _UNORDERED)
+        first_minion = MINION1 + rank.argmin(1)
+        return np.select(
+            [on_tile[:, WIZARD1], on_tile[:, WIZARD2], on_tile[:, MINION1:].any(1)],
+            [WIZARD1, WIZARD2, first_minion],
+            NO_ENTITY,
+        )
+
+    @property
+    def minion_alive(self):
+        return self.minion_present & (self.hp[:, MINION1:] > 0)
+
+    def _minion_alive(self, owner):
+        return self.minion_present[:, owner] & (self.hp[:, MINION1 + owner] > 0)
+
+    def _remove_dead_minions(self):
+        self.minion_present &= self.hp[:, MINION1:] > 0
+
+
+def _wizard_dict(wizard):
+    return {
+        "name": wizard.name,
+        "hp": wizard.hp,
+        "mana": wizard.mana,
+        "position": list(wizard.position),
+        "cooldowns": dict(zip(SPELL_NAMES, wizard.cooldowns)),
+        "shield_active": wizard.shield_active,
+    }
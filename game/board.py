@@ -0,0 +1,218 @@
+from game.rules import BOARD_SIZE, DIRECTIONS, SPELLS
+
+# Lookup order for entities sharing a tile: wizard1, wizard2, then minions by creation order.
+WIZARD1_ORDER = 0
+WIZARD2_ORDER = 1
+FIRST_MINION_ORDER = 2
+
+# Bitboards: the board packed into a Python int, one bit per tile. Tile (x, y) is bit
+# ``x * BOARD_SIZE + y``, so walking the set bits from low to high visits tiles in the same
+# order as ``DIRECTIONS`` and the row-by-row scans the engine uses.
+SQUARES = BOARD_SIZE * BOARD_SIZE
+FULL_BOARD = (1 << SQUARES) - 1
+
+
+def on_board(pos):
+    return 0 <= pos[0] < BOARD_SIZE and 0 <= pos[1] < BOARD_SIZE
+
+
+def square(pos):
+    """Bit index of an on-board position."""
+    return pos[0] * BOARD_SIZE + pos[1]
+
+
+def bit(pos):
+    """Single-bit mask for a position, 0 if it is off the board."""
+    return 1 << (pos[0] * BOARD_SIZE + pos[1]) if on_board(pos) else 0
+
+
+def to_mask(positions):
+    mask = 0
+    for pos in positions:
+        mask |= bit(pos)
+    return mask
+
+
+def squares(mask):
+    """Yield the bit indices set in ``mask`` from low to high."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def positions(mask):
+    """Return the tiles set in ``mask`` as ``[x, y]`` lists, in bit order."""
+    return [list(divmod(sq, BOARD_SIZE)) for sq in squares(mask)]
+
+
+def popcount(mask):
+    return bin(mask).count("1")
+
+
+def lowest(mask):
+    """Bit index of the lowest set bit, or None for an empty mask."""
+    return (mask & -mask).bit_length() - 1 if mask else None
+
+
+def nth(mask, n):
+    """Bit index of the ``n``-th (0-based) set bit counting from the low end."""
+    offset = 0
+    # Skip whole bytes by their popcount, then walk the bits of the chunk holding the answer
+    while mask:
+        chunk = mask & 0xFF
+        count = _CHUNK_POPCOUNT[chunk]
+        if n < count:
+            for sq in squares(chunk):
+                if n == 0:
+                    return offset + sq
+                n -= 1
+        n -= count
+        mask >>= 8
+        offset += 8
+    raise IndexError("bitboard has fewer set bits")
+
+
+_CHUNK_POPCOUNT = bytes(popcount(chunk) for chunk in range(256))
+
+
+def _offsets_mask(x, y, offsets):
+    return to_mask((x + dx, y + dy) for dx, dy in offsets)
+
+
+def _within_table(radius):
+    return tuple(
+        _offsets_mask(x, y, [(dx, dy) for dx in range(-radius, radius + 1) for dy in range(-radius, radius + 1)])
+        for x in range(BOARD_SIZE) for y in range(BOARD_SIZE)
+    )
+
+
+# WITHIN[r][sq]: tiles at Chebyshev distance <= r from sq; RINGS[r][sq]: tiles at exactly r.
+WITHIN = tuple(_within_table(r) for r in range(BOARD_SIZE))
+RINGS = (WITHIN[0],) + tuple(
+    tuple(outer & ~inner for outer, inner in zip(WITHIN[r], WITHIN[r - 1])) for r in range(1, BOARD_SIZE)
+)
+NEIGHBOURHOOD = tuple(  # the tile and its eight neighbours, as scanned with DIRECTIONS
+    _offsets_mask(x, y, DIRECTIONS) for x in range(BOARD_SIZE) for y in range(BOARD_SIZE)
+)
+ADJACENT = RINGS[1]
+SPLASH = ADJACENT  # tiles hit by fireball splash around a target
+FIREBALL_RANGE = WITHIN[SPELLS["fireball"]["range"]]
+BLINK_RANGE = WITHIN[SPELLS["blink"]["distance"]]
+
+
+def within(pos, radius):
+    """Mask of on-board tiles within Chebyshev ``radius`` of ``pos`` (which may be off the board)."""
+    if on_board(pos) and 0 <= radius < BOARD_SIZE:
+        return WITHIN[radius][square(pos)]
+    x, y = pos
+    return _offsets_mask(x, y, [(dx, dy) for dx in range(-radius, radius + 1) for dy in range(-radius, radius + 1)])
+
+
+def ring(pos, radius):
+    """Mask of on-board tiles at exactly Chebyshev ``radius`` from ``pos``."""
+    if radius == 0:
+        return bit(pos)
+    return within(pos, radius) & ~within(pos, radius - 1)
+
+
+def splash(pos):
+    """Mask of on-board tiles around ``pos`` that fireball splash reaches (``pos`` may be off the board)."""
+    return SPLASH[square(pos)] if on_board(pos) else ring(pos, 1)
+
+
+class OccupancyGrid:
+    """Position -> entity index kept in sync by the engine on every move, spawn and death.
+
+    Several entities may share a tile (a wizard can step onto a minion, collisions briefly stack
+    both entities), so each cell holds a short list ordered the same way the old linear scans
+    visited entities. Dead minions are skipped on lookup until the engine removes them.
+    """
+
+    def __init__(self, size=BOARD_SIZE):
+        self.size = size
+        self._cells = [[] for _ in range(size * size)]
+        self._index = {}  # id(entity) -> (cell index, order)
+        self.occupied = 0  # bitboard of tiles holding at least one entity, dead minions included
+
+    def _cell_index(self, pos):
+        x, y = pos[0], pos[1]
+        if 0 <= x < self.size and 0 <= y < self.size:
+            return x * self.size + y
+        return None
+
+    def add(self, entity, pos, order):
+        cell_index = self._cell_index(pos)
+        self._index[id(entity)] = (cell_index, order)
+        if cell_index is None:
+            return
+        cell = self._cells[cell_index]
+        self.occupied |= 1 << cell_index
+        i = len(cell)
+        while i > 0 and cell[i - 1][0] > order:
+            i -= 1
+        cell.insert(i, (order, entity))
+
+    def remove(self, entity):
+        cell_index, order = self._index.pop(id(entity))
+        if cell_index is not None:
+            cell = self._cells[cell_index]
+            cell.remove((order, entity))
+            if not cell:
+                self.occupied &= ~(1 << cell_index)
+        return order
+
+    def move(self, entity, pos):
+        cell_index, order = self._index[id(entity)]
+        if cell_index == self._cell_index(pos):
+            return
+        self.remove(entity)
+        self.add(entity, pos, order)
+
+    def order(self, entity):
+        return self._index[id(entity)][1]
+
+    def copy(self, entities):
+        """Return a copy of the grid with entities swapped via ``entities`` (id(old) -> new)."""
+        grid = OccupancyGrid.__new__(OccupancyGrid)
+        grid.size = self.size
+        grid._cells = [[(order, entities[id(e)]) for order, e in cell] if cell else [] for cell in self._cells]
+        grid._index = {id(entities[key]): slot for key, slot in self._index.items()}
+        grid.occupied = self.occupied
+        return grid
+
+    def at(self, pos):
+        """Return the first live entity on the tile, or None."""
+        cell_index = self._cell_index(pos)
+        if cell_index is None:
+            return None
+        return self.at_square(cell_index)
+
+    def at_square(self, cell_index):
+        for order, entity in self._cells[cell_index]:
+            if order < FIRST_MINION_ORDER or entity.hp > 0:
+                return entity
+        return None
+
+    def first_free(self, mask):
+        """Bit index of the lowest tile in ``mask`` without a live entity, or None."""
+        free = mask & ~self.occupied
+        taken = mask & self.occupied
+        first = lowest(free)
+        # A tile holding only dead minions (not yet removed) counts as free
+        for cell_index in squares(taken):
+            if first is not None and cell_index > first:
+                break
+            if self.at_square(cell_index) is None:
+                return cell_index
+        return first
+
+    def at_except(self, pos, exceptions):
+        """Return the first live entity on the tile that is not in ``exceptions``, or None."""
+        cell_index = self._cell_index(pos)
+        if cell_index is None:
+            return None
+        for order, entity in self._cells[cell_index]:
+            if (order < FIRST_MINION_ORDER or entity.hp > 0) and not any(entity is e for e in exceptions):
+                return entity
+        return None
@@ -0,0 +1,314 @@
+import contextlib
+import multiprocessing
+import os
+import queue
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import Counter
+
+from game.actions import IDLE
+from game.shared_state import SharedStateBuffer
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+WORKER_THREAD = "thread"
+WORKER_PROCESS = "process"
+WORKER_KINDS = (WORKER_THREAD, WORKER_PROCESS)
+
+# Requests sent to a worker process: (message, payload), or None to stop
+MSG_DECIDE = 0  # payload: the state, or None when it was written to the shared state buffer
+MSG_GAME_OVER = 1  # payload: whether the bot won
+
+
+class DecisionRunner:
+    """Calls ``bot.decide`` for the engine, optionally under a time budget, in parallel or in
+    separate processes.
+
+    By default decide is called inline, exactly as the engine always did. With a ``timeout``
+    (wall-clock seconds) and/or ``cpu_timeout`` (CPU seconds used by the call) each bot gets a
+    worker. A decision that is not back within ``timeout``, or that used more than ``cpu_timeout``,
+    is replaced by ``default_action`` and counted in ``overruns`` (bot name -> count). A bot still
+    stuck in an earlier call forfeits its turns, also counted, until that call returns; late
+    answers are thrown away. Exceptions raised by decide propagate as they do without a runner.
+
+    ``parallel=True`` lets both bots of a turn decide at the same time (``decide_all``); actions
+    are still returned in bot order. ``workers`` picks what runs decide: daemon threads (good for
+    bots that release the GIL, such as torch inference or network calls) or persistent worker
+    processes (pure-Python bots; they also get their own ``random`` state, seeded from this
+    process's ``random`` when the worker starts, so concurrent bots never interleave draws and a
+    seeded run stays reproducible; ``memory_limit_mb`` caps the address space a bot may map on top
+    of what its worker starts with). A process worker starts with a copy of the bot and keeps it
+    for the runner's lifetime, so the bot object in this process does not see what the worker's
+    copy learns; call ``game_over`` rather than ``bot.game_over`` so the copy gets the result.
+    States reach worker processes through a ``SharedStateBuffer``; only the action comes back over
+    the pipe. A worker process that dies (crash, memory limit) costs its bot the turn, counted in
+    ``crashes``, and is restarted from the original bot on the next call.
+
+    One runner can serve many matches, and its workers with it (pass it to ``GameEngine`` or
+    ``run_match``); call ``close`` when done to stop the workers.
+    """
+
+    def __init__(
+        self, timeout=None, cpu_timeout=None, default_action=IDLE, parallel=False, workers=WORKER_THREAD,
+        memory_limit_mb=None,
+    ):
+        if workers not in WORKER_KINDS:
+            raise ValueError(f"Unknown worker kind: {workers}")
+        self.timeout = timeout
+        self.cpu_timeout = cpu_timeout
+        self.default_action = default_action
+        self.parallel = parallel
+        self.workers = workers
+        self.memory_limit_mb = memory_limit_mb
+        self.overruns = Counter()
+        self.crashes = Counter()
+        self._workers = {}  # id(bot) -> _Worker
+
+    @property
+    def limited(self):
+        return self.timeout is not None or self.cpu_timeout is not None
+
+    @property
+    def inline(self):
+        """True when decide is called directly on the caller's thread."""
+        return not (self.limited or self.parallel or self.workers == WORKER_PROCESS)
+
+    def decide(self, bot, state):
+        if self.inline:
+            return bot.decide(state)
+        call = self._submit(bot, state)
+        return self._result(bot, call, self._deadline())
+
+    def decide_all(self, bots, states):
+        """Return the decisions of ``bots`` for ``states``, in bot order."""
+        if not self.parallel:
+            return [self.decide(bot, state) for bot, state in zip(bots, states)]
+        calls = [self._submit(bot, state) for bot, state in zip(bots, states)]
+        deadline = self._deadline()
+        return [self._result(bot, call, deadline) for bot, call in zip(bots, calls)]
+
+    def _deadline(self):
+        return None if self.timeout is None else time.monotonic() + self.timeout
+
+    def _submit(self, bot, state):
+        """Hand ``state`` to the bot's worker; None if the worker is still busy with an earlier call."""
+        worker = self._workers.get(id(bot))
+        if worker is None or worker.bot is not bot:
+            if worker is not None:
+                worker.close()
+            if self.workers == WORKER_PROCESS:
+                worker = _ProcessWorker(bot, self.memory_limit_mb)
+            else:
+                worker = _ThreadWorker(bot)
+            self._workers[id(bot)] = worker
+        if worker.busy:
+            return None
+        return worker.submit(state)
+
+    def _result(self, bot, call, deadline):
+        if call is None:
+            return self._overrun(bot)
+        wait = None if deadline is None else max(0.0, deadline - time.monotonic())
+        if not call.done.wait(wait):
+            return self._overrun(bot)
+        if isinstance(call.error, WorkerExited):
+            self.crashes[bot.name] += 1
+            self._workers.pop(id(bot)).close()
+            return self.default_action
+        if call.error is not None:
+            raise call.error
+        if self.cpu_timeout is not None and call.cpu_time > self.cpu_timeout:
+            return self._overrun(bot)
+        return call.action
+
+    def _overrun(self, bot):
+        self.overruns[bot.name] += 1
+        return self.default_action
+
+    def game_over(self, bot, won):
+        """Call the bot's optional ``game_over(won)`` hook, in its worker process if it has one."""
+        if not hasattr(bot, "game_over"):
+            return
+        worker = self._workers.get(id(bot))
+        if isinstance(worker, _ProcessWorker) and worker.bot is bot:
+            if worker.busy:  # still stuck in decide; it misses this result
+                return
+            call = worker.submit(won, MSG_GAME_OVER)
+            call.done.wait()
+            if call.error is not None and not isinstance(call.error, WorkerExited):
+                raise call.error
+        else:
+            bot.game_over(won)
+
+    def close(self):
+        """Stop the workers. A thread stuck in decide exits once the call returns; a process is killed."""
+        for worker in self._workers.values():
+            worker.close()
+        self._workers.clear()
+
+
+class WorkerExited(RuntimeError):
+    """A decision worker process died before answering."""
+
+
+class _Call:
+    __slots__ = ("action", "cpu_time", "done", "error", "message", "state")
+
+    def __init__(self, state, message=MSG_DECIDE):
+        self.state = state
+        self.message = message
+        self.action = None
+        self.error = None
+        self.cpu_time = 0.0
+        self.done = threading.Event()
+
+
+class _Worker(ABC):
+    """Runs one bot's decide calls, one at a time, from a daemon thread."""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.call = None
+        self._requests = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name=f"decide-{bot.name}", daemon=True)
+        self._thread.start()
+
+    @property
+    def busy(self):
+        return self.call is not None and not self.call.done.is_set()
+
+    def submit(self, state, message=MSG_DECIDE):
+        self.call = _Call(state, message)
+        self._requests.put(self.call)
+        return self.call
+
+    def close(self):
+        busy = self.busy
+        self._requests.put(None)
+        if not busy:
+            self._thread.join()
+
+    def _run(self):
+        while True:
+            call = self._requests.get()
+            if call is None:
+                self._stop()
+                return
+            try:
+                self._execute(call)
+            except BaseException as e:
+                call.error = e
+            call.done.set()
+
+    @abstractmethod
+    def _execute(self, call):
+        """Run ``call`` on this worker's thread, setting its action or error."""
+        pass
+
+    def _stop(self):  # noqa: B027 - thread workers have nothing to stop
+        """Release what the worker holds; called on its thread when it is asked to exit."""
+        pass
+
+
+class _ThreadWorker(_Worker):
+    def _execute(self, call):
+        start = time.thread_time()
+        try:
+            call.action = self.bot.decide(call.state)
+        except BaseException as e:
+            call.error = e
+        call.cpu_time = time.thread_time() - start
+
+
+class _ProcessWorker(_Worker):
+    """Keeps the bot in a child process; the thread forwards each call to it.
+
+    States go through a shared state buffer when they fit its layout and over the pipe otherwise.
+    """
+
+    def __init__(self, bot, memory_limit_mb=None):
+        self._buffer = SharedStateBuffer()
+        self._conn, child_conn = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(
+            target=_serve,
+            args=(bot, child_conn, self._buffer.name, memory_limit_mb, random.getrandbits(64)),
+            name=f"decide-{bot.name}",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        super().__init__(bot)
+
+    def close(self):
+        if self.busy:
+            self.process.terminate()
+            self.call.done.wait()
+        super().close()
+
+    def _execute(self, call):
+        payload = call.state
+        if call.message == MSG_DECIDE and self._buffer.write(payload):
+            payload = None
+        try:
+            self._conn.send((call.message, payload))
+            call.action, call.error, call.cpu_time = self._conn.recv()
+        except (EOFError, OSError):
+            self.process.join(1)
+            call.error = WorkerExited(f"Decision worker for {self.bot.name} exited (code {self.process.exitcode})")
+
+    def _stop(self):
+        with contextlib.suppress(OSError):
+            self._conn.send(None)
+        self.process.join(1)
+        if self.process.is_alive():
+            self.process.terminate()
+        self._conn.close()
+        self._buffer.close()
+        self._buffer.unlink()
+
+
+def _address_space():
+    """Bytes of address space this process maps (0 where /proc is not available)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return 0
+
+
+def _serve(bot, conn, buffer_name, memory_limit_mb, seed):
+    """Worker process loop: answer each request on ``conn`` with ``(action, error, cpu_time)``."""
+    random.seed(seed)  # a forked child would otherwise reseed from the OS
+    if memory_limit_mb is not None and resource is not None:
+        # On top of what the interpreter and its imports already map, which is often more than the budget
+        limit = _address_space() + memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    buffer = SharedStateBuffer(buffer_name)
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            break
+        if request is None:
+            break
+        message, payload = request
+        start = time.process_time()
+        action = error = None
+        try:
+            if message == MSG_GAME_OVER:
+                bot.game_over(payload)
+            else:
+                action = bot.decide(buffer.read() if payload is None else payload)
+        except Exception as e:
+            error = e
+        cpu_time = time.process_time() - start
+        try:
+            conn.send((action, error, cpu_time))
+        except Exception as e:  # the action or error did not pickle
+            conn.send((None, RuntimeError(f"{bot.name} returned an unpicklable decision: {e}"), cpu_time))
+    buffer.close()
@@ -1,43 +1,207 @@
+import random
 from typing import Any
-from collections import deque
 
-from game.logger import GameLogger
-from game.rules import BOARD_SIZE, SPELLS, ARTIFACT_SPAWN_RATE, MELEE_DAMAGE, DIRECTIONS, FIREBALL_SPLASH_DAMAGE
+from game.actions import NO_SPELL, parse_action
+from game.logger import GameLogger, NullLogger
+from game.rules import BOARD_SIZE, SPELLS, ARTIFACT_SPAWN_RATE, MELEE_DAMAGE, DIRECTIONS, ENTITY_WIZARD
 from game.wizard import Wizard
 from game.artifacts import ArtifactManager
-from game.minion import Minion
+from game import board, zobrist
+from game.board import FIRST_MINION_ORDER, WIZARD1_ORDER, WIZARD2_ORDER, OccupancyGrid
+from game.minion import MINION_DAMAGE, Minion
+from game.replay import Replay
+from game.spells import SPELL_HANDLERS
+from game.snapshots import SNAPSHOT_ANIMATION, SNAPSHOT_NONE, SNAPSHOT_PER_TURN, SNAPSHOT_POLICIES
+from game.state import GameState
 
 
 
 
 class GameEngine:
-    def __init__(self, bot1, bot2):
+    def __init__(self, bot1, bot2, snapshot_policy=SNAPSHOT_ANIMATION, sinks=None, rng=None, decisions=None,
+                 seed=None):
+        if snapshot_policy not in SNAPSHOT_POLICIES:
+            raise ValueError(f"Unknown snapshot policy: {snapshot_policy}")
+        # Collisions and artifact spawns draw from self.rng. Without an rng each engine gets its own
+        # stream from ``seed``, by default drawn from the global random module so random.seed()
+        # still reproduces a run.
+        if rng is None:
+            if seed is None:
+                seed = random.getrandbits(64)
+            rng = random.Random(seed)
+            self.replay = Replay((bot1.name, bot2.name), seed=seed)
+        else:
+            self.replay = Replay((bot1.name, bot2.name), rng_state=rng.getstate())
+        self.rng = rng
         self.wizard1 = Wizard(bot1.name, [0, 0])
         self.wizard2 = Wizard(bot2.name, [9, 9])
         self.bots = [bot1, bot2]
-        self.artifacts = ArtifactManager()
+        # Optional game.decisions.DecisionRunner: time budget, parallel or out-of-process decide
+        self.decisions = decisions
+        self.artifacts = ArtifactManager(self.rng)
         self.turn = 0
         self.log = []
         self.minions = []
-        self.logger = GameLogger()
+        self.logger = GameLogger(sinks)
+        self.logger.replay = self.replay
+        self.snapshot_policy = snapshot_policy
+        self.grid = OccupancyGrid()
+        self.grid.add(self.wizard1, self.wizard1.position, WIZARD1_ORDER)
+        self.grid.add(self.wizard2, self.wizard2.position, WIZARD2_ORDER)
+        self._next_minion_order = FIRST_MINION_ORDER
+        self._minion_counter = 0
+        self._saved_states = []
+
+    @classmethod
+    def from_state(cls, state, rng=None):
+        """Build a headless engine (no bots, no logging) positioned at ``state``.
+
+        Winners are reported by wizard name. Step it with ``play_turn``.
+        """
+        engine = cls.__new__(cls)
+        engine.rng = rng if rng is not None else random.Random(random.getrandbits(64))
+        engine.bots = [state.wizard1.name, state.wizard2.name]
+        engine.decisions = None
+        engine.replay = None
+        engine.log = []
+        engine.logger = NullLogger()
+        engine.snapshot_policy = SNAPSHOT_NONE
+        engine._saved_states = []
+        engine.set_state(state)
+        return engine
+
+    @property
+    def zobrist(self):
+        """64-bit Zobrist hash of the rules state (see game.zobrist), kept up to date as it changes.
+
+        Equal to ``game.zobrist.hash_state(self.get_state())``.
+        """
+        return zobrist.combine(
+            self.turn, self.wizard1.zobrist, self.wizard2.zobrist, [m.zobrist for m in self.minions],
+            self.artifacts.zobrist,
+        )
+
+    def get_state(self):
+        """Return the rules state as an immutable GameState value."""
+        return GameState(
+            self.turn,
+            self.wizard1.to_state(),
+            self.wizard2.to_state(),
+            tuple(m.to_state(self.grid.order(m)) for m in self.minions),
+            self.artifacts.to_state(),
+            self._next_minion_order,
+            self._minion_counter,
+        )
+
+    def set_state(self, state):
+        """Replace the rules state with ``state``; existing wizard and minion objects are discarded.
+
+        The seed and recorded actions no longer lead to the new state, so recording stops.
+        """
+        self.replay = self.logger.replay = None
+        self.turn = state.turn
+        self.wizard1 = Wizard.from_state(state.wizard1)
+        self.wizard2 = Wizard.from_state(state.wizard2)
+        self.minions = [Minion.from_state(m) for m in state.minions]
+        self.artifacts = ArtifactManager.from_state(state.artifacts, self.rng)
+        self._next_minion_order = state.next_minion_order
+        self._minion_counter = state.minion_counter
+        self.grid = OccupancyGrid()
+        self.grid.add(self.wizard1, self.wizard1.position, WIZARD1_ORDER)
+        self.grid.add(self.wizard2, self.wizard2.position, WIZARD2_ORDER)
+        for minion, minion_state in zip(self.minions, state.minions):
+            self.grid.add(minion, minion.position, minion_state.order)
+
+    def clone(self):
+        """Return an independent copy of the rules state for lookahead.
+
+        The clone shares nothing mutable with this engine, has no bots (winners are reported by
+        wizard name), records nothing and keeps no snapshots. Its RNG continues from a copy of this
+        engine's RNG state, so simulating never advances the real match's stream. Step it with
+        ``play_turn``.
+        """
+        clone = GameEngine.__new__(GameEngine)
+        clone.rng = random.Random()
+        clone.rng.setstate(self.rng.getstate())
+        clone.wizard1 = self.wizard1.copy()
+        clone.wizard2 = self.wizard2.copy()
+        clone.bots = [self.wizard1.name, self.wizard2.name]
+        clone.decisions = None
+        clone.replay = None
+        clone.artifacts = self.artifacts.copy(clone.rng)
+        clone.turn = self.turn
+        clone.log = []
+        clone.minions = [m.copy() for m in self.minions]
+        clone.logger = NullLogger()
+        clone.snapshot_policy = SNAPSHOT_NONE
+        clone.grid = self.grid.copy({
+            id(self.wizard1): clone.wizard1,
+            id(self.wizard2): clone.wizard2,
+            **{id(m): c for m, c in zip(self.minions, clone.minions)},
+        })
+        clone._next_minion_order = self._next_minion_order
+        clone._minion_counter = self._minion_counter
+        clone._saved_states = []
+        return clone
+
+    def push_state(self):
+        """Save the rules and RNG state so simulated turns can be undone with ``pop_state``.
+
+        Anything the logger recorded in between is kept.
+        """
+        turns = None if self.replay is None else self.replay.turns
+        self._saved_states.append((self.get_state(), self.rng.getstate(), turns))
+
+    def pop_state(self):
+        """Restore the state saved by the matching ``push_state``.
+
+        Wizards and minions are replaced by fresh objects, so references taken in between go stale.
+        """
+        state, rng_state, turns = self._saved_states.pop()
+        replay = self.replay
+        self.set_state(state)
+        self.rng.setstate(rng_state)
+        if replay is not None:
+            del replay.actions[turns:]
+            self.replay = self.logger.replay = replay
 
     def run_turn(self):
-        self.log_turn()
+        self.begin_turn()
 
-        collision_occurred = False
+        # Step 2: Get bot actions
+        if self.decisions is None:
+            actions = [
+                self.bots[0].decide(self.build_input(self.wizard1, self.wizard2)),
+                self.bots[1].decide(self.build_input(self.wizard2, self.wizard1))
+            ]
+        else:
+            actions = self.decisions.decide_all(
+                self.bots, [self.build_input(self.wizard1, self.wizard2), self.build_input(self.wizard2, self.wizard1)]
+            )
+
+        return self.resolve_turn(actions)
+
+    def play_turn(self, action1, action2):
+        """Play a full turn with the given actions instead of asking the bots."""
+        self.begin_turn()
+        return self.resolve_turn([action1, action2])
+
+    def begin_turn(self):
+        self.log_turn()
 
         # Step 1: Artifact spawning
         self.spawn_artifacts()
 
-        # Step 2: Get bot actions and validate them
-        actions = self.validate_actions([
-            (self.bots[0].decide(self.build_input(self.wizard1, self.wizard2))),
-            (self.bots[1].decide(self.build_input(self.wizard2, self.wizard1)))
-        ])
+    def resolve_turn(self, actions):
+        collision_occurred = False
+
+        actions = self.validate_actions(actions)
+        if self.replay is not None:
+            self.replay.actions.append((actions[0], actions[1]))
 
         # Step 3: Movement with collision detection
-        wiz1_move = actions[0].get("move")
-        wiz2_move = actions[1].get("move")
+        wiz1_move = actions[0].move
+        wiz2_move = actions[1].move
 
         # Calculate intended positions
         wiz1_next_pos = self.calculate_next_position(self.wizard1, wiz1_move)
@@ -53,10 +217,10 @@ class GameEngine:
         else:
             # No collision, process movements normally
             if wiz1_next_pos:
-                self.wizard1.position = wiz1_next_pos
+                self.set_position(self.wizard1, wiz1_next_pos)
                 self.logger.log(f"{self.wizard1.name} moved to {self.wizard1.position}")
             if wiz2_next_pos:
-                self.wizard2.position = wiz2_next_pos
+                self.set_position(self.wizard2, wiz2_next_pos)
                 self.logger.log(f"{self.wizard2.name} moved to {self.wizard2.position}")
 
         # Step 4: Artifact pickup
@@ -70,10 +234,10 @@ class GameEngine:
 
         # Step 5: Spellcasting (skip if collision occurred)
         if not collision_occurred:
-            self.logger.log_state(self.build_input(self.wizard1, self.wizard2))
-            self.process_spell(self.wizard1, actions[0].get("spell"))
-            self.process_spell(self.wizard2, actions[1].get("spell"))
-            self.logger.log_state(self.build_input(self.wizard1, self.wizard2))
+            self.log_animation_state()
+            self.process_spell(self.wizard1, actions[0])
+            self.process_spell(self.wizard2, actions[1])
+            self.log_animation_state()
 
         # Remaining steps...
         self.process_minions()
@@ -83,7 +247,8 @@ class GameEngine:
             wiz.regen_mana()
             wiz.reduce_cooldowns()
 
-        self.logger.log_state(self.build_input(self.wizard1, self.wizard2))
+        if self.snapshot_policy != SNAPSHOT_NONE:
+            self.logger.log_state(self.build_input(self.wizard1, self.wizard2))
 
         winner = self.check_winner()
 
@@ -93,20 +258,19 @@ class GameEngine:
             else:
                 self.logger.log(f"Game Over: {winner} wins!")
 
-            self.logger.log_state(self.build_input(self.wizard1, self.wizard2))
+            self.log_animation_state()
 
         return winner
 
     def spawn_artifacts(self):
         if self.turn > 0 and self.turn % ARTIFACT_SPAWN_RATE == 0:
-            occupied_positions = [
-                self.wizard1.position,
-                self.wizard2.position
-            ]
+            occupied = board.bit(self.wizard1.position) | board.bit(self.wizard2.position)
             # Add positions of alive minions
-            occupied_positions.extend([m.position for m in self.minions if m.is_alive()])
+            for m in self.minions:
+                if m.is_alive():
+                    occupied |= board.bit(m.position)
 
-            artifact_spawned = self.artifacts.spawn_random(occupied_positions, self.turn)
+            artifact_spawned = self.artifacts.spawn_in(occupied, self.turn)
             
             # Log artifact spawn event if an artifact was spawned
             if artifact_spawned:
@@ -115,10 +279,17 @@ class GameEngine:
                 self.logger.log_event_spawn_artifact(self.turn, spawned_artifact)
 
     def log_turn(self):
-        self.logger.log_state(self.build_input(self.wizard1, self.wizard2))
+        # The start-of-turn state repeats the previous end-of-turn state except before the first turn
+        if self.snapshot_policy == SNAPSHOT_ANIMATION or (self.snapshot_policy == SNAPSHOT_PER_TURN and self.turn == 0):
+            self.logger.log_state(self.build_input(self.wizard1, self.wizard2))
         self.turn += 1
         self.logger.new_turn(self.turn)
 
+    def log_animation_state(self):
+        """Record an intermediate state; only the animation policy keeps these."""
+        if self.snapshot_policy == SNAPSHOT_ANIMATION:
+            self.logger.log_state(self.build_input(self.wizard1, self.wizard2))
+
     def build_input(self, self_wiz, opp_wiz):
         return {
             "turn": self.turn,
@@ -130,22 +301,8 @@ class GameEngine:
         }
 
     def validate_actions(self, actions):
-        for action in actions:
-            # Validate "move"
-            move = action.get("move")
-            if move and isinstance(move, list) and len(move) == 2 and all(isinstance(i, int) for i in move):
-                if -1 <= move[0] <= 1 and -1 <= move[1] <= 1:
-                    continue
-                else:
-                    self.logger.log("Invalid move: Out of bounds.")
-                    move[0] = 0
-                    move[1] = 0
-            elif move:
-                self.logger.log("Invalid move: Must be an array of two integers.")
-                move[0] = 0
-                move[1] = 0
-
-        return actions
+        """Parse each bot's action into an immutable Action (see game.actions); dicts are not modified."""
+        return [parse_action(action, self.logger) for action in actions]
 
     def process_movement(self, wizard, move):
         if not move:
@@ -154,155 +311,45 @@ class GameEngine:
         x, y = wizard.position
         new_x, new_y = x + dx, y + dy
         if 0 <= new_x < BOARD_SIZE and 0 <= new_y < BOARD_SIZE:
-            wizard.position = [new_x, new_y]
+            self.set_position(wizard, [new_x, new_y])
             self.logger.log(f"{wizard.name} moved to {wizard.position}")
 
-        self.logger.log_state(self.build_input(self.wizard1, self.wizard2))
+        self.log_animation_state()
 
-    def process_spell(self, caster, spell_action):
-        if not spell_action:
+    def process_spell(self, caster, action):
+        if action.spell == NO_SPELL:
             return
 
-        spell = spell_action["name"]
-        if not caster.can_cast(spell):
+        handler = SPELL_HANDLERS[action.spell]
+        spell = handler.name
+        if not caster.can_cast_id(action.spell):
             self.logger.log(f"{caster.name} tried to cast {spell} but failed.")
             return
 
-        # Special handling for melee_attack which requires adjacency check
-        if spell == "melee_attack":
-            target_pos = spell_action["target"]
-            # Check if target is adjacent
-            if self.manhattan_dist(caster.position, target_pos) != 1:
-                self.logger.log(f"{caster.name} tried melee attack but target is not adjacent.")
-                return
+        target = action.target
+        if not handler.check(self, caster, target):
+            return
 
-        caster.cast_spell(spell)
+        caster.cast_spell_id(action.spell)
         self.logger.log(f"{caster.name} cast {spell}")
 
-        hit = False
-        if spell == "fireball":
-            target_pos = spell_action["target"]
-            if self.in_range(caster.position, target_pos, SPELLS["fireball"]["range"]):
-                # Check if any entity (wizard or minion) is at target position
-                target_entity = self.get_entity_at_position(target_pos)
-                self.logger.log_event_spell(self.turn, caster.name, "fireball", target_pos)
-                if target_entity:
-                    damage = SPELLS["fireball"]["damage"]
-                    if hasattr(target_entity, "shield_active") and target_entity.shield_active:
-                        damage = max(0, damage - SPELLS["shield"]["block"])
-                        target_entity.shield_active = False
-                        self.logger.log_event_shield_down(self.turn, target_entity.name)
-                    target_entity.hp -= damage
-                    hit = True
-                    entity_name = target_entity.name if hasattr(target_entity,
-                                                                "name") else f"{target_entity.owner}'s minion"
-                    self.logger.log_damage(target_pos, damage, entity_name)
-                    if hasattr(target_entity, "name"):
-                        self.logger.log_event_wizard_damage(self.turn, damage, target_entity.name, target_entity.hp)
-                    else:
-                        self.logger.log_event_minion_damage(self.turn, target_pos, damage, target_entity.id, target_entity.hp)
-                    self.logger.log(f"{entity_name} took {damage} damage (HP: {target_entity.hp})")
-                else:
-                    splash_damage_hit = False
-                    # Apply splash damage to adjacent tiles
-                    for dx, dy in DIRECTIONS:
-                        if dx == 0 and dy == 0:  # Skip the center tile (already processed)
-                            continue
-
-                        splash_pos = [target_pos[0] + dx, target_pos[1] + dy]
-                        if self.is_valid_tile(splash_pos):
-                            splash_entity = self.get_entity_at_position(splash_pos)
-                            if splash_entity and (
-                                    (hasattr(splash_entity, "name") and splash_entity.name != caster.name) or
-                                    (hasattr(splash_entity, "owner") and splash_entity.owner != caster.name)
-                            ):
-                                # Only damage enemy entities
-                                splash_damage_hit = True
-                                print(self.turn, " splash_damage")
-                                splash_damage = FIREBALL_SPLASH_DAMAGE
-                                if hasattr(splash_entity, "shield_active") and splash_entity.shield_active:
-                                    splash_damage = max(0, splash_damage - SPELLS["shield"]["block"])
-
-                                splash_entity.hp -= splash_damage
-                                splash_entity_name = splash_entity.name if hasattr(splash_entity,
-                                                                                   "name") else f"{splash_entity.owner}'s minion"
-                                if (splash_damage > 0):
-                                    self.logger.log_damage(splash_pos, splash_damage, splash_entity_name)
-                                    self.logger.log(
-                                        f"{splash_entity_name} took {splash_damage} splash damage (HP: {splash_entity.hp})")
-
-                                    if hasattr(splash_entity, "name"):
-                                        self.logger.log_event_wizard_damage(self.turn, splash_damage,
-                                                                            splash_entity.name, splash_entity.hp)
-                                    else:
-                                        self.logger.log_event_minion_damage(self.turn, splash_pos, splash_damage,
-                                                                            splash_entity.id, splash_entity.hp)
-                    if not splash_damage_hit:
-                        self.logger.log(f"{caster.name}'s fireball missed!")
-            else:
-                self.logger.log(f"{caster.name}'s fireball out of range!")
-        elif spell == "melee_attack":
-            target_pos = spell_action["target"]
-            self.logger.log_event_spell(self.turn, caster.name, "melee_attack", target_pos)
-            target_entity = self.get_entity_at_position(target_pos)
-            if target_entity:
-                damage = SPELLS["melee_attack"]["damage"]
-                # Shield doesn't apply to melee attacks
-                target_entity.hp -= damage
-                hit = True
-                entity_name = target_entity.name if hasattr(target_entity,
-                                                            "name") else f"{target_entity.owner}'s minion"
-                self.logger.log_damage(target_pos, damage, entity_name)
-                self.logger.log(
-                    f"{entity_name} took {damage} damage from {caster.name}'s melee attack (HP: {target_entity.hp})")
-                if hasattr(target_entity, "name"):
-                    self.logger.log_event_wizard_damage(self.turn, damage, target_entity.name, target_entity.hp)
-                else:
-                    self.logger.log_event_minion_damage(self.turn, target_pos, damage, target_entity.id, target_entity.hp)
-            else:
-                self.logger.log(f"{caster.name}'s melee attack missed!")
-        elif spell == "shield":
-            caster.shield_active = True
-            self.logger.log_event_spell(self.turn, caster.name, "shield", caster.position)
-        elif spell == "heal":
-            heal = SPELLS["heal"]["heal"]
-            caster.hp = min(caster.hp + heal, 100)
-            self.logger.log(f"{caster.name} healed {heal} HP (HP: {caster.hp})")
-            self.logger.log_event_spell(self.turn, caster.name, "heal", caster.position)
-        elif spell == "teleport":
-            dest = spell_action["target"]
-            if self.is_valid_tile(dest):
-                caster.position = dest
-                self.logger.log(f"{caster.name} teleported to {dest}")
-                self.logger.log_event_spell(self.turn, caster.name, "teleport", dest)
-
-                artifact = self.artifacts.check_pickup(caster)
-                if artifact:
-                    self.logger.log_event_artifact_pick_up(self.turn, caster.name, artifact)
-        elif spell == "blink":
-            dest = spell_action["target"]
-            if self.in_range(caster.position, dest, SPELLS["blink"]["distance"]) and self.is_valid_tile(dest):
-                caster.position = dest
-                self.logger.log(f"{caster.name} blinked to {dest}")
-                self.logger.log_event_spell(self.turn, caster.name, "blink", dest)
-
-                artifact = self.artifacts.check_pickup(caster)
-                if artifact:
-                    self.logger.log_event_artifact_pick_up(self.turn, caster.name, artifact)
-        elif spell == "summon":
-            # Check if caster already has a minion
-            if not any(m.owner == caster.name and m.is_alive() for m in self.minions):
-                spawn_pos = self.get_adjacent_free_tile(caster.position)
-                if spawn_pos:
-                    self.minions.append(Minion(caster.name, spawn_pos))
-                    self.logger.log(f"{caster.name} summoned a minion at {spawn_pos}")
-                    self.logger.log_event_spell(self.turn, caster.name, "summon", spawn_pos)
-                else:
-                    self.logger.log(f"{caster.name} tried to summon but no space.")
-            else:
-                self.logger.log(f"{caster.name} already has a minion.")
+        hit = handler.cast(self, caster, target)
+
+        self.logger.log_spell(caster, spell, target, hit)
+        self.remove_dead_minions()
+
+    def summon_minion(self, owner, position):
+        self._minion_counter += 1
+        minion = Minion(owner.name, position, f"{owner.name}-{self._minion_counter}")
+        self.add_minion(minion)
+        return minion
 
-        self.logger.log_spell(caster, spell, spell_action.get("target") if spell_action else None, hit)
+    def log_entity_damage(self, entity, position, amount):
+        """Record a damage event for a wizard or a minion (minion events carry ``position``)."""
+        if entity.kind == ENTITY_WIZARD:
+            self.logger.log_event_wizard_damage(self.turn, amount, entity.name, entity.hp)
+        else:
+            self.logger.log_event_minion_damage(self.turn, position, amount, entity.id, entity.hp)
 
     def process_minions(self):
         # Track attempted movement destinations
@@ -353,86 +400,70 @@ class GameEngine:
                         # No collision, record intended position
                         intended_positions[intended_pos_key] = minion
                         self.logger.log_event_minion_move(self.turn, minion.id, minion.position, new_pos)
-                        minion.position = new_pos
+                        self.set_position(minion, new_pos)
                         self.logger.log(f"{minion.owner}'s minion moved to {new_pos}")
 
-            self.logger.log_state(self.build_input(self.wizard1, self.wizard2))
+            self.log_animation_state()
 
             # If adjacent → attack
             if self.manhattan_dist(minion.position, target.position) <= 1:
-                target.hp -= 10
-                self.logger.log_damage(target.position, 10, target.name if hasattr(target, "name") else "Minion", "melee_attack")
+                target.hp -= MINION_DAMAGE
+                is_wizard = target.kind == ENTITY_WIZARD
+                self.logger.log_damage(
+                    target.position, MINION_DAMAGE, target.name if is_wizard else "Minion", "melee_attack"
+                )
                 self.logger.log(
-                    f"{minion.owner}'s minion attacked {target.owner if hasattr(target, 'owner') else target.name} for 10 dmg")
-                if hasattr(target, "name"):
-                    self.logger.log_event_wizard_damage(self.turn, 10, target.name, target.hp)
-                else:
-                    self.logger.log_event_minion_damage(self.turn, target.position, 10, target.id, target.hp)
+                    f"{minion.owner}'s minion attacked {target.name if is_wizard else target.owner} "
+                    f"for {MINION_DAMAGE} dmg"
+                )
+                self.log_entity_damage(target, target.position, MINION_DAMAGE)
 
-            self.logger.log_state(self.build_input(self.wizard1, self.wizard2))
+            self.log_animation_state()
+
+        self.remove_dead_minions()
 
     def get_adjacent_positions(self, position):
         x, y = position
         return [(x + dx, y + dy) for dx, dy in DIRECTIONS if self.is_valid_tile((x + dx, y + dy))]
 
     def get_minion_next_position(self, minion, dx: int, dy: int):
-        # Calculate the actual target position based on the movement direction
-        target_pos = (
+        # Minions may step onto occupied tiles (resolved as collisions in process_minions), so the
+        # first step is always the adjacent tile in the direction of the target
+        return [
             minion.position[0] + (1 if dx > 0 else (-1 if dx < 0 else 0)),
             minion.position[1] + (1 if dy > 0 else (-1 if dy < 0 else 0))
-        )
-
-        # Use breadth-first search to find path
-        queue = deque()
-        visited = set()
-        parent = {}
-        start = tuple(minion.position)
-
-        # If we're already at the target, no need to move
-        if start == target_pos:
-            return list(start)
-
-        queue.append(start)
-        visited.add(start)
+        ]
 
-        while queue:
-            current = queue.popleft()
-
-            for direction_dx, direction_dy in DIRECTIONS:
-                neighbor = (current[0] + direction_dx, current[1] + direction_dy)
-
-                if (self.is_valid_tile(neighbor) and
-                    neighbor not in visited and
-                    not self.get_entity_at_position(neighbor)):
-
-                    visited.add(neighbor)
-                    parent[neighbor] = current
-
-                    # If this is our target direction, return the first step to get there
-                    if neighbor == target_pos:
-                        # Reconstruct path
-                        path = [neighbor]
-                        while path[-1] != start:
-                            path.append(parent[path[-1]])
-                        return list(path[-2])  # Return the first step
-
-                    queue.append(neighbor)
-
-        # If no path found, return current position
-        return list(start)
+    def get_entity_at_position(self, position) -> Any:
+        """Return the entity (wizard or minion) at the given position, or None if empty."""
+        return self.grid.at(position)
 
+    def set_position(self, entity, position):
+        """Move a wizard or minion, keeping the occupancy grid in sync."""
+        position = [position[0], position[1]]
+        self.grid.move(entity, position)
+        entity.position = position
 
+    def add_minion(self, minion):
+        self.minions.append(minion)
+        self.grid.add(minion, minion.position, self._next_minion_order)
+        self._next_minion_order += 1
 
-    def get_entity_at_position(self, position) -> Any:
-        """Return the entity (wizard or minion) at the given position, or None if empty."""
-        if position == self.wizard1.position:
-            return self.wizard1
-        if position == self.wizard2.position:
-            return self.wizard2
+    def remove_dead_minions(self):
+        """Drop dead minions from the minion list and the occupancy grid."""
         for minion in self.minions:
-            if minion.is_alive() and minion.position == position:
-                return minion
-        return None
+            if minion.hp <= 0:
+                break
+        else:
+            return
+        alive = []
+        for minion in self.minions:
+            if minion.is_alive():
+                alive.append(minion)
+            else:
+                self.grid.remove(minion)
+        # Rebind rather than mutate: process_minions may still be iterating the old list.
+        self.minions = alive
 
     def check_winner(self):
         if self.wizard1.hp <= 0 and self.wizard2.hp <= 0:
@@ -444,6 +475,8 @@ class GameEngine:
         return None
 
     def in_range(self, start, end, max_range):
+        if board.on_board(start) and board.on_board(end) and 0 <= max_range < BOARD_SIZE:
+            return bool(board.WITHIN[max_range][board.square(start)] >> board.square(end) & 1)
         dx = abs(end[0] - start[0])
         dy = abs(end[1] - start[1])
         return max(dx, dy) <= max_range
@@ -453,21 +486,14 @@ class GameEngine:
         return 0 <= x < BOARD_SIZE and 0 <= y < BOARD_SIZE
 
     def get_adjacent_free_tile(self, pos):
-        x, y = pos
-        for dx, dy in DIRECTIONS:
-            new_x, new_y = x + dx, y + dy
-            if self.is_valid_tile((new_x, new_y)) and not self.tile_occupied([new_x, new_y]):
-                return [new_x, new_y]
-        return None
+        # First free tile in DIRECTIONS order; low-to-high bit order is the same order
+        neighbourhood = board.NEIGHBOURHOOD[board.square(pos)] if board.on_board(pos) else board.within(pos, 1)
+        square = self.grid.first_free(neighbourhood)
+        return None if square is None else list(divmod(square, BOARD_SIZE))
 
     def tile_occupied(self, pos):
         # Check if wizards or minions occupy this tile
-        if pos == self.wizard1.position or pos == self.wizard2.position:
-            return True
-        for m in self.minions:
-            if m.is_alive() and m.position == pos:
-                return True
-        return False
+        return self.grid.at(pos) is not None
 
     def manhattan_dist(self, a, b):
         return abs(a[0] - b[0]) + abs(a[1] - b[1])
@@ -486,18 +512,16 @@ class GameEngine:
         return None
 
     def handle_entity_collision(self, entity1, entity2, position):
-        import random
-
         # Random damage between 0 and MELEE_DAMAGE for both entities
-        damage1 = random.randint(0, MELEE_DAMAGE)
-        damage2 = random.randint(0, MELEE_DAMAGE)
+        damage1 = self.rng.randint(0, MELEE_DAMAGE)
+        damage2 = self.rng.randint(0, MELEE_DAMAGE)
 
         # Apply shield protection for wizards
-        if hasattr(entity1, "shield_active") and entity1.shield_active:
+        if entity1.kind == ENTITY_WIZARD and entity1.shield_active:
             damage1 = max(0, damage1 - SPELLS["shield"]["block"])
             entity1.shield_active = False
 
-        if hasattr(entity2, "shield_active") and entity2.shield_active:
+        if entity2.kind == ENTITY_WIZARD and entity2.shield_active:
             damage2 = max(0, damage2 - SPELLS["shield"]["block"])
             entity2.shield_active = False
 
@@ -506,56 +530,48 @@ class GameEngine:
         entity2.hp -= damage2
 
         # Generate names for logging
-        name1 = entity1.name if hasattr(entity1, "name") else f"{entity1.owner}'s minion"
-        name2 = entity2.name if hasattr(entity2, "name") else f"{entity2.owner}'s minion"
+        name1 = entity1.label
+        name2 = entity2.label
 
         self.logger.log(f"{name1} and {name2} collided in melee combat!")
         self.logger.log(f"{name1} takes {damage1} damage (HP: {entity1.hp})")
         self.logger.log(f"{name2} takes {damage2} damage (HP: {entity2.hp})")
 
         # Move entities apart to adjacent tiles
-        print("TURN ", self.turn, ": COLLISION")
-        entity1.position = position
-        entity2.position = position
-        self.logger.log_state(self.build_input(self.wizard1, self.wizard2))
+        self.set_position(entity1, position)
+        self.set_position(entity2, position)
+        self.log_animation_state()
         self.logger.log_collision(position)
         self.scatter_entities(position, entity1, entity2)
+        self.remove_dead_minions()
 
-        self.logger.log_damage(entity1.position, damage1, entity1.name if hasattr(entity1, "name") else f"{entity1.owner}'s minion")
-        self.logger.log_damage(entity2.position, damage2, entity2.name if hasattr(entity2, "name") else f"{entity2.owner}'s minion")
+        self.logger.log_damage(entity1.position, damage1, entity1.label)
+        self.logger.log_damage(entity2.position, damage2, entity2.label)
 
-        if hasattr(entity1, "name"):
-            self.logger.log_event_wizard_damage(self.turn, damage1, entity1.name, entity1.hp)
-        else:
-            self.logger.log_event_minion_damage(self.turn, position, damage1, entity1.id, entity1.hp)
-
-        if hasattr(entity2, "name"):
-            self.logger.log_event_wizard_damage(self.turn, damage2, entity2.name, entity2.hp)
-        else:
-            self.logger.log_event_minion_damage(self.turn, position, damage2, entity2.id, entity2.hp)
+        self.log_entity_damage(entity1, position, damage1)
+        self.log_entity_damage(entity2, position, damage2)
 
     def scatter_entities(self, position, entity1, entity2):
-        import random
-
         # Find random adjacent tiles for both entities
         directions = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
-        random.shuffle(directions)
+        self.rng.shuffle(directions)
 
         # Get all valid adjacent tiles
         valid_tiles = []
         # Use entity1's position as reference since they collided
         for dx, dy in directions:
             new_pos = [entity1.position[0] + dx, entity1.position[1] + dy]
-            if self.is_valid_tile(new_pos) and not self.tile_occupied_except([new_pos], [entity1, entity2]):
+            # Occupied neighbours are not filtered out: the scatter has always only required an on-board tile.
+            if self.is_valid_tile(new_pos):
                 valid_tiles.append(new_pos)
 
         if len(valid_tiles) >= 2:
             # Choose random distinct tiles
-            entity1.position = valid_tiles[0]
-            entity2.position = valid_tiles[1]
+            self.set_position(entity1, valid_tiles[0])
+            self.set_position(entity2, valid_tiles[1])
 
-            name1 = entity1.name if hasattr(entity1, "name") else f"{entity1.owner}'s minion"
-            name2 = entity2.name if hasattr(entity2, "name") else f"{entity2.owner}'s minion"
+            name1 = entity1.label
+            name2 = entity2.label
 
             self.logger.log(f"{name1} was pushed to {entity1.position}")
             self.logger.log(f"{name2} was pushed to {entity2.position}")
@@ -567,13 +583,6 @@ class GameEngine:
             self.logger.log_event_collision(self.turn, position, entity1, entity1.position, entity2, entity2.position)
 
     def tile_occupied_except(self, pos, exceptions):
-        # Check if wizards occupy this tile
-        if self.wizard1.position == pos and self.wizard1 not in exceptions:
-            return True
-        if self.wizard2.position == pos and self.wizard2 not in exceptions:
-            return True
-        # Check minions
-        for m in self.minions:
-            if m.is_alive() and m.position == pos and m not in exceptions:
-                return True
-        return False
+        # Check if wizards or minions other than the exceptions occupy this tile
+        return self.grid.at_except(pos, exceptions) is not None
+
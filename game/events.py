@@ -0,0 +1,248 @@
+from array import array
+
+from game.rules import ENTITY_WIZARD
+
+# Event names as they appear in GameLogger.get_event_logs()
+EVENT_TURN_START = "turn_start"
+EVENT_SPELL_CAST = "spell_cast"
+EVENT_DAMAGE = "damage"
+EVENT_WIZARD_MOVE = "wizard_move"
+EVENT_MINION_MOVE = "minion_move"
+EVENT_COLLISION = "collision"
+EVENT_SHIELD_DOWN = "shield_down"
+EVENT_ARTIFACT_SPAWN = "artifact_spawn"
+EVENT_ARTIFACT_PICK_UP = "artifact_pick_up"
+
+# Row kinds. Events with two participants (wizard moves, collisions) take a second *_CONT row
+# that is merged into the preceding row when dict views are built.
+KIND_TURN_START = 0
+KIND_SPELL_CAST = 1
+KIND_WIZARD_DAMAGE = 2
+KIND_MINION_DAMAGE = 3
+KIND_WIZARD_MOVE = 4
+KIND_WIZARD_MOVE_CONT = 5
+KIND_MINION_MOVE = 6
+KIND_COLLISION = 7
+KIND_COLLISION_CONT = 8
+KIND_SHIELD_DOWN = 9
+KIND_ARTIFACT_SPAWN = 10
+KIND_ARTIFACT_PICK_UP = 11
+KIND_SPELL_RECORD = 12  # GameLogger.spells
+KIND_DAMAGE_RECORD = 13  # GameLogger.damage_events
+KIND_COLLISION_RECORD = 14  # GameLogger.collision_events
+
+EVENT_KINDS = frozenset(range(KIND_TURN_START, KIND_ARTIFACT_PICK_UP + 1))
+
+NONE = -(2**31)  # missing value in int columns
+NO_POS = -(2**15)  # missing coordinate in position columns
+
+
+class EventStore:
+    """Columnar, array-backed store for everything GameLogger records during a match.
+
+    Each row holds a kind, the turn and state index, two interned names (``actor`` and ``subject``),
+    up to two positions, an ``amount`` and a ``value``. Names are interned into ``names``; payloads
+    that do not fit the columns (e.g. a malformed spell target from a bot) are kept verbatim in
+    ``extras``. Columns are public so aggregation can scan them directly; ``rows(kinds)`` builds the
+    dict views GameLogger used to store.
+    """
+
+    def __init__(self):
+        self.kind = array("b")
+        self.turn = array("i")
+        self.state = array("i")
+        self.actor = array("i")
+        self.subject = array("i")
+        self.x = array("h")
+        self.y = array("h")
+        self.x2 = array("h")
+        self.y2 = array("h")
+        self.amount = array("i")
+        self.value = array("i")
+        self.extra = array("i")
+        self.names = []
+        self.extras = []
+        self._name_ids = {}
+
+    def __len__(self):
+        return len(self.kind)
+
+    def intern(self, name):
+        if name is None:
+            return NONE
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = self._name_ids[name] = len(self.names)
+            self.names.append(name)
+        return name_id
+
+    def name(self, name_id):
+        return None if name_id == NONE else self.names[name_id]
+
+    def add(self, kind, turn, state=NONE, actor=None, subject=None, pos=None, pos2=None, amount=NONE, value=NONE):
+        x, y = _split(pos) if pos is not None else _NO_XY
+        x2, y2 = _split(pos2) if pos2 is not None else _NO_XY
+        extra = NONE
+        if x is None or x2 is None:
+            # Not a pair of small ints: keep the raw positions instead
+            extra = len(self.extras)
+            self.extras.append((pos, pos2))
+            x = y = x2 = y2 = NO_POS
+        name_ids = self._name_ids
+        actor_id = NONE if actor is None else name_ids.get(actor)
+        if actor_id is None:
+            actor_id = self.intern(actor)
+        subject_id = NONE if subject is None else name_ids.get(subject)
+        if subject_id is None:
+            subject_id = self.intern(subject)
+        self.kind.append(kind)
+        self.turn.append(NONE if turn is None else turn)
+        self.state.append(state)
+        self.actor.append(actor_id)
+        self.subject.append(subject_id)
+        self.x.append(x)
+        self.y.append(y)
+        self.x2.append(x2)
+        self.y2.append(y2)
+        self.amount.append(NONE if amount is None else amount)
+        self.value.append(NONE if value is None else value)
+        self.extra.append(extra)
+
+    def _pos(self, i):
+        if self.extra[i] != NONE:
+            return self.extras[self.extra[i]][0]
+        return None if self.x[i] == NO_POS else [self.x[i], self.y[i]]
+
+    def _pos2(self, i):
+        if self.extra[i] != NONE:
+            return self.extras[self.extra[i]][1]
+        return None if self.x2[i] == NO_POS else [self.x2[i], self.y2[i]]
+
+    def _int(self, column, i):
+        v = column[i]
+        return None if v == NONE else v
+
+    def rows(self, kinds, start=0):
+        """Build dict views for rows of the given kinds, starting at row ``start``."""
+        views = []
+        kind = self.kind
+        for i in range(start, len(kind)):
+            k = kind[i]
+            if k in kinds:
+                if k in (KIND_WIZARD_MOVE_CONT, KIND_COLLISION_CONT):
+                    if views:
+                        self._merge(views[-1], k, i)
+                    continue
+                views.append(self._view(k, i))
+        return views
+
+    def _view(self, k, i):
+        turn = self._int(self.turn, i)
+        if k == KIND_SPELL_CAST:
+            return _event(turn, EVENT_SPELL_CAST, {
+                "caster": self.name(self.actor[i]),
+                "spell": self.name(self.subject[i]),
+                "target": self._pos(i),
+            })
+        if k == KIND_WIZARD_DAMAGE:
+            return _event(turn, EVENT_DAMAGE, {
+                "entity": "wizard",
+                "amount": self._int(self.amount, i),
+                "name": self.name(self.actor[i]),
+                "remaining_hp": self._int(self.value, i),
+            })
+        if k == KIND_MINION_DAMAGE:
+            return _event(turn, EVENT_DAMAGE, {
+                "entity": "minion",
+                "position": self._pos(i),
+                "amount": self._int(self.amount, i),
+                "minion_id": self.name(self.actor[i]),
+                "remaining_hp": self._int(self.value, i),
+            })
+        if k == KIND_WIZARD_MOVE:
+            details = {}
+            self._add_wizard_move(details, i)
+            return _event(turn, EVENT_WIZARD_MOVE, details)
+        if k == KIND_MINION_MOVE:
+            return _event(turn, EVENT_MINION_MOVE, {
+                "minion_id": self.name(self.actor[i]),
+                "move": f"{self._pos(i)}->{self._pos2(i)}",
+            })
+        if k == KIND_COLLISION:
+            details = {"position": self._pos(i)}
+            self._add_collision_entity(details, "entity1", i)
+            return _event(turn, EVENT_COLLISION, details)
+        if k == KIND_SHIELD_DOWN:
+            return _event(turn, EVENT_SHIELD_DOWN, {"wizard": self.name(self.actor[i])})
+        if k == KIND_ARTIFACT_SPAWN:
+            return _event(turn, EVENT_ARTIFACT_SPAWN, {
+                "type": self.name(self.subject[i]),
+                "position": self._pos(i),
+            })
+        if k == KIND_ARTIFACT_PICK_UP:
+            return _event(turn, EVENT_ARTIFACT_PICK_UP, {
+                "wizard": self.name(self.actor[i]),
+                "artifact_type": self.name(self.subject[i]),
+                "artifact_position": self._pos(i),
+            })
+        if k == KIND_TURN_START:
+            return _event(turn, EVENT_TURN_START, {})
+        if k == KIND_SPELL_RECORD:
+            hit = self._int(self.value, i)
+            return {
+                "turn": turn,
+                "state_index": self._int(self.state, i),
+                "caster": self.name(self.actor[i]),
+                "spell": self.name(self.subject[i]),
+                "target": self._pos(i),
+                "hit": None if hit is None else bool(hit),
+            }
+        if k == KIND_DAMAGE_RECORD:
+            return {
+                "turn": turn,
+                "state_index": self._int(self.state, i),
+                "position": self._pos(i),
+                "amount": self._int(self.amount, i),
+                "target": self.name(self.actor[i]),
+                "cause": self.name(self.subject[i]),
+            }
+        if k == KIND_COLLISION_RECORD:
+            return {"turn": turn, "position": self._pos(i)}
+        raise ValueError(f"Unknown event kind: {k}")
+
+    def _merge(self, view, k, i):
+        if k == KIND_WIZARD_MOVE_CONT:
+            self._add_wizard_move(view["details"], i)
+        else:
+            self._add_collision_entity(view["details"], "entity2", i)
+
+    def _add_wizard_move(self, details, i):
+        details[f"wizard{self.amount[i]}"] = {
+            "name": self.name(self.actor[i]),
+            "move": f"{self._pos(i)}->{self._pos2(i)}",
+        }
+
+    def _add_collision_entity(self, details, prefix, i):
+        details[f"{prefix}_type"] = "wizard" if self.value[i] == ENTITY_WIZARD else "minion"
+        details[prefix] = self.name(self.actor[i])
+        details[f"{prefix}_bounce_position"] = self._pos2(i)
+
+
+def _event(turn, event, details):
+    return {"turn": turn, "event": event, "details": details}
+
+
+_NO_XY = (NO_POS, NO_POS)
+
+
+def _split(pos):
+    """Return (x, y) for a position, (NO_POS, NO_POS) for None and (None, None) if it doesn't fit."""
+    if pos is None:
+        return _NO_XY
+    try:
+        x, y = pos
+    except (TypeError, ValueError):
+        return None, None
+    if type(x) is int and type(y) is int and NO_POS < x < 2**15 and NO_POS < y < 2**15:
+        return x, y
+    return None, None
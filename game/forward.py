@@ -0,0 +1,14 @@
+from game.engine import GameEngine
+
+
+def step(state, action1, action2, rng):
+    """Advance ``state`` by one turn and return ``(next_state, winner)``.
+
+    ``state`` is a ``GameState`` (see ``GameEngine.get_state``) and is not modified. Actions are
+    bot dicts or ``game.actions.Action`` values. All randomness (artifact spawns, collision damage
+    and bounces) is drawn from ``rng``, so the same state, actions and RNG state always give the
+    same result. ``winner`` is a wizard name, ``"Draw"`` or None.
+    """
+    engine = GameEngine.from_state(state, rng)
+    winner = engine.play_turn(action1, action2)
+    return engine.get_state(), winner
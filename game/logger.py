@@ -1,47 +1,107 @@
-import copy
-
+from game.events import (
+    EVENT_KINDS,
+    KIND_ARTIFACT_PICK_UP,
+    KIND_ARTIFACT_SPAWN,
+    KIND_COLLISION,
+    KIND_COLLISION_CONT,
+    KIND_COLLISION_RECORD,
+    KIND_DAMAGE_RECORD,
+    KIND_MINION_DAMAGE,
+    KIND_MINION_MOVE,
+    KIND_SHIELD_DOWN,
+    KIND_SPELL_CAST,
+    KIND_SPELL_RECORD,
+    KIND_TURN_START,
+    KIND_WIZARD_DAMAGE,
+    KIND_WIZARD_MOVE,
+    KIND_WIZARD_MOVE_CONT,
+    EventStore,
+)
+from game.events import (  # noqa: F401 - re-exported for existing imports
+    EVENT_ARTIFACT_PICK_UP,
+    EVENT_ARTIFACT_SPAWN,
+    EVENT_COLLISION,
+    EVENT_DAMAGE,
+    EVENT_MINION_MOVE,
+    EVENT_SHIELD_DOWN,
+    EVENT_SPELL_CAST,
+    EVENT_TURN_START,
+    EVENT_WIZARD_MOVE,
+)
+from game.rules import ENTITY_WIZARD
+from game.snapshots import SnapshotStore
 from game.wizard import Wizard
 
 
-EVENT_TURN_START = "turn_start"
-EVENT_SPELL_CAST = "spell_cast"
-EVENT_DAMAGE = "damage"
-EVENT_WIZARD_MOVE = "wizard_move"
-EVENT_MINION_MOVE = "minion_move"
-EVENT_COLLISION = "collision"
-EVENT_SHIELD_DOWN = "shield_down"
-EVENT_ARTIFACT_SPAWN= "artifact_spawn"
-EVENT_ARTIFACT_PICK_UP = "artifact_pick_up"
-
 class GameLogger:
-    def __init__(self):
+    def __init__(self, sinks=None):
         self.turn_logs = []
-        self.events = []  # 📝 new: list of events
         self.current_turn = []
-        self.snapshots = []   # 💾 new: full board state per turn
-        self.spells = []
-        self.damage_events = []
-        self.collision_events = []
+        self.turn_number = 0
+        self.snapshots = SnapshotStore()   # 💾 board states, stored as deltas
+        self.store = EventStore()   # 📝 events, spells, damage and collisions as typed columns
         self.state_index=0
+        self.sinks = list(sinks) if sinks else []
+        self._flushed_rows = 0  # store rows already handed to the sinks
+        self._views = {}  # kinds -> (rows scanned, dict views), built on demand
+        self.replay = None  # game.replay.Replay of the match, set by the engine
 
     def new_turn(self, turn_num):
+        self.flush()
         if self.current_turn:
             self.turn_logs.append(self.current_turn)
         self.current_turn = [f"--- Turn {turn_num} ---"]
+        self.turn_number = turn_num
 
     def log(self, message):
         self.current_turn.append(message)
 
     def log_state(self, state_dict):
-        state_dict_copy = copy.deepcopy(state_dict)
-        state_dict_copy["state_index"] = self.state_index
-        self.snapshots.append(state_dict_copy)
+        self.snapshots.append({**state_dict, "state_index": self.state_index})
         self.state_index += 1
 
     def finalize(self):
+        self.flush()
+        for sink in self.sinks:
+            sink.flush()
         if self.current_turn:
             self.turn_logs.append(self.current_turn)
 
+    def flush(self):
+        """Hand the events logged since the last flush to the attached sinks; they flush at ``finalize``."""
+        if not self.sinks:
+            return
+        batch = self.store.rows(EVENT_KINDS, self._flushed_rows)
+        self._flushed_rows = len(self.store)
+        if batch:
+            for sink in self.sinks:
+                sink.write(batch)
+
+    def _rows(self, kinds):
+        scanned, views = self._views.get(kinds, (0, None))
+        if views is None:
+            views = []
+        if scanned < len(self.store):
+            views.extend(self.store.rows(kinds, scanned))
+            self._views[kinds] = (len(self.store), views)
+        return views
+
+    @property
+    def events(self):
+        return self._rows(EVENT_KINDS)
+
+    @property
+    def spells(self):
+        return self._rows(_SPELL_RECORDS)
+
+    @property
+    def damage_events(self):
+        return self._rows(_DAMAGE_RECORDS)
+
+    @property
+    def collision_events(self):
+        return self._rows(_COLLISION_RECORDS)
+
     def print_log(self):
         for turn in self.turn_logs:
             for line in turn:
@@ -60,179 +120,86 @@ class GameLogger:
                     f.write(line + "\n")
 
     def log_spell(self, caster, spell_name, target=None, hit=None):
-        self.spells.append({
-            "turn": self.current_turn,
-            "state_index": self.state_index,
-            "caster": caster.name,
-            "spell": spell_name,
-            "target": target,
-            "hit": hit
-        })
+        self.store.add(
+            KIND_SPELL_RECORD, self.turn_number, self.state_index, caster.name, spell_name, target,
+            value=None if hit is None else int(hit),
+        )
 
     def log_damage(self, position, amount, target_name, cause=None):
-        self.damage_events.append({
-            "turn": self.current_turn,
-            "state_index": self.state_index,
-            "position": position,
-            "amount": amount,
-            "target": target_name,
-            "cause": cause
-        })
+        self.store.add(KIND_DAMAGE_RECORD, self.turn_number, self.state_index, target_name, cause, position,
+                       amount=amount)
 
     def log_collision(self, position):
-        self.collision_events.append({
-            "turn": self.current_turn,
-            "position": position
-        })
-
+        self.store.add(KIND_COLLISION_RECORD, self.turn_number, pos=position)
 
     # EVENT LOGS
-    
-    def _log_event(self, event_data):
-        """Print event data to console for debugging"""
-        print(f"Turn {event_data['turn']} | EVENT: {event_data['event']} | {event_data['details']}")
+    # Events are stored as typed rows; dict views are built by get_event_logs() and flush().
 
     def log_event_turn_start(self, turn):
-        event_data = {
-            "turn": turn,
-            "event": EVENT_TURN_START,
-            "details": {}
-        }
-        self.events.append(event_data)
-        self._log_event(event_data)
+        self.store.add(KIND_TURN_START, turn)
 
     def log_event_spell(self, turn, caster, spell_name, target):
-        event_data = {
-            "turn": turn,
-            "event": EVENT_SPELL_CAST,
-            "details": {
-                "caster": caster,
-                "spell": spell_name,
-                "target": target
-            }
-        }
-        self.events.append(event_data)
-        self._log_event(event_data)
+        self.store.add(KIND_SPELL_CAST, turn, actor=caster, subject=spell_name, pos=target)
 
     def log_event_wizard_damage(self, turn, amount, name, remaining_hp=None):
-        event_data = {
-            "turn": turn,
-            "event": EVENT_DAMAGE,
-            "details": {
-                "entity": "wizard",
-                "amount": amount,
-                "name": name,
-                "remaining_hp": remaining_hp
-            }
-        }
-        self.events.append(event_data)
-        self._log_event(event_data)
+        self.store.add(KIND_WIZARD_DAMAGE, turn, actor=name, amount=amount, value=remaining_hp)
 
     def log_event_minion_damage(self, turn, position, amount, minion_id, remaining_hp=None):
-        event_data = {
-            "turn": turn,
-            "event": EVENT_DAMAGE,
-            "details": {
-                "entity": "minion",
-                "position": position,
-                "amount": amount,
-                "minion_id": minion_id,
-                "remaining_hp": remaining_hp
-            }
-        }
-        self.events.append(event_data)
-        self._log_event(event_data)
+        self.store.add(KIND_MINION_DAMAGE, turn, actor=minion_id, pos=position, amount=amount, value=remaining_hp)
 
     def log_event_wizard_move(self, turn, wiz1: Wizard, wiz1_new_position, wiz2: Wizard, wiz2_new_position):
         # Only track wizards that actually move
-        details = {}
-        
+        kind = KIND_WIZARD_MOVE
         if wiz1.position != wiz1_new_position:
-            details["wizard1"] = {
-                "name": wiz1.name,
-                "move": str(wiz1.position) + '->' + str(wiz1_new_position)
-            }
-            
+            self.store.add(kind, turn, actor=wiz1.name, pos=wiz1.position, pos2=wiz1_new_position, amount=1)
+            kind = KIND_WIZARD_MOVE_CONT
         if wiz2.position != wiz2_new_position:
-            details["wizard2"] = {
-                "name": wiz2.name,
-                "move": str(wiz2.position) + '->' + str(wiz2_new_position)
-            }
-            
-        # Only log the event if at least one wizard moved
-        if details:
-            event_data = {
-                "turn": turn,
-                "event": EVENT_WIZARD_MOVE,
-                "details": details
-            }
-            self.events.append(event_data)
-            self._log_event(event_data)
+            self.store.add(kind, turn, actor=wiz2.name, pos=wiz2.position, pos2=wiz2_new_position, amount=2)
 
     def log_event_minion_move(self, turn, minion_id, start_position, new_position):
-        event_data = {
-            "turn": turn,
-            "event": EVENT_MINION_MOVE,
-            "details": {
-                "minion_id": minion_id,
-                "move": str(start_position) + '->' + str(new_position)
-            }
-        }
-        self.events.append(event_data)
-        self._log_event(event_data)
+        self.store.add(KIND_MINION_MOVE, turn, actor=minion_id, pos=start_position, pos2=new_position)
 
     def log_event_collision(self, turn, position, entity1, entity1_bounce_position, entity2, entity2_bounce_position):
-        event_data = {
-            "turn": turn,
-            "event": EVENT_COLLISION,
-            "details": {
-                "position": position,
-                "entity1_type": "wizard" if hasattr(entity1, "name") else "minion",
-                "entity1": entity1.name if hasattr(entity1, "name") else entity1.id,
-                "entity1_bounce_position": entity1_bounce_position,
-                "entity2_type": "wizard" if hasattr(entity2, "name") else "minion",
-                "entity2": entity2.name if hasattr(entity2, "name") else entity2.id,
-                "entity2_bounce_position": entity2_bounce_position
-            }
-        }
-        self.events.append(event_data)
-        self._log_event(event_data)
+        for kind, entity, bounce_position in (
+            (KIND_COLLISION, entity1, entity1_bounce_position),
+            (KIND_COLLISION_CONT, entity2, entity2_bounce_position),
+        ):
+            self.store.add(
+                kind, turn,
+                actor=entity.name if entity.kind == ENTITY_WIZARD else entity.id,
+                pos=position, pos2=bounce_position, value=entity.kind,
+            )
 
     def log_event_shield_down(self, turn, wizard_name):
-        event_data = {
-            "turn": turn,
-            "event": EVENT_SHIELD_DOWN,
-            "details": {
-                "wizard": wizard_name
-            }
-        }
-        self.events.append(event_data)
-        self._log_event(event_data)
+        self.store.add(KIND_SHIELD_DOWN, turn, actor=wizard_name)
 
     def log_event_spawn_artifact(self, turn, artifact):
-        event_data = {
-            "turn": turn,
-            "event": EVENT_ARTIFACT_SPAWN,
-            "details": {
-                "type": artifact["type"],
-                "position": artifact["position"]
-            }
-        }
-        self.events.append(event_data)
-        self._log_event(event_data)
+        self.store.add(KIND_ARTIFACT_SPAWN, turn, subject=artifact["type"], pos=artifact["position"])
 
     def log_event_artifact_pick_up(self, turn, wizard_name, artifact):
-        event_data = {
-            "turn": turn,
-            "event": EVENT_ARTIFACT_PICK_UP,
-            "details": {
-                "wizard": wizard_name,
-                "artifact_type": artifact["type"],
-                "artifact_position": artifact["position"]
-            }
-        }
-        self.events.append(event_data)
-        self._log_event(event_data)
+        self.store.add(KIND_ARTIFACT_PICK_UP, turn, actor=wizard_name, subject=artifact["type"],
+                       pos=artifact["position"])
 
     def get_event_logs(self):
         return self.events
+
+
+
+class NullLogger:
+    """Drop-in GameLogger replacement that records nothing, used by engine clones."""
+
+    replay = None
+
+    def _discard(self, *_args, **_kwargs):
+        return None
+
+    new_turn = log = log_state = finalize = flush = _discard
+    log_spell = log_damage = log_collision = _discard
+    log_event_turn_start = log_event_spell = log_event_wizard_damage = log_event_minion_damage = _discard
+    log_event_wizard_move = log_event_minion_move = log_event_collision = log_event_shield_down = _discard
+    log_event_spawn_artifact = log_event_artifact_pick_up = _discard
+
+
+_SPELL_RECORDS = frozenset({KIND_SPELL_RECORD})
+_DAMAGE_RECORDS = frozenset({KIND_DAMAGE_RECORD})
+_COLLISION_RECORDS = frozenset({KIND_COLLISION_RECORD})
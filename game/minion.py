@@ -1,27 +1,98 @@
+from game import zobrist as z
+from game.rules import ENTITY_MINION
+from game.state import MinionState
+
+MINION_HP = 30
+MINION_DAMAGE = 10
+
+
 class Minion:
-    _id_counter = 0
+    __slots__ = ("_dict", "_hp", "_is_ready", "_position", "id", "owner", "zobrist")
 
-    def __init__(self, owner, position):
-        Minion._id_counter += 1
-        self.id = f"{owner}-{Minion._id_counter}"
+    kind = ENTITY_MINION
+
+    def __init__(self, owner, position, minion_id):
+        # Ids are handed out per match by GameEngine.summon_minion, as "<owner>-<n>"
+        self.id = minion_id
         self.owner = owner  # Wizard.name
-        self.hp = 30
-        self.position = position
+        self._hp = MINION_HP
+        self._position = position
         self._is_ready = False
+        self._dict = None
+        self.zobrist = z.minion_hash(owner, MINION_HP, position, False)
+
+    def copy(self):
+        """Return an independent copy that keeps the same id."""
+        clone = Minion.__new__(Minion)
+        clone.id = self.id
+        clone.owner = self.owner
+        clone._hp = self._hp
+        clone._position = self._position
+        clone._is_ready = self._is_ready
+        clone._dict = self._dict
+        clone.zobrist = self.zobrist
+        return clone
+
+    def to_state(self, order):
+        return MinionState(self.id, self.owner, self._hp, (self._position[0], self._position[1]), self._is_ready, order)
+
+    @classmethod
+    def from_state(cls, state):
+        minion = cls.__new__(cls)
+        minion.id = state.id
+        minion.owner = state.owner
+        minion._hp = state.hp
+        minion._position = list(state.position)
+        minion._is_ready = state.is_ready
+        minion._dict = None
+        minion.zobrist = z.minion_hash(state.owner, state.hp, state.position, state.is_ready)
+        return minion
+
+    @property
+    def label(self):
+        """Name used in log messages."""
+        return f"{self.owner}'s minion"
+
+    @property
+    def hp(self):
+        return self._hp
+
+    @hp.setter
+    def hp(self, value):
+        self.zobrist ^= z.key(z.MINION_HP, self._hp) ^ z.key(z.MINION_HP, value)
+        self._hp = value
+        self._dict = None
+
+    @property
+    def position(self):
+        return self._position
+
+    @position.setter
+    def position(self, value):
+        self.zobrist ^= z.key(z.MINION_POSITION, z.position_value(self._position)) ^ z.key(
+            z.MINION_POSITION, z.position_value(value))
+        self._position = value
+        self._dict = None
 
     def to_dict(self):
-        return {
-            "id": self.id,
-            "owner": self.owner,
-            "hp": self.hp,
-            "position": self.position
-        }
+        """Return the bot-facing view of the minion; every call gets its own copy, which bots may modify."""
+        if self._dict is None:
+            self._dict = {
+                "id": self.id,
+                "owner": self.owner,
+                "hp": self._hp,
+                "position": self._position
+            }
+        view = self._dict.copy()
+        view["position"] = list(self._position)
+        return view
 
     def is_alive(self):
-        return self.hp > 0
+        return self._hp > 0
 
     def is_ready(self):
         return self._is_ready
 
     def make_ready(self):
+        self.zobrist ^= z.key(z.MINION_READY, self._is_ready) ^ z.key(z.MINION_READY, True)
         self._is_ready = True
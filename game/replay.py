@@ -0,0 +1,83 @@
+import json
+
+from game.actions import NO_SPELL, Action
+from game.rules import RULES_VERSION
+
+
+class Replay:
+    """Everything needed to play a match again: rules version, RNG seed, wizard names and the
+    parsed actions of every turn.
+
+    ``GameEngine`` records one as it plays (``engine.replay``, also ``logger.replay``). Engines
+    seeded with an integer store the ``seed``; engines given their own ``random.Random`` store its
+    starting ``rng_state`` instead. ``game.replayer.Replayer`` turns a replay back into states and
+    snapshots. ``to_dict``/``save`` give a small JSON document with a short list per action.
+    Text log lines about malformed bot actions are not part of a replay, since actions are stored
+    already parsed.
+    """
+
+    __slots__ = ("actions", "names", "rng_state", "rules_version", "seed")
+
+    def __init__(self, names, seed=None, rng_state=None, actions=None, rules_version=RULES_VERSION):
+        if seed is None and rng_state is None:
+            raise ValueError("A replay needs a seed or an RNG state")
+        self.rules_version = rules_version
+        self.seed = seed
+        self.rng_state = rng_state
+        self.names = tuple(names)
+        self.actions = [] if actions is None else actions  # (Action, Action) per turn
+
+    @property
+    def turns(self):
+        return len(self.actions)
+
+    def to_dict(self):
+        data = {"rules_version": self.rules_version, "names": list(self.names)}
+        if self.seed is not None:
+            data["seed"] = self.seed
+        else:
+            version, internal, gauss_next = self.rng_state
+            data["rng_state"] = [version, list(internal), gauss_next]
+        data["actions"] = [[encode_action(a1), encode_action(a2)] for a1, a2 in self.actions]
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        rng_state = data.get("rng_state")
+        if rng_state is not None:
+            rng_state = (rng_state[0], tuple(rng_state[1]), rng_state[2])
+        return cls(
+            data["names"],
+            seed=data.get("seed"),
+            rng_state=rng_state,
+            actions=[(decode_action(a1), decode_action(a2)) for a1, a2 in data["actions"]],
+            rules_version=data["rules_version"],
+        )
+
+    def save(self, filename):
+        with open(filename, "w") as f:
+            json.dump(self.to_dict(), f, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, filename):
+        with open(filename) as f:
+            return cls.from_dict(json.load(f))
+
+
+def encode_action(action):
+    """``[move, spell, target]`` as JSON-friendly lists, with trailing defaults dropped."""
+    move, spell, target = action
+    data = [None if move is None else list(move), spell, None if target is None else list(target)]
+    while data and data[-1] == _DEFAULTS[len(data) - 1]:
+        data.pop()
+    return data
+
+
+def decode_action(data):
+    move, spell, target = list(data) + _DEFAULTS[len(data):]
+    return Action(
+        None if move is None else (move[0], move[1]), spell, None if target is None else (target[0], target[1])
+    )
+
+
+_DEFAULTS = [None, NO_SPELL, None]
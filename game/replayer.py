@@ -0,0 +1,100 @@
+import random
+
+from game.engine import GameEngine
+from game.logger import GameLogger
+from game.rules import RULES_VERSION
+from game.snapshots import SNAPSHOT_ANIMATION, SNAPSHOT_NONE
+
+DEFAULT_CHECKPOINT_EVERY = 10
+
+
+class Replayer:
+    """Rebuilds a recorded match from its ``game.replay.Replay``.
+
+    ``logger`` plays the whole match again and returns a logger with the same snapshots and events
+    ``run_match`` produced. ``state`` and ``turn_snapshots`` rebuild a single point of the match:
+    the replayer keeps a ``GameState`` and RNG state every ``checkpoint_every`` turns, filled in as
+    turns are played, so seeking resumes from the nearest checkpoint instead of turn 0.
+    """
+
+    def __init__(self, replay, checkpoint_every=DEFAULT_CHECKPOINT_EVERY):
+        if replay.rules_version != RULES_VERSION:
+            raise ValueError(
+                f"Replay was recorded with rules version {replay.rules_version}, these are version {RULES_VERSION}"
+            )
+        if checkpoint_every < 1:
+            raise ValueError("checkpoint_every must be at least 1")
+        self.replay = replay
+        self.checkpoint_every = checkpoint_every
+        engine = self._new_engine(SNAPSHOT_NONE)
+        self._checkpoints = {0: (engine.get_state(), engine.rng.getstate())}  # turn -> (state, rng state)
+
+    @property
+    def turns(self):
+        return self.replay.turns
+
+    def state(self, turn):
+        """The ``GameState`` after ``turn`` turns (0 is the starting position)."""
+        engine = self._engine_at(turn)
+        return engine.get_state()
+
+    def winner(self):
+        """Name of the winning wizard, or ``"Draw"``."""
+        return self._engine_at(self.turns).check_winner() or "Draw"
+
+    def turn_snapshots(self, turn, snapshot_policy=SNAPSHOT_ANIMATION):
+        """The snapshots logged while playing turn ``turn`` (1 is the first), ``state_index`` from 0."""
+        if not 1 <= turn <= self.turns:
+            raise IndexError(f"Turn {turn} is not in this replay (1-{self.turns})")
+        engine = self._engine_at(turn - 1)
+        engine.logger = GameLogger()
+        engine.snapshot_policy = snapshot_policy
+        engine.play_turn(*self.replay.actions[turn - 1])
+        return list(engine.logger.get_snapshots())
+
+    def logger(self, snapshot_policy=SNAPSHOT_ANIMATION, sinks=None):
+        """Play the whole match again and return its finalized ``GameLogger``, as ``run_match`` does."""
+        engine = self._new_engine(snapshot_policy, sinks)
+        for turn, (action1, action2) in enumerate(self.replay.actions, 1):
+            engine.play_turn(action1, action2)
+            self._checkpoint(engine, turn)
+        if snapshot_policy == SNAPSHOT_NONE:
+            engine.logger.log_state(engine.build_input(engine.wizard1, engine.wizard2))
+        engine.logger.finalize()
+        return engine.logger
+
+    def _new_engine(self, snapshot_policy, sinks=None):
+        replay = self.replay
+        seats = [_Seat(name) for name in replay.names]
+        if replay.seed is not None:
+            return GameEngine(*seats, snapshot_policy=snapshot_policy, sinks=sinks, seed=replay.seed)
+        rng = random.Random()
+        rng.setstate(replay.rng_state)
+        return GameEngine(*seats, snapshot_policy=snapshot_policy, sinks=sinks, rng=rng)
+
+    def _engine_at(self, turn):
+        """A headless engine after ``turn`` turns, played on from the nearest checkpoint."""
+        if not 0 <= turn <= self.turns:
+            raise IndexError(f"Turn {turn} is not in this replay (0-{self.turns})")
+        start = turn - turn % self.checkpoint_every
+        while start not in self._checkpoints:
+            start -= self.checkpoint_every
+        state, rng_state = self._checkpoints[start]
+        rng = random.Random()
+        rng.setstate(rng_state)
+        engine = GameEngine.from_state(state, rng)
+        for t in range(start, turn):
+            engine.play_turn(*self.replay.actions[t])
+            self._checkpoint(engine, t + 1)
+        return engine
+
+    def _checkpoint(self, engine, turn):
+        if turn % self.checkpoint_every == 0 and turn not in self._checkpoints:
+            self._checkpoints[turn] = (engine.get_state(), engine.rng.getstate())
+
+
+class _Seat:
+    """Stands in for a bot; replayed engines only need the name."""
+
+    def __init__(self, name):
+        self.name = name
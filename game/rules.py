@@ -1,3 +1,5 @@
+from enum import IntEnum
+
 BOARD_SIZE = 10
 MAX_HP = 100
 MAX_MANA = 100
@@ -5,6 +7,8 @@ MANA_REGEN = 10
 MELEE_DAMAGE = 5;
 ARTIFACT_SPAWN_RATE = 3  # every X turns
 FIREBALL_SPLASH_DAMAGE = 4
+# Bump whenever a change to the rules (or to the order of RNG draws) makes old replays play out differently
+RULES_VERSION = 1
 
 DIRECTIONS = [(-1,-1), (-1,0), (-1,1), (0,-1), (0,0), (0,1), (1,-1), (1,0), (1,1)]
 
@@ -16,4 +20,16 @@ SPELLS = {
     "heal": {"cost": 25, "cooldown": 3, "heal": 20},
     "blink": {"cost": 10, "cooldown": 2, "distance": 2},
     "melee_attack": {"cost": 0, "cooldown": 1, "damage": 10, "range": 1},
-}
\ No newline at end of file
+}
+
+# Spell ids index the fixed-order per-wizard cooldown arrays. These are lists so that spells
+# registered later (game.spells.register_spell) are seen by every module that imported them.
+SPELL_NAMES = list(SPELLS)
+SPELL_IDS = {name: spell_id for spell_id, name in enumerate(SPELL_NAMES)}
+Spell = IntEnum("Spell", {name.upper(): spell_id for spell_id, name in enumerate(SPELL_NAMES)})
+SPELL_COSTS = [SPELLS[name]["cost"] for name in SPELL_NAMES]
+SPELL_COOLDOWNS = [SPELLS[name]["cooldown"] for name in SPELL_NAMES]
+
+# Entity kind tags (Wizard.kind, Minion.kind)
+ENTITY_WIZARD = 0
+ENTITY_MINION = 1
@@ -0,0 +1,170 @@
+from array import array
+from multiprocessing import shared_memory
+
+from game.artifacts import ARTIFACT_TYPES
+from game.board import SQUARES
+from game.rules import SPELL_NAMES
+
+# Fixed layout of a bot input dict (GameEngine.build_input) in shared memory: a block of int32
+# words followed by the two wizard names as UTF-8.
+#
+#   header    turn, board_size, spell count, artifact count, minion count, name lengths (2)
+#   wizard    hp, mana, x, y, shield_active, cooldowns (MAX_SPELLS words), for "self" then "opponent"
+#   artifact  type (index in ARTIFACT_TYPES), x, y, spawn_turn, once per artifact
+#   minion    owner (0 self, 1 opponent), number, hp, x, y, once per minion
+#
+# Artifacts and minions are packed one after the other, so only the used words are copied.
+MAX_SPELLS = 16
+MAX_ARTIFACTS = SQUARES
+MAX_MINIONS = 8
+NAME_BYTES = 64
+
+HEADER_WORDS = 7
+WIZARD_WORDS = 5 + MAX_SPELLS
+ARTIFACT_WORDS = 4
+MINION_WORDS = 5
+WORDS = HEADER_WORDS + 2 * WIZARD_WORDS + MAX_ARTIFACTS * ARTIFACT_WORDS + MAX_MINIONS * MINION_WORDS
+NAMES_OFFSET = WORDS * 4
+SIZE = NAMES_OFFSET + 2 * NAME_BYTES
+
+_ARTIFACT_IDS = {kind: i for i, kind in enumerate(ARTIFACT_TYPES)}
+_NO_COOLDOWNS = (0,) * MAX_SPELLS
+
+
+class SharedStateBuffer:
+    """One bot input dict at a time in a ``multiprocessing.shared_memory`` block.
+
+    The parent ``write``s the state and tells the worker over a pipe; the worker ``read``s back a
+    dict equal to the one written. ``write`` returns False for a state that does not fit the
+    layout (too many entities, long names, minion ids not of the ``"<owner>-<n>"`` form the engine
+    gives them, ...); send that one over the pipe instead. Register custom spells before workers
+    start, since cooldown names are taken from ``game.rules.SPELL_NAMES`` on the reading side.
+    """
+
+    def __init__(self, name=None):
+        self._shm = shared_memory.SharedMemory(name=name, create=name is None, size=SIZE if name is None else 0)
+        self._words = self._shm.buf[:NAMES_OFFSET].cast("i")
+        self._names = None  # names last written, to skip rewriting them every turn
+
+    @property
+    def name(self):
+        return self._shm.name
+
+    def write(self, state):
+        try:
+            names = (state["self"]["name"], state["opponent"]["name"])
+            if names != self._names:
+                encoded = [name.encode() for name in names]
+                if any(len(e) > NAME_BYTES for e in encoded):
+                    return False
+            words = _encode(state, names)
+        except (KeyError, TypeError, AttributeError, OverflowError):  # not a build_input dict of int32 values
+            return False
+        if words is None:
+            return False
+
+        if names != self._names:
+            buf = self._shm.buf
+            for slot, e in enumerate(encoded):
+                start = NAMES_OFFSET + slot * NAME_BYTES
+                buf[start:start + len(e)] = e
+            self._names = names
+            self._name_lengths = (len(encoded[0]), len(encoded[1]))
+        words[5], words[6] = self._name_lengths
+        self._words[:len(words)] = words
+        return True
+
+    def read(self):
+        words = self._words
+        turn, board_size, n_spells, n_artifacts, n_minions, len1, len2 = words[:HEADER_WORDS].tolist()
+        end = HEADER_WORDS + 2 * WIZARD_WORDS + n_artifacts * ARTIFACT_WORDS + n_minions * MINION_WORDS
+        values = words[HEADER_WORDS:end].tolist()
+        buf = self._shm.buf
+        names = (
+            bytes(buf[NAMES_OFFSET:NAMES_OFFSET + len1]).decode(),
+            bytes(buf[NAMES_OFFSET + NAME_BYTES:NAMES_OFFSET + NAME_BYTES + len2]).decode(),
+        )
+        spell_names = SPELL_NAMES[:n_spells]
+
+        i = 2 * WIZARD_WORDS
+        artifacts = []
+        for _ in range(n_artifacts):
+            kind, x, y, spawn_turn = values[i:i + ARTIFACT_WORDS]
+            artifacts.append({"type": ARTIFACT_TYPES[kind], "position": [x, y], "spawn_turn": spawn_turn})
+            i += ARTIFACT_WORDS
+        minions = []
+        for _ in range(n_minions):
+            owner, number, hp, x, y = values[i:i + MINION_WORDS]
+            owner = names[owner]
+            minions.append({"id": f"{owner}-{number}", "owner": owner, "hp": hp, "position": [x, y]})
+            i += MINION_WORDS
+
+        return {
+            "turn": turn,
+            "board_size": board_size,
+            "self": _wizard(names[0], values, 0, spell_names),
+            "opponent": _wizard(names[1], values, WIZARD_WORDS, spell_names),
+            "artifacts": artifacts,
+            "minions": minions,
+        }
+
+    def close(self):
+        self._words.release()
+        self._shm.close()
+
+    def unlink(self):
+        self._shm.unlink()
+
+
+def _encode(state, names):
+    """Return the int32 words for ``state`` (name lengths left 0), or None if it does not fit."""
+    me, opponent = state["self"], state["opponent"]
+    artifacts, minions = state["artifacts"], state["minions"]
+    n_spells = len(me["cooldowns"])
+    if len(artifacts) > MAX_ARTIFACTS or len(minions) > MAX_MINIONS or n_spells > MAX_SPELLS:
+        return None
+
+    words = array("i", (state["turn"], state["board_size"], n_spells, len(artifacts), len(minions), 0, 0))
+    padding = _NO_COOLDOWNS[n_spells:]
+    for wizard in (me, opponent):
+        position = wizard["position"]
+        words.extend((wizard["hp"], wizard["mana"], position[0], position[1], wizard["shield_active"]))
+        words.extend(wizard["cooldowns"].values())
+        words.extend(padding)
+    for artifact in artifacts:
+        kind = _ARTIFACT_IDS.get(artifact["type"])
+        if kind is None:
+            return None
+        position = artifact["position"]
+        words.extend((kind, position[0], position[1], artifact["spawn_turn"]))
+    for minion in minions:
+        owner = minion["owner"]
+        number = _minion_number(minion["id"], owner)
+        if owner not in names or number is None:
+            return None
+        position = minion["position"]
+        words.extend((names.index(owner), number, minion["hp"], position[0], position[1]))
+    return words
+
+
+def _wizard(name, values, i, spell_names):
+    hp, mana, x, y, shield_active = values[i:i + 5]
+    return {
+        "name": name,
+        "hp": hp,
+        "mana": mana,
+        "position": [x, y],
+        "cooldowns": dict(zip(spell_names, values[i + 5:i + 5 + len(spell_names)])),
+        "shield_active": bool(shield_active),
+    }
+
+
+def _minion_number(minion_id, owner):
+    """Return ``n`` for a minion id of the form ``"<owner>-<n>"``, else None."""
+    prefix = owner + "-"
+    if not isinstance(minion_id, str) or not minion_id.startswith(prefix):
+        return None
+    digits = minion_id[len(prefix):]
+    if not (digits.isascii() and digits.isdigit()) or str(int(digits)) != digits or int(digits) >= 2**31:
+        return None
+    return int(digits)
@@ -0,0 +1,91 @@
+import json
+import sys
+from abc import ABC, abstractmethod
+
+
+class EventSink(ABC):
+    """Destination for GameLogger events.
+
+    The logger buffers events in memory and hands them over in batches at the end of each turn
+    and at the end of the match, so sinks never sit on the per-event hot path; ``flush`` is only
+    called once the match is over. Sinks are context managers that ``close`` on exit.
+    """
+
+    @abstractmethod
+    def write(self, events):
+        """Take a batch of events (a list of dicts)."""
+        pass
+
+    def flush(self):  # noqa: B027 - most sinks hold nothing back
+        """Push out anything the sink holds back."""
+        pass
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class NullSink(EventSink):
+    """Discard every event."""
+
+    def write(self, events):
+        pass
+
+
+class ListSink(EventSink):
+    """Keep events in memory, e.g. for tests or post-match analysis."""
+
+    def __init__(self):
+        self.events = []
+
+    def write(self, events):
+        self.events.extend(events)
+
+
+class ConsoleSink(EventSink):
+    """Print events in the same one-line format the logger used to print directly."""
+
+    def __init__(self, stream=None):
+        self.stream = stream
+
+    def write(self, events):
+        stream = self.stream or sys.stdout
+        stream.write(
+            "".join(f"Turn {e['turn']} | EVENT: {e['event']} | {e['details']}\n" for e in events)
+        )
+
+    def flush(self):
+        (self.stream or sys.stdout).flush()
+
+
+class JsonlFileSink(EventSink):
+    """Append events to a JSON Lines file, one event per line.
+
+    The file is opened on the first write and kept open so that many matches can share one sink;
+    call ``close()`` when done, or use the sink as a context manager.
+    """
+
+    def __init__(self, path, buffer_size=1 << 16):
+        self.path = path
+        self.buffer_size = buffer_size
+        self._file = None
+
+    def write(self, events):
+        if self._file is None:
+            # Kept open across writes and matches; closed by close()
+            self._file = open(self.path, "a", buffering=self.buffer_size, encoding="utf-8")  # noqa: SIM115
+        self._file.writelines(json.dumps(e, default=str) + "\n" for e in events)
+
+    def flush(self):
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
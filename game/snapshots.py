@@ -0,0 +1,118 @@
+from collections.abc import Sequence
+
+# Snapshot policies: how many states a match records.
+SNAPSHOT_ANIMATION = "animation"  # every intermediate state, needed by the Pygame visualizer
+SNAPSHOT_PER_TURN = "per_turn"  # the initial state plus one state at the end of each turn
+SNAPSHOT_NONE = "none"  # no states while playing; run_match keeps only the final summary state
+SNAPSHOT_POLICIES = (SNAPSHOT_ANIMATION, SNAPSHOT_PER_TURN, SNAPSHOT_NONE)
+
+# A full reference map is stored every KEYFRAME_INTERVAL snapshots to bound random-access cost.
+KEYFRAME_INTERVAL = 32
+
+
+def share(value, previous):
+    """Return a private copy of ``value`` that reuses every part equal to ``previous``.
+
+    Unchanged sub-structures (a wizard's cooldowns, an untouched minion, the artifact list) are
+    returned as the previous snapshot's objects instead of being copied again.
+    """
+    if value is previous:
+        return previous
+    if isinstance(value, dict):
+        if isinstance(previous, dict):
+            if value == previous:
+                return previous
+            return {k: share(v, previous.get(k)) for k, v in value.items()}
+        return {k: share(v, None) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        if isinstance(previous, list):
+            if value == previous:
+                return previous
+            shared = [share(v, previous[i] if i < len(previous) else None) for i, v in enumerate(value)]
+        else:
+            shared = [share(v, None) for v in value]
+        return shared if isinstance(value, list) else tuple(shared)
+    return value
+
+
+class SnapshotStore(Sequence):
+    """Append-only list of game states stored as per-field deltas.
+
+    Each appended state records only the top-level fields that changed since the previous one;
+    values are shared with earlier snapshots wherever they are equal. Full dicts are materialised
+    on access and share their sub-structures, so callers must treat them as read-only.
+    """
+
+    def __init__(self):
+        self._deltas = []  # per snapshot: {field: value} for fields that changed
+        self._keyframes = []  # every KEYFRAME_INTERVAL snapshots: full {field: value}
+        self._latest = {}
+        self._cursor = None  # (index, fields) of the last materialised snapshot
+
+    def append(self, state):
+        latest = self._latest
+        delta = {}
+        for key, value in state.items():
+            previous = latest.get(key)
+            shared = share(value, previous)
+            if key in latest and (shared is previous or (not isinstance(shared, (dict, list)) and shared == previous)):
+                continue
+            delta[key] = shared
+        removed = [key for key in latest if key not in state]
+        for key in removed:
+            delta[key] = _REMOVED
+
+        for key, value in delta.items():
+            if value is _REMOVED:
+                del latest[key]
+            else:
+                latest[key] = value
+
+        if len(self._deltas) % KEYFRAME_INTERVAL == 0:
+            self._keyframes.append(dict(latest))
+        self._deltas.append(delta)
+
+    def _fields(self, index):
+        cursor = self._cursor
+        if cursor is not None and cursor[0] == index:
+            return cursor[1]
+        if cursor is not None and cursor[0] == index - 1 and index % KEYFRAME_INTERVAL != 0:
+            fields = dict(cursor[1])
+            start = index
+        else:
+            keyframe = index // KEYFRAME_INTERVAL
+            fields = dict(self._keyframes[keyframe])
+            start = keyframe * KEYFRAME_INTERVAL + 1
+        for delta in self._deltas[start:index + 1]:
+            for key, value in delta.items():
+                if value is _REMOVED:
+                    fields.pop(key, None)
+                else:
+                    fields[key] = value
+        self._cursor = (index, fields)
+        return fields
+
+    def __len__(self):
+        return len(self._deltas)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("snapshot index out of range")
+        return dict(self._fields(index))
+
+    def __iter__(self):
+        fields = {}
+        for delta in self._deltas:
+            for key, value in delta.items():
+                if value is _REMOVED:
+                    fields.pop(key, None)
+                else:
+                    fields[key] = value
+            yield dict(fields)
+
+
+_REMOVED = object()
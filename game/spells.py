@@ -0,0 +1,261 @@
+from abc import ABC, abstractmethod
+
+from game import board
+from game.rules import (
+    BOARD_SIZE,
+    ENTITY_WIZARD,
+    FIREBALL_SPLASH_DAMAGE,
+    MAX_HP,
+    SPELL_COOLDOWNS,
+    SPELL_COSTS,
+    SPELL_IDS,
+    SPELL_NAMES,
+    SPELLS,
+    Spell,
+)
+
+# Handler per spell id; GameEngine.process_spell dispatches through this table
+SPELL_HANDLERS = []
+
+
+class SpellHandler(ABC):
+    """Resolves one spell for ``GameEngine.process_spell``.
+
+    The engine checks mana and cooldown, asks ``check`` whether the cast may go ahead, charges the
+    caster and then calls ``cast``. Targets arrive parsed, as an ``(x, y)`` tuple or None. Numbers
+    from ``game.rules.SPELLS`` are copied onto the handler when it is registered, so casting never
+    looks them up again.
+    """
+
+    name = None
+    targeted = False  # needs a target; game.actions.parse_action drops the spell without one
+    range = None  # Chebyshev range checked with ``in_range``, if the spell has one
+
+    def bind(self, spell_id, params):
+        self.spell_id = spell_id
+        self.params = params
+        self.cost = params["cost"]
+        self.cooldown = params["cooldown"]
+        if self.range is not None:
+            self.range_mask = board.WITHIN[self.range]
+
+    def in_range(self, start, end):
+        x, y = start[0], start[1]
+        ex, ey = end[0], end[1]
+        if 0 <= x < BOARD_SIZE and 0 <= y < BOARD_SIZE and 0 <= ex < BOARD_SIZE and 0 <= ey < BOARD_SIZE:
+            return bool(self.range_mask[x * BOARD_SIZE + y] >> (ex * BOARD_SIZE + ey) & 1)
+        return max(abs(ex - x), abs(ey - y)) <= self.range
+
+    def check(self, _engine, _caster, _target):
+        """Return False to refuse the cast before it is paid for."""
+        return True
+
+    @abstractmethod
+    def cast(self, engine, caster, target):
+        """Apply the spell; return True if it hit something (recorded in GameLogger.spells)."""
+        pass
+
+
+def register_spell(handler, **params):
+    """Install ``handler`` for its spell and return it.
+
+    Registering a handler for an existing spell replaces the built-in one. A new spell needs
+    ``cost`` and ``cooldown`` in ``params``; it is added to ``game.rules.SPELLS`` and gets the next
+    spell id. Wizards look their cooldowns up against the registry, so engines that already exist
+    can cast the new spell too, starting with it ready.
+    """
+    name = handler.name
+    if name not in SPELL_IDS:
+        if "cost" not in params or "cooldown" not in params:
+            raise ValueError(f"New spell {name!r} needs a cost and a cooldown")
+        SPELLS[name] = dict(params)
+        SPELL_IDS[name] = len(SPELL_NAMES)
+        SPELL_NAMES.append(name)
+        SPELL_COSTS.append(params["cost"])
+        SPELL_COOLDOWNS.append(params["cooldown"])
+    spell_id = SPELL_IDS[name]
+    handler.bind(spell_id, SPELLS[name])
+    SPELL_HANDLERS.extend([None] * (spell_id + 1 - len(SPELL_HANDLERS)))
+    SPELL_HANDLERS[spell_id] = handler
+    return handler
+
+
+def unregister_spell(name):
+    """Remove the most recently registered new spell (built-in spells cannot be removed).
+
+    Live wizards keep any cooldown they have on it, which a spell registered later under the same
+    id inherits.
+    """
+    spell_id = SPELL_IDS[name]
+    if spell_id < len(Spell) or spell_id != len(SPELL_NAMES) - 1:
+        raise ValueError(f"Only the last added spell can be removed, not {name!r}")
+    del SPELLS[name], SPELL_IDS[name]
+    SPELL_NAMES.pop()
+    SPELL_COSTS.pop()
+    SPELL_COOLDOWNS.pop()
+    del SPELL_HANDLERS[spell_id:]
+
+
+def _side(entity):
+    """Name of the wizard an entity fights for."""
+    return entity.name if entity.kind == ENTITY_WIZARD else entity.owner
+
+
+class Fireball(SpellHandler):
+    name = "fireball"
+    targeted = True
+    range = SPELLS["fireball"]["range"]
+
+    def bind(self, spell_id, params):
+        super().bind(spell_id, params)
+        self.damage = params["damage"]
+        self.block = SPELLS["shield"]["block"]
+
+    def cast(self, engine, caster, target_pos):
+        logger = engine.logger
+        if not self.in_range(caster.position, target_pos):
+            logger.log(f"{caster.name}'s fireball out of range!")
+            return False
+
+        # Check if any entity (wizard or minion) is at target position
+        target_entity = engine.get_entity_at_position(target_pos)
+        logger.log_event_spell(engine.turn, caster.name, "fireball", target_pos)
+        if target_entity:
+            damage = self.damage
+            if target_entity.kind == ENTITY_WIZARD and target_entity.shield_active:
+                damage = max(0, damage - self.block)
+                target_entity.shield_active = False
+                logger.log_event_shield_down(engine.turn, target_entity.name)
+            target_entity.hp -= damage
+            logger.log_damage(target_pos, damage, target_entity.label)
+            engine.log_entity_damage(target_entity, target_pos, damage)
+            logger.log(f"{target_entity.label} took {damage} damage (HP: {target_entity.hp})")
+            return True
+
+        splash_damage_hit = False
+        # Apply splash damage to occupied adjacent tiles, in DIRECTIONS order
+        for square in board.squares(board.splash(target_pos) & engine.grid.occupied):
+            splash_entity = engine.grid.at_square(square)
+            # Only damage enemy entities
+            if splash_entity and _side(splash_entity) != caster.name:
+                splash_damage_hit = True
+                splash_damage = FIREBALL_SPLASH_DAMAGE
+                if splash_entity.kind == ENTITY_WIZARD and splash_entity.shield_active:
+                    splash_damage = max(0, splash_damage - self.block)
+
+                splash_entity.hp -= splash_damage
+                if splash_damage > 0:
+                    splash_pos = list(divmod(square, BOARD_SIZE))
+                    logger.log_damage(splash_pos, splash_damage, splash_entity.label)
+                    logger.log(f"{splash_entity.label} took {splash_damage} splash damage (HP: {splash_entity.hp})")
+                    engine.log_entity_damage(splash_entity, splash_pos, splash_damage)
+        if not splash_damage_hit:
+            logger.log(f"{caster.name}'s fireball missed!")
+        return False
+
+
+class MeleeAttack(SpellHandler):
+    name = "melee_attack"
+    targeted = True
+
+    def bind(self, spell_id, params):
+        super().bind(spell_id, params)
+        self.damage = params["damage"]
+
+    def check(self, engine, caster, target_pos):
+        if engine.manhattan_dist(caster.position, target_pos) != 1:
+            engine.logger.log(f"{caster.name} tried melee attack but target is not adjacent.")
+            return False
+        return True
+
+    def cast(self, engine, caster, target_pos):
+        logger = engine.logger
+        logger.log_event_spell(engine.turn, caster.name, "melee_attack", target_pos)
+        target_entity = engine.get_entity_at_position(target_pos)
+        if not target_entity:
+            logger.log(f"{caster.name}'s melee attack missed!")
+            return False
+        # Shield doesn't apply to melee attacks
+        target_entity.hp -= self.damage
+        logger.log_damage(target_pos, self.damage, target_entity.label)
+        logger.log(
+            f"{target_entity.label} took {self.damage} damage from {caster.name}'s melee attack "
+            f"(HP: {target_entity.hp})"
+        )
+        engine.log_entity_damage(target_entity, target_pos, self.damage)
+        return True
+
+
+class Shield(SpellHandler):
+    name = "shield"
+
+    def cast(self, engine, caster, _target):
+        caster.shield_active = True
+        engine.logger.log_event_spell(engine.turn, caster.name, "shield", caster.position)
+        return False
+
+
+class Heal(SpellHandler):
+    name = "heal"
+
+    def bind(self, spell_id, params):
+        super().bind(spell_id, params)
+        self.heal = params["heal"]
+
+    def cast(self, engine, caster, _target):
+        caster.hp = min(caster.hp + self.heal, MAX_HP)
+        engine.logger.log(f"{caster.name} healed {self.heal} HP (HP: {caster.hp})")
+        engine.logger.log_event_spell(engine.turn, caster.name, "heal", caster.position)
+        return False
+
+
+class Teleport(SpellHandler):
+    name = "teleport"
+    targeted = True
+    verb = "teleported"
+
+    def reaches(self, _caster, _dest):
+        return True
+
+    def cast(self, engine, caster, dest):
+        dest = [dest[0], dest[1]]
+        if self.reaches(caster, dest) and engine.is_valid_tile(dest):
+            engine.set_position(caster, dest)
+            engine.logger.log(f"{caster.name} {self.verb} to {dest}")
+            engine.logger.log_event_spell(engine.turn, caster.name, self.name, dest)
+
+            artifact = engine.artifacts.check_pickup(caster)
+            if artifact:
+                engine.logger.log_event_artifact_pick_up(engine.turn, caster.name, artifact)
+        return False
+
+
+class Blink(Teleport):
+    name = "blink"
+    verb = "blinked"
+    range = SPELLS["blink"]["distance"]
+
+    def reaches(self, caster, dest):
+        return self.in_range(caster.position, dest)
+
+
+class Summon(SpellHandler):
+    name = "summon"
+
+    def cast(self, engine, caster, _target):
+        # Check if caster already has a minion
+        if any(m.owner == caster.name and m.is_alive() for m in engine.minions):
+            engine.logger.log(f"{caster.name} already has a minion.")
+            return False
+        spawn_pos = engine.get_adjacent_free_tile(caster.position)
+        if not spawn_pos:
+            engine.logger.log(f"{caster.name} tried to summon but no space.")
+            return False
+        engine.summon_minion(caster, spawn_pos)
+        engine.logger.log(f"{caster.name} summoned a minion at {spawn_pos}")
+        engine.logger.log_event_spell(engine.turn, caster.name, "summon", spawn_pos)
+        return False
+
+
+for _handler in (Fireball(), Shield(), Teleport(), Summon(), Heal(), Blink(), MeleeAttack()):
+    register_spell(_handler)
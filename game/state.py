@@ -0,0 +1,41 @@
+from typing import NamedTuple
+
+
+class WizardState(NamedTuple):
+    name: str
+    hp: int
+    mana: int
+    position: tuple
+    cooldowns: tuple  # indexed by spell id (game.rules.Spell)
+    shield_active: bool
+
+
+class MinionState(NamedTuple):
+    id: str
+    owner: str
+    hp: int
+    position: tuple
+    is_ready: bool
+    order: int  # lookup order on shared tiles, see game.board
+
+
+class ArtifactState(NamedTuple):
+    type: str
+    position: tuple
+    spawn_turn: int
+
+
+class GameState(NamedTuple):
+    """Immutable, hashable value of everything the rules read between two turns.
+
+    Produced by ``GameEngine.get_state()`` and consumed by ``GameEngine.set_state()``,
+    ``GameEngine.from_state()`` and ``game.forward.step``.
+    """
+
+    turn: int
+    wizard1: WizardState
+    wizard2: WizardState
+    minions: tuple  # MinionState, in engine order
+    artifacts: tuple  # ArtifactState, in spawn order
+    next_minion_order: int
+    minion_counter: int
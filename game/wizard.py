@@ -1,35 +1,169 @@
-from game.rules import MAX_HP, MAX_MANA, MANA_REGEN, SPELLS
+from game.rules import ENTITY_WIZARD, MANA_REGEN, MAX_HP, MAX_MANA, SPELL_COOLDOWNS, SPELL_COSTS, SPELL_IDS, SPELL_NAMES
+from game.state import WizardState
+from game.zobrist import (
+    WIZARD_HP,
+    WIZARD_MANA,
+    WIZARD_POSITION,
+    WIZARD_SHIELD,
+    cooldown_key,
+    key,
+    position_value,
+    wizard_hash,
+)
+
 
 class Wizard:
+    # Mutable state lives in private slots behind properties so the cached to_dict() template can be
+    # dropped, and the Zobrist hash updated, whenever something changes.
+    __slots__ = ("_cooldowns", "_dict", "_hp", "_mana", "_position", "_shield_active", "name", "zobrist")
+
+    kind = ENTITY_WIZARD
+
     def __init__(self, name, position):
         self.name = name
-        self.hp = MAX_HP
-        self.mana = MAX_MANA
-        self.position = position
-        self.cooldowns = {spell: 0 for spell in SPELLS}
-        self.shield_active = False
+        self._hp = MAX_HP
+        self._mana = MAX_MANA
+        self._position = position
+        # Indexed by spell id (game.rules.Spell). Spells registered after the wizard was created
+        # are past the end and ready; the list grows when one of them is cast.
+        self._cooldowns = [0] * len(SPELL_NAMES)
+        self._shield_active = False
+        self._dict = None
+        self.zobrist = wizard_hash(self._hp, self._mana, position, self._cooldowns, False)
+
+    def copy(self):
+        """Return an independent copy (positions are never mutated in place, so they are shared)."""
+        clone = Wizard.__new__(Wizard)
+        clone.name = self.name
+        clone._hp = self._hp
+        clone._mana = self._mana
+        clone._position = self._position
+        clone._cooldowns = self._cooldowns[:]
+        clone._shield_active = self._shield_active
+        clone._dict = self._dict
+        clone.zobrist = self.zobrist
+        return clone
+
+    def to_state(self):
+        return WizardState(
+            self.name, self._hp, self._mana, (self._position[0], self._position[1]),
+            tuple(self._cooldowns), self._shield_active,
+        )
+
+    @classmethod
+    def from_state(cls, state):
+        wizard = cls.__new__(cls)
+        wizard.name = state.name
+        wizard._hp = state.hp
+        wizard._mana = state.mana
+        wizard._position = list(state.position)
+        wizard._cooldowns = list(state.cooldowns)
+        wizard._shield_active = state.shield_active
+        wizard._dict = None
+        wizard.zobrist = wizard_hash(state.hp, state.mana, state.position, state.cooldowns, state.shield_active)
+        return wizard
+
+    @property
+    def label(self):
+        """Name used in log messages."""
+        return self.name
+
+    @property
+    def hp(self):
+        return self._hp
+
+    @hp.setter
+    def hp(self, value):
+        self.zobrist ^= key(WIZARD_HP, self._hp) ^ key(WIZARD_HP, value)
+        self._hp = value
+        self._dict = None
+
+    @property
+    def mana(self):
+        return self._mana
+
+    @mana.setter
+    def mana(self, value):
+        self.zobrist ^= key(WIZARD_MANA, self._mana) ^ key(WIZARD_MANA, value)
+        self._mana = value
+        self._dict = None
+
+    @property
+    def position(self):
+        return self._position
+
+    @position.setter
+    def position(self, value):
+        self.zobrist ^= key(WIZARD_POSITION, position_value(self._position))
+        self.zobrist ^= key(WIZARD_POSITION, position_value(value))
+        self._position = value
+        self._dict = None
+
+    @property
+    def shield_active(self):
+        return self._shield_active
+
+    @shield_active.setter
+    def shield_active(self, value):
+        self.zobrist ^= key(WIZARD_SHIELD, self._shield_active) ^ key(WIZARD_SHIELD, value)
+        self._shield_active = value
+        self._dict = None
+
+    @property
+    def cooldowns(self):
+        """Remaining cooldown per spell name (a copy; use the wizard's methods to change it)."""
+        return _named_cooldowns(self._cooldowns)
+
+    def cooldown(self, spell_id):
+        cooldowns = self._cooldowns
+        return cooldowns[spell_id] if spell_id < len(cooldowns) else 0
 
     def regen_mana(self):
-        self.mana = min(MAX_MANA, self.mana + MANA_REGEN)
+        self.mana = min(MAX_MANA, self._mana + MANA_REGEN)
 
     def reduce_cooldowns(self):
-        for spell in self.cooldowns:
-            if self.cooldowns[spell] > 0:
-                self.cooldowns[spell] -= 1
+        for spell_id, c in enumerate(self._cooldowns):
+            if c > 0:
+                self.zobrist ^= cooldown_key(spell_id, c) ^ cooldown_key(spell_id, c - 1)
+        self._cooldowns = [c - 1 if c > 0 else 0 for c in self._cooldowns]
+        self._dict = None
 
     def can_cast(self, spell):
-        return self.mana >= SPELLS[spell]["cost"] and self.cooldowns[spell] == 0
+        return self.can_cast_id(SPELL_IDS[spell])
+
+    def can_cast_id(self, spell_id):
+        cooldowns = self._cooldowns
+        return self._mana >= SPELL_COSTS[spell_id] and (spell_id >= len(cooldowns) or cooldowns[spell_id] == 0)
 
     def cast_spell(self, spell):
-        self.mana -= SPELLS[spell]["cost"]
-        self.cooldowns[spell] = SPELLS[spell]["cooldown"]
+        self.cast_spell_id(SPELL_IDS[spell])
+
+    def cast_spell_id(self, spell_id):
+        self.mana = self._mana - SPELL_COSTS[spell_id]
+        cooldowns = self._cooldowns
+        if spell_id >= len(cooldowns):
+            cooldowns.extend([0] * (spell_id + 1 - len(cooldowns)))
+        self.zobrist ^= cooldown_key(spell_id, cooldowns[spell_id]) ^ cooldown_key(spell_id, SPELL_COOLDOWNS[spell_id])
+        cooldowns[spell_id] = SPELL_COOLDOWNS[spell_id]
 
     def to_dict(self):
-        return {
-            "name": self.name,
-            "hp": self.hp,
-            "mana": self.mana,
-            "position": self.position,
-            "cooldowns": self.cooldowns.copy(),
-            "shield_active": self.shield_active
-        }
+        """Return the bot-facing view of the wizard; every call gets its own copy, which bots may modify."""
+        if self._dict is None:
+            self._dict = {
+                "name": self.name,
+                "hp": self._hp,
+                "mana": self._mana,
+                "position": self._position,
+                "cooldowns": _named_cooldowns(self._cooldowns),
+                "shield_active": self._shield_active
+            }
+        view = self._dict.copy()
+        view["position"] = list(self._position)
+        view["cooldowns"] = view["cooldowns"].copy()
+        return view
+
+
+def _named_cooldowns(cooldowns):
+    """Cooldown per spell name, covering every spell registered now (see ``Wizard._cooldowns``)."""
+    missing = len(SPELL_NAMES) - len(cooldowns)
+    return dict(zip(SPELL_NAMES, cooldowns + [0] * missing if missing > 0 else cooldowns))
@@ -0,0 +1,103 @@
+from zlib import crc32
+
+# Zobrist hashing of the rules state. Every (feature, value) pair gets a fixed pseudo-random
+# 64-bit key, and an entity's hash is the XOR of the keys of its current values, so changing one
+# value costs two key lookups and an XOR. Keys come from a seeded mixer, not Python's hash(), and
+# are the same in every process.
+#
+# What is hashed: wizard positions, HP, mana, cooldowns and shields; minion owners, positions,
+# HP and readiness; artifact types and positions; and the parity of the turn. Names, minion ids
+# and spawn turns are not, so states that play out the same way hash the same.
+
+MASK = (1 << 64) - 1
+
+# Features
+WIZARD_HP = 1
+WIZARD_MANA = 2
+WIZARD_POSITION = 3
+WIZARD_SHIELD = 4
+WIZARD_COOLDOWN = 5  # + spell id
+MINION_OWNER = 64
+MINION_HP = 65
+MINION_POSITION = 66
+MINION_READY = 67
+ARTIFACT = 80
+TURN_PARITY = 96
+
+# The second wizard's hash is multiplied by this odd constant (a bijection mod 2**64) so the two
+# wizards can use the same keys and still hash differently when swapped.
+SECOND_WIZARD = 0x9E3779B97F4A7C15
+
+_keys = {}
+
+
+def key(feature, value):
+    """The 64-bit key for ``feature`` having ``value`` (an int)."""
+    k = _keys.get((feature, value))
+    if k is None:
+        k = _keys[(feature, value)] = _mix(_mix(feature) ^ (value & MASK))
+    return k
+
+
+def _mix(x):
+    # splitmix64 finalizer
+    x = (x + 0x9E3779B97F4A7C15) & MASK
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK
+    return x ^ (x >> 31)
+
+
+def position_value(position):
+    return (position[0] << 16) ^ (position[1] & 0xFFFF)
+
+
+def name_value(name):
+    return crc32(name.encode())
+
+
+def cooldown_key(spell_id, cooldown):
+    """Key of a spell's cooldown; a spell that is ready hashes to 0, like one the wizard never had."""
+    return key(WIZARD_COOLDOWN + spell_id, cooldown) if cooldown else 0
+
+
+def wizard_hash(hp, mana, position, cooldowns, shield_active):
+    h = key(WIZARD_HP, hp) ^ key(WIZARD_MANA, mana) ^ key(WIZARD_POSITION, position_value(position))
+    h ^= key(WIZARD_SHIELD, shield_active)
+    for spell_id, cooldown in enumerate(cooldowns):
+        h ^= cooldown_key(spell_id, cooldown)
+    return h
+
+
+def minion_hash(owner, hp, position, is_ready):
+    return (
+        key(MINION_OWNER, name_value(owner)) ^ key(MINION_HP, hp)
+        ^ key(MINION_POSITION, position_value(position)) ^ key(MINION_READY, is_ready)
+    )
+
+
+def artifact_hash(kind, position):
+    return key(ARTIFACT, (name_value(kind) << 32) ^ position_value(position))
+
+
+def combine(turn, wizard1, wizard2, minions, artifacts):
+    """Engine hash from the parts: the two wizard hashes, the minion hashes and the artifact hash."""
+    h = key(TURN_PARITY, turn & 1) ^ wizard1 ^ ((wizard2 * SECOND_WIZARD) & MASK) ^ artifacts
+    for minion in minions:
+        h ^= minion
+    return h
+
+
+def hash_state(state):
+    """Zobrist hash of a ``GameState``, equal to ``GameEngine.zobrist`` for the engine holding it."""
+    artifacts = 0
+    for a in state.artifacts:
+        artifacts ^= artifact_hash(a.type, a.position)
+    return combine(
+        state.turn,
+        wizard_hash(state.wizard1.hp, state.wizard1.mana, state.wizard1.position, state.wizard1.cooldowns,
+                    state.wizard1.shield_active),
+        wizard_hash(state.wizard2.hp, state.wizard2.mana, state.wizard2.position, state.wizard2.cooldowns,
+                    state.wizard2.shield_active),
+        [minion_hash(m.owner, m.hp, m.position, m.is_ready) for m in state.minions],
+        artifacts,
+    )
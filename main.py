@@ -1,22 +1,61 @@
 import argparse
-import importlib
-import inspect
-import os
 import random
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from functools import partial
 from typing import Optional
 
 from bots.bot_interface import BotInterface
+from game.decisions import WORKER_KINDS, WORKER_PROCESS, WORKER_THREAD, DecisionRunner
+from game.replayer import Replayer
+from game.sinks import ConsoleSink
+from game.snapshots import SNAPSHOT_ANIMATION, SNAPSHOT_NONE
+from simulator.bracket import Bracket, pick_lucky_loser
+from simulator.discovery import BotEntry, BotManifest
+from simulator.early_stop import EARLY_STOPS, SPRT, EarlyStop
 from simulator.match import run_match
 from simulator.visualizer import Visualizer
 
+# How run_tournament schedules matches: round by round, or as a dependency graph (simulator.bracket)
+SCHEDULE_ROUNDS = "rounds"
+SCHEDULE_DAG = "dag"
+SCHEDULES = (SCHEDULE_ROUNDS, SCHEDULE_DAG)
 
-def run_tournament(headless: bool = False):
+# A drawn bracket pairing is replayed up to this many times; needing the last replay disqualifies both bots
+MAX_DRAW_REPLAYS = 3
+
+
+def run_tournament(
+    headless: bool = False,
+    decisions: Optional[DecisionRunner] = None,
+    workers: Optional[int] = None,
+    seed: Optional[int] = None,
+    schedule: str = SCHEDULE_ROUNDS,
+):
     """Run a tournament with all bots from the bots folder.
     Returns the winner bot instance and tournament statistics.
 
     Args:
         headless (bool): If True, run without visualization
+        decisions (DecisionRunner): Runs the bots' decisions (time budget, worker processes); its
+            workers are kept for every match of the tournament. Bots decide inline if None.
+        workers (int): Play the pairings of each round on a pool of this many processes, each
+            pairing (draw replays included) with fresh bots, so the results do not depend on the
+            pool size. Without it, matches are played in this process with the same bot objects
+            throughout. The bracket is drawn from ``seed`` either way, so bots that keep no state
+            between matches play the same tournament with or without a pool.
+        seed (int): Seeds the bracket and every pairing (pairing seeds are drawn from it in bracket
+            order); drawn from ``random`` if None.
+        schedule (str): ``"rounds"`` re-pairs the winners once a whole round is over. ``"dag"``
+            fixes the bracket shape up front and starts each match as soon as the two matches
+            feeding it are decided (see ``simulator.bracket.Bracket``); rounds then overlap.
     """
+    if schedule not in SCHEDULES:
+        raise ValueError(f"Unknown schedule: {schedule}")
+    if seed is None:
+        seed = random.getrandbits(64)
+    random.seed(seed)
+    match_seeds = random.Random(seed)
+
     # Step 1: Find and load all bots
     bots = discover_bots()
     print(f"Found {len(bots)} bots for the tournament")
@@ -25,17 +64,31 @@ def run_tournament(headless: bool = False):
 
     # Step 2: Run tournament rounds until we have a winner
     round_num = 1
-    stats = {"matches": [], "rounds": []}
+    stats = {"matches": [], "rounds": [], "seed": seed}
 
     # Keep track of losers and their total turns fought
     losers_stats = {}  # {bot_name: total_turns_fought}
 
+    # Headless runs only need the final state of each match
+    snapshot_policy = SNAPSHOT_NONE if headless else SNAPSHOT_ANIMATION
+
+    own_decisions = decisions is None
+    if own_decisions:
+        decisions = DecisionRunner()
+    pool = ProcessPoolExecutor(max_workers=workers) if workers else None
+
+    if schedule == SCHEDULE_DAG:
+        bracket = Bracket(bots, match_seeds)
+        run_bracket(bracket, pool, decisions, snapshot_policy, losers_stats, stats, headless)
+        bots = [] if bracket.final is None or bracket.final.winner is None else [bracket.final.winner]
+
     while len(bots) > 1:
         print(f"\n=== Round {round_num} ===")
         print(f"{len(bots)} bots competing in this round")
 
-        # Create pairs for this round
-        pairs, lucky_loser = create_pairs(bots, losers_stats)
+        # Create pairs for this round; the global random is reseeded by in-process games only, so the
+        # bracket draws from the tournament's own RNG to come out the same with and without workers
+        pairs, lucky_loser = create_pairs(bots, losers_stats, match_seeds)
 
         # Store round information
         round_info = {
@@ -50,164 +103,302 @@ def run_tournament(headless: bool = False):
 
         # Run matches and collect winners
         winners = []
-        for b1, b2 in pairs:
+        seeds = [match_seeds.getrandbits(64) for _ in pairs]
+        if pool is not None:
+            tasks = [
+                None if b2 is None else pool.submit(
+                    play_pairing_task, type(b1), type(b2), pair_seed, decision_settings(decisions), not headless
+                )
+                for (b1, b2), pair_seed in zip(pairs, seeds)
+            ]
+        for i, (b1, b2) in enumerate(pairs):
             if b2 is None:  # Odd number of bots, b1 gets a bye
                 winners.append(b1)
                 print(f"{b1.name} gets a bye")
                 continue
 
             print(f"Match: {b1.name} vs {b2.name}")
-            winner, logger = run_match(b1, b2)
-
-            turns_fought = logger.get_snapshots()[-1]["turn"]  # Get the last turn number
-            snapshots = logger.get_snapshots()
+            if pool is None:
+                games = play_pairing(b1, b2, snapshot_policy, decisions, seeds[i])
+            else:
+                games = collect_pairing(tasks[i].result(), b1, b2, decisions)
 
-            if not headless:
-                visualizer = Visualizer(logger, b1, b2)
-                visualizer.run(snapshots, len(bots) > 2)
+            winner, _losses = record_pairing(round_num, b1, b2, games, losers_stats, stats, headless, len(bots) > 2)
+            if winner is not None:
+                winners.append(winner)
 
-            draw_counter = 0
-            while winner == "Draw":
-                draw_counter += 1
-                print("Match ended in a draw")
-                winner, logger = run_match(b1, b2)
+        # Update bots for next round
+        bots = winners
+        round_num += 1
 
-                snapshots = logger.get_snapshots()
+    # Tournament complete
+    winner = bots[0] if bots else None
+    if winner is not None:
+        print(f"\n🏆 Tournament Winner: {winner.name} 🏆")
+    else:
+        print("\nNo tournament winner: every finalist was disqualified")
+    if pool is not None:
+        pool.shutdown()
+    if own_decisions:
+        decisions.close()
+    stats["overruns"] = dict(decisions.overruns)
+    print_decision_problems(decisions)
 
-                if not headless:
-                    visualizer = Visualizer(logger, b1, b2)
-                    visualizer.run(snapshots, len(bots) > 2)
+    return winner, stats
 
-                if draw_counter > 2:
-                    break
-                continue
 
-            if draw_counter <= 2:
-                # Update losers stats
-                loser = b2 if winner == b1 else b1
-                losers_stats[loser.name] = losers_stats.get(loser.name, 0) + turns_fought
-
-                # Store match information
-                match_info = {
-                    "round": round_num,
-                    "bot1": b1.name,
-                    "bot2": b2.name,
-                    "winner": winner,
-                    "turns": turns_fought,
-                }
-                stats["matches"].append(match_info)
+def run_bracket(
+    bracket: Bracket,
+    pool: Optional[ProcessPoolExecutor],
+    decisions: DecisionRunner,
+    snapshot_policy: str,
+    losers_stats: dict[str, int],
+    stats: dict,
+    headless: bool,
+):
+    """Play a ``Bracket`` to the end, starting every match as soon as it is ready.
 
-                winners.append(winner)
-                print(f"Winner: {winner.name} after {turns_fought} turns")
+    With a ``pool`` the ready matches run concurrently and are booked as they finish; without one
+    they are played here in bracket order. Rounds are added to ``stats["rounds"]`` once complete.
+    """
+    running = {}  # future -> node
+    booked_rounds = 0
+    while not bracket.done:
+        ready = bracket.ready()
+        for node in ready:
+            entrants = bracket.start(node)
+            if node.done:
+                if node.winner is not None:
+                    print(f"{node.winner.name} gets a bye (round {node.round})")
+            elif pool is not None:
+                b1, b2 = entrants
+                future = pool.submit(
+                    play_pairing_task, type(b1), type(b2), node.seed, decision_settings(decisions), not headless
+                )
+                running[future] = node
             else:
-                print(f"Too many draws, spell casters {b1.name} and  {b2.name} are disqualified")
-                losers_stats[b1.name] = losers_stats.get(b1.name, 0) + turns_fought
-                losers_stats[b2.name] = losers_stats.get(b2.name, 0) + turns_fought
-                match_info = {
-                    "round": round_num,
-                    "bot1": b1.name,
-                    "bot2": b2.name,
-                    "winner": "NONE",
-                    "turns": turns_fought,
-                }
-            stats["matches"].append(match_info)
+                b1, b2 = entrants
+                print(f"Round {node.round} match: {b1.name} vs {b2.name}")
+                games = play_pairing(b1, b2, snapshot_policy, decisions, node.seed)
+                winner, losses = record_pairing(
+                    node.round, b1, b2, games, losers_stats, stats, headless, node is not bracket.final
+                )
+                bracket.finish(node, winner, losses)
+
+        if running:
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in sorted(finished, key=lambda f: (running[f].round, running[f].index)):
+                node = running.pop(future)
+                b1, b2 = node.entrants
+                print(f"Round {node.round} match: {b1.name} vs {b2.name}")
+                games = collect_pairing(future.result(), b1, b2, decisions)
+                winner, losses = record_pairing(
+                    node.round, b1, b2, games, losers_stats, stats, headless, node is not bracket.final
+                )
+                bracket.finish(node, winner, losses)
+        elif not ready and not bracket.done:
+            raise RuntimeError("Bracket has no match ready to play")
+
+        while booked_rounds < len(bracket.rounds) and bracket.round_done(booked_rounds + 1):
+            booked_rounds += 1
+            nodes = bracket.rounds[booked_rounds - 1]
+            lucky_losers = [node.lucky_loser for node in nodes if node.lucky_loser is not None]
+            stats["rounds"].append({
+                "round": booked_rounds,
+                "participants": [bot.name for bot in bracket.participants(booked_rounds)],
+                "pairs": [
+                    (node.entrants[0].name, node.entrants[1].name if len(node.entrants) > 1 else None)
+                    for node in nodes if node.entrants
+                ],
+                "lucky_loser": lucky_losers[0].name if lucky_losers else None,
+            })
+
+
+def record_pairing(
+    round_num: int,
+    b1: BotInterface,
+    b2: BotInterface,
+    games: list,
+    losers_stats: dict[str, int],
+    stats: dict,
+    headless: bool,
+    more_to_come: bool,
+):
+    """Show and book the games of a bracket pairing (see ``play_pairing``).
 
-        # Update bots for next round
-        bots = winners
-        round_num += 1
+    Updates ``losers_stats`` and ``stats["matches"]`` and returns the winner (None when both bots
+    are disqualified) with the ``(name, turns fought)`` of each loser.
+    """
+    turns_fought = games[0][1]
+    winner = games[-1][0]
+    for game_num, (_winner, _turns, logger) in enumerate(games):
+        if not headless:
+            visualizer = Visualizer(logger, b1, b2)
+            visualizer.run(logger.get_snapshots(), more_to_come)
+        if game_num < len(games) - 1:
+            print("Match ended in a draw")
+    draw_counter = len(games) - 1
+
+    if draw_counter < MAX_DRAW_REPLAYS:
+        # Update losers stats
+        loser = b2 if winner == b1 else b1
+        losers_stats[loser.name] = losers_stats.get(loser.name, 0) + turns_fought
+        losses = [(loser.name, turns_fought)]
+
+        # Store match information
+        match_info = {
+            "round": round_num,
+            "bot1": b1.name,
+            "bot2": b2.name,
+            "winner": winner,
+            "turns": turns_fought,
+        }
+        stats["matches"].append(match_info)
 
-    # Tournament complete
-    winner = bots[0]
-    print(f"\n🏆 Tournament Winner: {winner.name} 🏆")
+        print(f"Winner: {winner.name} after {turns_fought} turns")
+    else:
+        print(f"Too many draws, spell casters {b1.name} and  {b2.name} are disqualified")
+        losers_stats[b1.name] = losers_stats.get(b1.name, 0) + turns_fought
+        losers_stats[b2.name] = losers_stats.get(b2.name, 0) + turns_fought
+        losses = [(b1.name, turns_fought), (b2.name, turns_fought)]
+        winner = None
+        match_info = {
+            "round": round_num,
+            "bot1": b1.name,
+            "bot2": b2.name,
+            "winner": "NONE",
+            "turns": turns_fought,
+        }
+    stats["matches"].append(match_info)
+    return winner, losses
 
-    return winner, stats
+
+def play_pairing(b1: BotInterface, b2: BotInterface, snapshot_policy: str, decisions: DecisionRunner, seed=None):
+    """Play a bracket pairing, replaying draws, and return ``(winner, turns, logger)`` for each game.
+
+    Drawn games are replayed up to ``MAX_DRAW_REPLAYS`` times. With a ``seed`` every game gets its
+    own seed drawn from it, which also seeds the global ``random`` module for the bots.
+    """
+    seeds = random.Random(seed) if seed is not None else None
+    games = []
+    while not games or (games[-1][0] == "Draw" and len(games) <= MAX_DRAW_REPLAYS):
+        game_seed = seeds.getrandbits(64) if seeds is not None else None
+        if game_seed is not None:
+            random.seed(game_seed)  # for bots that draw from the global random module
+        winner, logger = run_match(b1, b2, snapshot_policy=snapshot_policy, decisions=decisions, seed=game_seed)
+        games.append((winner, logger.get_snapshots()[-1]["turn"], logger))
+    return games
+
+
+def play_pairing_task(bot1_class: type, bot2_class: type, seed: int, settings: dict, keep_replays: bool):
+    """Pool side of ``run_tournament(workers=...)``: play a pairing between fresh bots.
+
+    Returns each game's winner slot (1, 2 or "Draw"), turns and replay (when ``keep_replays``),
+    plus the decision overruns and crashes, which are all cheap to send back.
+    """
+    b1, b2 = bot1_class(), bot2_class()
+    decisions = DecisionRunner(**settings)
+    try:
+        games = play_pairing(b1, b2, SNAPSHOT_NONE, decisions, seed)
+    finally:
+        decisions.close()
+    slots = {id(b1): 1, id(b2): 2}
+    results = [
+        (slots.get(id(winner), winner), turns, logger.replay if keep_replays else None)
+        for winner, turns, logger in games
+    ]
+    return results, decisions.overruns, decisions.crashes
+
+
+def collect_pairing(result, b1: BotInterface, b2: BotInterface, decisions: DecisionRunner):
+    """Turn a ``play_pairing_task`` result back into ``play_pairing``'s games for ``b1`` and ``b2``."""
+    results, overruns, crashes = result
+    decisions.overruns.update(overruns)
+    decisions.crashes.update(crashes)
+    bots = {1: b1, 2: b2}
+    return [
+        (bots.get(slot, slot), turns, None if replay is None else Replayer(replay).logger())
+        for slot, turns, replay in results
+    ]
+
+
+def decision_settings(decisions: DecisionRunner) -> dict:
+    """Keyword arguments that build a DecisionRunner like ``decisions`` (e.g. in a worker process)."""
+    return {
+        "timeout": decisions.timeout,
+        "cpu_timeout": decisions.cpu_timeout,
+        "default_action": decisions.default_action,
+        "parallel": decisions.parallel,
+        "workers": decisions.workers,
+        "memory_limit_mb": decisions.memory_limit_mb,
+    }
 
 
 def discover_bots() -> list[BotInterface]:
     """Discover and instantiate all bots in the bots directory."""
+    manifest = BotManifest()
+    entries = manifest.entries()
+    print_discovery_errors(manifest)
     bots = []
-    bots_dir = "bots"
-
-    # Skip these directories as they don't contain bot implementations
-    skip_dirs = {"__pycache__", "bot_interface"}
-
-    for root, dirs, files in os.walk(bots_dir):
-        # Skip interface and __pycache__ directories
-        dirs[:] = [d for d in dirs if d not in skip_dirs]
-
-        for file in files:
-            if file.endswith(".py") and not file.startswith("__"):
-                # Construct the module path
-                relative_path = os.path.relpath(root, os.getcwd())
-                module_path = relative_path.replace(os.sep, ".") + "." + file[:-3]
-
-                try:
-                    # Import the module
-                    module = importlib.import_module(module_path)
-
-                    # Find classes that inherit from BotInterface
-                    for _name, obj in inspect.getmembers(module):
-                        if (
-                            inspect.isclass(obj)
-                            and issubclass(obj, BotInterface)
-                            and obj.__module__ == module_path
-                            and not inspect.isabstract(obj)
-                        ):
-                            # Instantiate the bot and add to the list
-                            bot_instance = obj()
-                            bots.append(bot_instance)
-
-                except Exception as e:
-                    print(f"Error loading bot from {module_path}: {e}")
-
+    for entry in entries:
+        bot = load_bot(manifest, entry)
+        if bot is not None:
+            bots.append(bot)
     return bots
 
 
-def find_bot_by_name(name: str) -> Optional[BotInterface]:
+def find_bot_by_name(name: str, manifest: Optional[BotManifest] = None) -> Optional[BotInterface]:
     """Find and instantiate a bot by its name.
+    Only the module of the matching bot is imported (see ``BotManifest``).
     Returns None if no bot with the given name is found.
     """
-    all_bots = discover_bots()
-    for bot in all_bots:
-        if bot.name.lower() == name.lower():
-            return bot
-    return None
+    manifest = manifest or BotManifest()
+    entry = manifest.find(name)
+    print_discovery_errors(manifest)
+    if entry is None:
+        return None
+    return load_bot(manifest, entry)
+
+
+def load_bot(manifest: BotManifest, entry: BotEntry) -> Optional[BotInterface]:
+    try:
+        return manifest.load(entry)
+    except Exception as e:
+        print(f"Error loading bot from {entry.module}: {e}")
+        return None
+
+
+def print_discovery_errors(manifest: BotManifest):
+    for module_path, e in manifest.errors:
+        print(f"Error loading bot from {module_path}: {e}")
 
 
 def list_available_bots():
-    """List all available bots in the bots directory."""
-    bots = discover_bots()
-    print(f"Found {len(bots)} bots:")
-    for bot in bots:
-        print(f"- {bot.name}")
-    return bots
+    """List all available bots in the bots directory, by name, without importing them."""
+    manifest = BotManifest()
+    entries = manifest.entries()
+    print_discovery_errors(manifest)
+    print(f"Found {len(entries)} bots:")
+    for entry in entries:
+        print(f"- {entry.name}")
+    return entries
 
 
 def create_pairs(
-    bots: list[BotInterface], losers_stats: dict[str, int]
+    bots: list[BotInterface], losers_stats: dict[str, int], rng: random.Random = random
 ) -> tuple[list[tuple[BotInterface, Optional[BotInterface]]], Optional[BotInterface]]:
     """Create pairs of bots for matches.
-    Returns a list of pairs and the lucky loser bot (if needed).
+    Returns a list of pairs and the lucky loser bot (if needed). The shuffle and the lucky-loser
+    pick draw from ``rng``.
     """
     # Make a copy and shuffle to create random pairs
-    random.shuffle(bots)
+    rng.shuffle(bots)
     pairs = []
     lucky_loser = None
 
     # If odd number of bots, we need to find a "lucky loser"
-    if len(bots) % 2 != 0 and losers_stats:
-        # Find losers with the highest number of turns fought
-        max_turns = max(losers_stats.values())
-        candidates = [name for name, turns in losers_stats.items() if turns == max_turns]
-
-        # Randomly select one if multiple candidates
-        lucky_loser_name = random.choice(candidates)
-
-        # Find the bot instance with this name
-        for bot in bots:
-            if bot.name == lucky_loser_name:
-                lucky_loser = bot
-                break
+    if len(bots) % 2 != 0:
+        lucky_loser = pick_lucky_loser(bots, losers_stats, rng)
 
     # Create pairs
     for i in range(0, len(bots), 2):
@@ -230,6 +421,10 @@ def run_single_match(
     headless: bool = False,
     count: int = 1,
     graph: bool = False,
+    decisions: Optional[DecisionRunner] = None,
+    workers: Optional[int] = None,
+    seed: Optional[int] = None,
+    early_stop: Optional[EarlyStop] = None,
 ):
     """Run matches between two bots with the given names.
 
@@ -240,9 +435,24 @@ def run_single_match(
         headless (bool): Whether to run without visualization
         count (int): Number of matches to run
         graph (bool): Whether to display a graph of wins/losses over time
+        decisions (DecisionRunner): Runs the bots' decisions (time budget, worker processes); its
+            workers are kept for every match of the series. Bots decide inline if None.
+        workers (int): Play the matches on a pool of this many processes. Every match is played
+            by a fresh pair of bots, so a seed gives the same series whatever the worker count;
+            results are still counted and shown in match order, and verbose logs are rebuilt here
+            from each match's replay. Without it, one pair of bots plays every match here, so bots
+            that learn between games can do differently than on the pool.
+        seed (int): Seeds the series; every match gets its own seed drawn from it. Drawn from
+            ``random`` if None.
+        early_stop (EarlyStop): Sequential test fed every result in match order; the series stops
+            as soon as it is decided, ``count`` being the most games played.
+
+    Returns the series statistics (wins, draws, total turns and ``match_results``, the result of
+    each match played in order), or None if the bots or count were not valid.
     """
-    bot1 = find_bot_by_name(bot1_name)
-    bot2 = find_bot_by_name(bot2_name)
+    manifest = BotManifest()
+    bot1 = find_bot_by_name(bot1_name, manifest)
+    bot2 = find_bot_by_name(bot2_name, manifest)
 
     if not bot1:
         print(f"Bot '{bot1_name}' not found. Use 'python main.py match list' to see available bots.")
@@ -257,8 +467,30 @@ def run_single_match(
         return
 
     # Stats for multiple matches
-    stats = {"bot1_wins": 0, "bot2_wins": 0, "draws": 0, "total_turns": 0}
-    match_results = []  # Track results for each match: 'bot1', 'bot2', or 'draw'
+    stats = {"bot1_wins": 0, "bot2_wins": 0, "draws": 0, "total_turns": 0, "match_results": []}
+    match_results = stats["match_results"]  # Track results for each match: 'bot1', 'bot2', or 'draw'
+    own_decisions = decisions is None
+    if own_decisions:
+        decisions = DecisionRunner()
+
+    if seed is None:
+        seed = random.getrandbits(64)
+    series_seeds = random.Random(seed)
+    seeds = [series_seeds.getrandbits(64) for _ in range(count)]
+    # Only visualize if not headless and (single match or last match in a series)
+    visualize_flags = [
+        not headless and (count == 1 or (match_num == count and count <= 5)) for match_num in range(1, count + 1)
+    ]
+
+    pool = None
+    if workers:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        # Workers only send replays back; the parent shows and prints the matches in order
+        results = pool.map(
+            partial(play_series_match, type(bot1), type(bot2), decision_settings(decisions)),
+            seeds,
+            [visualize or verbose for visualize in visualize_flags],
+        )
 
     for match_num in range(1, count + 1):
         if count > 1:
@@ -266,60 +498,183 @@ def run_single_match(
         else:
             print(f"Match: {bot1.name} vs {bot2.name}")
 
-        winner, logger = run_match(bot1, bot2, verbose=verbose)
+        visualize = visualize_flags[match_num - 1]
+        if pool is None:
+            snapshot_policy = SNAPSHOT_ANIMATION if visualize else SNAPSHOT_NONE
+            winner, turns_fought, logger = play_series_game(
+                bot1, bot2, decisions, seeds[match_num - 1], snapshot_policy, verbose
+            )
+        else:
+            slot, turns_fought, replay, overruns, crashes = next(results)
+            winner = {1: bot1, 2: bot2}.get(slot, slot)
+            logger = None
+            if replay is not None:
+                logger = Replayer(replay).logger(
+                    SNAPSHOT_ANIMATION if visualize else SNAPSHOT_NONE, sinks=[ConsoleSink()] if verbose else None
+                )
+                if verbose:
+                    logger.print_log()
+            decisions.overruns.update(overruns)
+            decisions.crashes.update(crashes)
 
-        turns_fought = logger.get_snapshots()[-1]["turn"]  # Get the last turn number
         stats["total_turns"] += turns_fought
 
         if winner == bot1:
             stats["bot1_wins"] += 1
             match_results.append('bot1')
-            if hasattr(bot1, 'game_over'):
-                bot1.game_over(True)
-            if hasattr(bot2, 'game_over'):
-                bot2.game_over(False)
         elif winner == bot2:
             stats["bot2_wins"] += 1
             match_results.append('bot2')
-            if hasattr(bot1, 'game_over'):
-                bot1.game_over(False)
-            if hasattr(bot2, 'game_over'):
-                bot2.game_over(True)
         else:
             stats["draws"] += 1
             match_results.append('draw')
-            if hasattr(bot1, 'game_over'):
-                bot1.game_over(False)
-            if hasattr(bot2, 'game_over'):
-                bot2.game_over(False)
 
-        # Only visualize if not headless and (single match or last match in a series)
-        if not headless and (count == 1 or (match_num == count and count <= 5)):
+        if visualize:
             snapshots = logger.get_snapshots()
             visualizer = Visualizer(logger, bot1, bot2)
             visualizer.run(snapshots, False)
 
         print(f"Winner: {winner.name if winner != 'Draw' else 'Draw'} after {turns_fought} turns")
 
+        if early_stop is not None and early_stop.add(match_results[-1]):
+            break
+
+    if pool is not None:
+        pool.shutdown(cancel_futures=True)
+    if own_decisions:
+        decisions.close()
+    print_decision_problems(decisions)
+
     # Print stats summary for multiple matches
     if count > 1:
         print("\n" + "=" * 50)
-        print(f"MATCH RESULTS: {bot1.name} vs {bot2.name} ({count} matches)")
+        played = len(match_results)
+        print(f"MATCH RESULTS: {bot1.name} vs {bot2.name} ({played} matches)")
         print("=" * 50)
-        bot1_win_pct = (stats["bot1_wins"] / count) * 100
-        bot2_win_pct = (stats["bot2_wins"] / count) * 100
-        draws_pct = (stats["draws"] / count) * 100
-        avg_turns = stats["total_turns"] / count
+        bot1_win_pct = (stats["bot1_wins"] / played) * 100
+        bot2_win_pct = (stats["bot2_wins"] / played) * 100
+        draws_pct = (stats["draws"] / played) * 100
+        avg_turns = stats["total_turns"] / played
 
         print(f"{bot1.name}: {stats['bot1_wins']} wins ({bot1_win_pct:.1f}%)")
         print(f"{bot2.name}: {stats['bot2_wins']} wins ({bot2_win_pct:.1f}%)")
         print(f"Draws: {stats['draws']} ({draws_pct:.1f}%)")
         print(f"Average match length: {avg_turns:.1f} turns")
+        if early_stop is not None:
+            print_early_stop(early_stop, bot1.name, bot2.name, count)
 
         # Display graph if requested
         if graph:
             display_match_graph(match_results, bot1.name, bot2.name)
 
+    return stats
+
+
+def print_early_stop(early_stop: EarlyStop, bot1_name: str, bot2_name: str, count: int):
+    """Report where the sequential test stopped and the interval it reached."""
+    low, high = early_stop.interval()
+    if early_stop.decision is None:
+        print(f"Early stop ({early_stop.name}): undecided after all {early_stop.games} games")
+    else:
+        print(
+            f"Early stop ({early_stop.name}): {early_stop.conclusion(bot1_name, bot2_name)}, "
+            f"decided after {early_stop.games} of {count} games"
+        )
+    print(
+        f"{bot1_name} won {low:.1%} to {high:.1%} of decisive games "
+        f"({early_stop.confidence:.0%} Wilson interval, {early_stop.decisive} decisive games)"
+    )
+
+
+def make_early_stop(args: argparse.Namespace) -> Optional[EarlyStop]:
+    """Build the sequential test for the command line options, if one was asked for."""
+    method = getattr(args, "early_stop", None)
+    if method is None:
+        return None
+    if method == SPRT.name:
+        return SPRT(confidence=args.confidence, margin=args.sprt_margin)
+    return EARLY_STOPS[method](confidence=args.confidence)
+
+
+def play_series_game(
+    bot1: BotInterface, bot2: BotInterface, decisions: DecisionRunner, seed: int, snapshot_policy: str, verbose: bool
+):
+    """Play one match of a ``run_single_match`` series and tell the bots how it went.
+
+    Returns the winner (a bot or ``"Draw"``), the turns fought and the match logger.
+    """
+    random.seed(seed)  # for bots that draw from the global random module
+
+    # Stream game events to the console only when asked for detailed logs
+    sinks = [ConsoleSink()] if verbose else None
+
+    winner, logger = run_match(
+        bot1, bot2, verbose=verbose, snapshot_policy=snapshot_policy, sinks=sinks, decisions=decisions, seed=seed
+    )
+    turns_fought = logger.get_snapshots()[-1]["turn"]  # Get the last turn number
+    decisions.game_over(bot1, winner == bot1)
+    decisions.game_over(bot2, winner == bot2)
+    return winner, turns_fought, logger
+
+
+def play_series_match(bot1_class: type, bot2_class: type, settings: dict, seed: int, keep_replay: bool):
+    """Pool side of ``run_single_match(workers=...)``: play one match between fresh bots.
+
+    Returns the winner slot (1, 2 or "Draw"), the turns fought, the replay (when ``keep_replay``)
+    and the decision overruns and crashes of this match. Nothing is printed here, so workers'
+    logs cannot interleave; the parent prints them from the replay.
+    """
+    bot1, bot2 = bot1_class(), bot2_class()
+    decisions = DecisionRunner(**settings)
+    try:
+        winner, turns_fought, logger = play_series_game(bot1, bot2, decisions, seed, SNAPSHOT_NONE, False)
+    finally:
+        decisions.close()
+    slot = 1 if winner is bot1 else 2 if winner is bot2 else winner
+    replay = logger.replay if keep_replay else None
+    return slot, turns_fought, replay, decisions.overruns, decisions.crashes
+
+
+def add_decision_arguments(parser: argparse.ArgumentParser):
+    """Add the options that control how bots' decisions are run."""
+    parser.add_argument(
+        "--bot-timeout", type=float, default=None, help="Seconds a bot may take per decision before it idles the turn"
+    )
+    parser.add_argument(
+        "--parallel-decide", choices=WORKER_KINDS, default=None,
+        help="Let both bots decide at once on threads or processes",
+    )
+    parser.add_argument(
+        "--isolate-bots", action="store_true", help="Run each bot in its own long-lived worker process"
+    )
+    parser.add_argument(
+        "--bot-memory-mb", type=int, default=None, help="Memory limit for each bot worker process (with --isolate-bots)"
+    )
+
+
+def make_decision_runner(args: argparse.Namespace) -> DecisionRunner:
+    """Build the DecisionRunner for the command line options (inline decide when none is given)."""
+    if getattr(args, "isolate_bots", False):
+        workers = WORKER_PROCESS
+    else:
+        workers = getattr(args, "parallel_decide", None) or WORKER_THREAD
+    timeout = getattr(args, "bot_timeout", None)
+    return DecisionRunner(
+        timeout=timeout,
+        cpu_timeout=timeout,
+        parallel=getattr(args, "parallel_decide", None) is not None,
+        workers=workers,
+        memory_limit_mb=getattr(args, "bot_memory_mb", None),
+    )
+
+
+def print_decision_problems(decisions: DecisionRunner):
+    """Report bots that went over their decision time budget or whose worker process died."""
+    for name, count in decisions.overruns.items():
+        print(f"{name} overran its decision time budget {count} time(s) and idled instead")
+    for name, count in decisions.crashes.items():
+        print(f"{name}'s worker process died {count} time(s); it idled those turns")
+
 
 def display_match_graph(match_results: list[str], bot1_name: str, bot2_name: str):
     """Display a text-based graph showing wins/losses over the course of matches.
@@ -464,6 +819,15 @@ def parse_arguments():
     # Tournament command
     tournament_parser = subparsers.add_parser("tournament", help="Run a full tournament with all bots")
     tournament_parser.add_argument("--headless", action="store_true", help="Run without visualization")
+    tournament_parser.add_argument(
+        "--workers", "-w", type=int, default=None, help="Play each round's matches on this many worker processes"
+    )
+    tournament_parser.add_argument("--seed", type=int, default=None, help="Seed for the bracket and every match")
+    tournament_parser.add_argument(
+        "--schedule", choices=SCHEDULES, default=SCHEDULE_ROUNDS,
+        help="Pair winners round by round, or start each match as soon as its feeder matches finish",
+    )
+    add_decision_arguments(tournament_parser)
 
     # Match command
     match_parser = subparsers.add_parser("match", help="Run a single match between two bots or list available bots")
@@ -473,6 +837,22 @@ def parse_arguments():
     match_parser.add_argument("--headless", action="store_true", help="Run without visualization")
     match_parser.add_argument("--count", "-c", type=int, default=1, help="Number of matches to run")
     match_parser.add_argument("--graph", "-g", action="store_true", help="Display a graph of wins/losses over matches")
+    match_parser.add_argument(
+        "--workers", "-w", type=int, default=None, help="Play the matches on this many worker processes"
+    )
+    match_parser.add_argument("--seed", type=int, default=None, help="Seed for the series of matches")
+    match_parser.add_argument(
+        "--early-stop", choices=sorted(EARLY_STOPS), default=None,
+        help="Stop the series once a sequential test decides which bot is stronger (--count is the maximum)",
+    )
+    match_parser.add_argument(
+        "--confidence", type=float, default=0.95, help="Confidence level for --early-stop (default 0.95)"
+    )
+    match_parser.add_argument(
+        "--sprt-margin", type=float, default=0.1,
+        help="SPRT compares decisive win rates of 50%% plus and minus this margin (default 0.1)",
+    )
+    add_decision_arguments(match_parser)
 
     return parser.parse_args()
 
@@ -484,7 +864,14 @@ def main():
     if args.command == "tournament" or args.command is None:
         # Run the full tournament
         headless = getattr(args, "headless", False)
-        winner, stats = run_tournament(headless=headless)
+        decisions = make_decision_runner(args)
+        try:
+            winner, stats = run_tournament(
+                headless=headless, decisions=decisions, workers=getattr(args, "workers", None),
+                seed=getattr(args, "seed", None), schedule=getattr(args, "schedule", SCHEDULE_ROUNDS),
+            )
+        finally:
+            decisions.close()
         print(f"Tournament completed with {len(stats['matches'])} matches across {len(stats['rounds'])} rounds")
 
     elif args.command == "match":
@@ -496,10 +883,23 @@ def main():
             headless = getattr(args, "headless", False)
             count = getattr(args, "count", 1)
             graph = getattr(args, "graph", False)
-            run_single_match(args.bot1, args.bot2, args.verbose, headless=headless, count=count, graph=graph)
+            decisions = make_decision_runner(args)
+            try:
+                run_single_match(
+                    args.bot1, args.bot2, args.verbose, headless=headless, count=count, graph=graph,
+                    decisions=decisions, workers=getattr(args, "workers", None), seed=getattr(args, "seed", None),
+                    early_stop=make_early_stop(args),
+                )
+            finally:
+                decisions.close()
         else:
             print("Please provide two bot names or use 'list' to see available bots.")
-            print("Usage: python main.py match <bot1> <bot2> [--headless] [--verbose] [--count N] [--graph]")
+            print(
+                "Usage: python main.py match <bot1> <bot2> [--headless] [--verbose] [--count N] [--graph]\n"
+                "           [--workers N] [--seed SEED] [--early-stop sprt|wilson] [--confidence C]\n"
+                "           [--sprt-margin M] [--bot-timeout S] [--parallel-decide thread|process]\n"
+                "           [--isolate-bots] [--bot-memory-mb MB]"
+            )
             print("       python main.py match list")
 
 
@@ -0,0 +1,147 @@
+import random
+
+
+def pick_lucky_loser(participants, losers_stats, rng=random):
+    """The bracket's lucky loser for an odd round: a loser with the most turns fought, looked up
+    among ``participants`` by name. Returns None (a bye) when there is none."""
+    if not losers_stats:
+        return None
+    # Find losers with the highest number of turns fought
+    max_turns = max(losers_stats.values())
+    candidates = [name for name, turns in losers_stats.items() if turns == max_turns]
+
+    # Randomly select one if multiple candidates
+    lucky_loser_name = rng.choice(candidates)
+
+    # Find the bot instance with this name
+    for bot in participants:
+        if bot.name == lucky_loser_name:
+            return bot
+    return None
+
+
+class BracketNode:
+    """One match of a ``Bracket``: between two bots in round 1, otherwise between the winners of
+    its ``feeders``. A node with a single entrant is a bye (or a walkover when a feeder match
+    disqualified both of its bots)."""
+
+    __slots__ = (
+        "round", "index", "feeders", "entrants", "lucky_loser", "seed", "rng", "started", "done", "winner", "losses",
+    )
+
+    def __init__(self, round_num, index, feeders=(), entrants=None, seed=None):
+        self.round = round_num
+        self.index = index
+        self.feeders = list(feeders)
+        self.entrants = entrants  # bots playing this match, known once the feeders are done
+        self.lucky_loser = None
+        self.seed = seed
+        self.rng = random.Random(seed)  # lucky-loser pick
+        self.started = False
+        self.done = False
+        self.winner = None  # None when nobody advances (disqualification)
+        self.losses = ()  # (bot name, turns fought) for each bot that lost here
+
+    @property
+    def is_bye_slot(self):
+        """True for a later-round node with only one feeder; it may take a lucky loser."""
+        return self.round > 1 and len(self.feeders) == 1
+
+
+class Bracket:
+    """A single-elimination tournament as a dependency graph of matches.
+
+    The shape is fixed up front from ``rng``: the bots are shuffled into round-1 pairs, and each
+    later round pairs the previous round's matches in a shuffled order, an odd one out getting a
+    bye slot. A match can start as soon as its feeder matches are decided, independently of the
+    rest of its round, so a slow match only holds up the matches that need its winner. A bye slot
+    also waits for every earlier round, since the lucky-loser choice reads the losses of all of
+    them (``losers_stats``). Every node gets a seed from ``rng`` at construction, so results do not depend
+    on the order in which matches finish.
+
+    Drive it with ``ready`` / ``start`` / ``finish`` until ``done``.
+    """
+
+    def __init__(self, bots, rng):
+        bots = list(bots)
+        rng.shuffle(bots)
+        self.rounds = []
+        if bots:
+            self.rounds.append([
+                BracketNode(1, k, entrants=bots[i:i + 2], seed=rng.getrandbits(64))
+                for k, i in enumerate(range(0, len(bots), 2))
+            ])
+        while self.rounds and len(self.rounds[-1]) > 1:
+            previous = list(self.rounds[-1])
+            rng.shuffle(previous)
+            round_num = len(self.rounds) + 1
+            self.rounds.append([
+                BracketNode(round_num, k, feeders=previous[i:i + 2], seed=rng.getrandbits(64))
+                for k, i in enumerate(range(0, len(previous), 2))
+            ])
+        self._finished_rounds = 0  # rounds whose every match is done
+
+    @property
+    def final(self):
+        return self.rounds[-1][0] if self.rounds else None
+
+    @property
+    def done(self):
+        return self.final is None or self.final.done
+
+    def round_done(self, round_num):
+        return round_num <= self._finished_rounds
+
+    def ready(self):
+        """Matches that can start now, in bracket order."""
+        return [
+            node for nodes in self.rounds for node in nodes
+            if not node.started and all(f.done for f in node.feeders)
+            and (not node.is_bye_slot or self.round_done(node.round - 1))
+        ]
+
+    def start(self, node):
+        """Fix the entrants of a ready ``node`` and return them.
+
+        A bye slot looks for a lucky loser among the round's participants first (round 1 has no
+        losers yet, so its odd bot always gets a bye). With fewer than two entrants the node is
+        finished here: the single entrant advances, if any.
+        """
+        node.started = True
+        if node.entrants is None:
+            node.entrants = [f.winner for f in node.feeders if f.winner is not None]
+        if node.is_bye_slot:
+            node.lucky_loser = pick_lucky_loser(
+                self.participants(node.round), self.losers_stats(node.round), node.rng
+            )
+            if node.lucky_loser is not None:
+                node.entrants.append(node.lucky_loser)
+        if len(node.entrants) < 2:
+            self.finish(node, node.entrants[0] if node.entrants else None)
+        return node.entrants
+
+    def finish(self, node, winner, losses=()):
+        """Record the result of ``node``: ``winner`` (None if nobody advances) and the
+        ``(bot name, turns fought)`` of its losers."""
+        node.done = True
+        node.winner = winner
+        node.losses = tuple(losses)
+        while self._finished_rounds < len(self.rounds) and all(
+            n.done for n in self.rounds[self._finished_rounds]
+        ):
+            self._finished_rounds += 1
+
+    def participants(self, round_num):
+        """Bots entering ``round_num`` (known once the previous round is done), in bracket order."""
+        if round_num == 1:
+            return [bot for node in self.rounds[0] for bot in node.entrants]
+        return [f.winner for node in self.rounds[round_num - 1] for f in node.feeders if f.winner is not None]
+
+    def losers_stats(self, round_num):
+        """Total turns fought by each loser of the rounds before ``round_num``, in bracket order."""
+        stats = {}
+        for nodes in self.rounds[:round_num - 1]:
+            for node in nodes:
+                for name, turns in node.losses:
+                    stats[name] = stats.get(name, 0) + turns
+        return stats
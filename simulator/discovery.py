@@ -0,0 +1,177 @@
+import contextlib
+import hashlib
+import importlib
+import importlib.util
+import inspect
+import json
+import os
+from typing import NamedTuple
+
+from bots.bot_interface import BotInterface
+
+MANIFEST_VERSION = 1
+DEFAULT_BOTS_DIR = "bots"
+MANIFEST_FILE = ".bot_manifest.json"
+
+# Skip these directories as they don't contain bot implementations
+SKIP_DIRS = {"__pycache__", "bot_interface"}
+
+
+class BotEntry(NamedTuple):
+    name: str
+    module: str
+    class_name: str
+    path: str  # source file, relative to the manifest root
+
+
+class BotManifest:
+    """Names of the bots under ``bots_dir`` and where to find them, cached on disk.
+
+    Learning a bot's name means importing its module and instantiating it, which for some bots
+    pulls in heavy dependencies. The manifest remembers, per module file, its module path, the
+    bot classes it defines with their names, and the file's mtime, size and SHA-256. ``entries``
+    only imports files that are new or whose contents changed since the cache was written, so
+    listing bots or looking one up by name costs a directory walk; ``load`` then imports and
+    instantiates just the bot asked for. Module paths are relative to ``root`` (the current
+    directory by default), which must be on ``sys.path``.
+
+    A module that fails to import for want of an installed package is cached with that package's
+    name and tried again once the package can be found; other failures are not cached and are
+    retried on every call. ``errors`` holds ``(module path, exception)`` for the last call.
+    """
+
+    def __init__(self, bots_dir=DEFAULT_BOTS_DIR, cache_file=None, root=None):
+        self.bots_dir = bots_dir
+        self.cache_file = os.path.join(bots_dir, MANIFEST_FILE) if cache_file is None else cache_file
+        self.root = os.getcwd() if root is None else root
+        self.errors = []
+        self._instances = {}  # (module, class name) -> bot made while reading its name
+
+    def entries(self):
+        """Every bot under ``bots_dir``, in discovery order, refreshing the cache first."""
+        cached = self._read_cache()
+        modules = {}
+        self.errors = []
+        dirty = False
+        for path, module_path in self._module_files():
+            full_path = os.path.join(self.root, path)
+            stat = os.stat(full_path)
+            record = cached.get(path)
+            if record is not None and record["module"] == module_path:
+                if (record["mtime_ns"], record["size"]) != (stat.st_mtime_ns, stat.st_size):
+                    if _file_hash(full_path) != record["sha256"]:
+                        record = None
+                    else:
+                        # Touched but unchanged
+                        record = dict(record, mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+                        dirty = True
+                if record is not None and "missing" in record and importlib.util.find_spec(record["missing"]):
+                    # The dependency it was missing has been installed since
+                    record = None
+            else:
+                record = None
+            if record is None:
+                record = self._scan(module_path, full_path, stat)
+                if record is None:
+                    continue
+                dirty = True
+            if "missing" in record:
+                self.errors.append((module_path, ModuleNotFoundError(record["error"], name=record["missing"])))
+            modules[path] = record
+
+        if dirty or modules.keys() != cached.keys():
+            self._write_cache(modules)
+        return [
+            BotEntry(bot["name"], record["module"], bot["class"], path)
+            for path, record in modules.items()
+            for bot in record["bots"]
+        ]
+
+    def find(self, name):
+        """The entry of the bot called ``name`` (case-insensitive), or None."""
+        name = name.lower()
+        for entry in self.entries():
+            if entry.name.lower() == name:
+                return entry
+        return None
+
+    def load(self, entry):
+        """Import ``entry``'s module and return an instance of its bot."""
+        bot = self._instances.pop((entry.module, entry.class_name), None)
+        if bot is not None:
+            return bot
+        module = importlib.import_module(entry.module)
+        return getattr(module, entry.class_name)()
+
+    def _module_files(self):
+        """``(path relative to root, module path)`` of every candidate bot module, in walk order."""
+        for dirpath, dirs, files in os.walk(self.bots_dir):
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+            relative_path = os.path.relpath(dirpath, self.root)
+            for file in files:
+                if file.endswith(".py") and not file.startswith("__"):
+                    path = os.path.join(relative_path, file)
+                    yield path, relative_path.replace(os.sep, ".") + "." + file[:-3]
+
+    def _scan(self, module_path, full_path, stat):
+        """Import ``module_path`` and name the bots it defines, keeping the instances for ``load``.
+
+        Returns the module's manifest record, or None if it failed in a way worth retrying.
+        """
+        record = {
+            "module": module_path,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": _file_hash(full_path),
+            "bots": [],
+        }
+        try:
+            module = importlib.import_module(module_path)
+            for class_name, obj in inspect.getmembers(module):
+                if (
+                    inspect.isclass(obj)
+                    and issubclass(obj, BotInterface)
+                    and obj.__module__ == module_path
+                    and not inspect.isabstract(obj)
+                ):
+                    bot = obj()
+                    self._instances[(module_path, class_name)] = bot
+                    record["bots"].append({"name": bot.name, "class": class_name})
+        except ModuleNotFoundError as e:
+            # A dependency that isn't installed: remembered until it is, or the file changes
+            if e.name is None or importlib.util.find_spec(e.name.partition(".")[0]) is not None:
+                self.errors.append((module_path, e))
+                return None
+            record["bots"] = []
+            record["missing"] = e.name.partition(".")[0]
+            record["error"] = str(e)
+        except Exception as e:
+            self.errors.append((module_path, e))
+            return None
+        return record
+
+    def _read_cache(self):
+        try:
+            with open(self.cache_file) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return {}
+        return data.get("modules", {})
+
+    def _write_cache(self, modules):
+        # A missing or read-only cache only costs the imports next time
+        tmp_file = f"{self.cache_file}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_file, "w") as f:
+                json.dump({"version": MANIFEST_VERSION, "modules": modules}, f, indent=1)
+            os.replace(tmp_file, self.cache_file)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_file)
+
+
+def _file_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
@@ -0,0 +1,143 @@
+import math
+from abc import ABC, abstractmethod
+from statistics import NormalDist
+
+# Results as run_single_match records them
+BOT1 = "bot1"
+BOT2 = "bot2"
+DRAW = "draw"
+
+
+def wilson_interval(wins, games, confidence=0.95):
+    """Wilson score interval for a win rate of ``wins`` out of ``games`` (``(0.0, 1.0)`` for none)."""
+    if games == 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    p = wins / games
+    denominator = 1 + z * z / games
+    centre = (p + z * z / (2 * games)) / denominator
+    spread = z * math.sqrt(p * (1 - p) / games + z * z / (4 * games * games)) / denominator
+    return max(0.0, centre - spread), min(1.0, centre + spread)
+
+
+class EarlyStop(ABC):
+    """Decides a head-to-head series as results come in, in match order.
+
+    Both tests look at bot1's win rate over decisive games; draws are counted but carry no
+    evidence. ``add`` returns True once the series is decided, and ``decision`` then names the
+    stronger bot. ``interval`` reports the Wilson interval of that win rate at ``confidence``.
+    """
+
+    name = None
+
+    def __init__(self, confidence=0.95):
+        if not 0 < confidence < 1:
+            raise ValueError("confidence must be between 0 and 1")
+        self.confidence = confidence
+        self.wins = 0  # bot1
+        self.losses = 0
+        self.draws = 0
+        self.decision = None  # BOT1 or BOT2 once decided
+
+    @property
+    def games(self):
+        return self.wins + self.losses + self.draws
+
+    @property
+    def decisive(self):
+        return self.wins + self.losses
+
+    def add(self, result):
+        if result == BOT1:
+            self.wins += 1
+        elif result == BOT2:
+            self.losses += 1
+        else:
+            self.draws += 1
+        if self.decision is None:
+            self.decision = self._decide()
+        return self.decision is not None
+
+    def interval(self):
+        return wilson_interval(self.wins, self.decisive, self.confidence)
+
+    def conclusion(self, bot1_name, bot2_name):
+        """What the test accepted, in words, once decided."""
+        stronger = bot1_name if self.decision == BOT1 else bot2_name
+        return f"{stronger} is stronger"
+
+    @abstractmethod
+    def _decide(self):
+        """BOT1 or BOT2 once the results so far decide the series, else None."""
+        pass
+
+
+class SPRT(EarlyStop):
+    """Wald's sequential probability ratio test of "bot1 wins ``0.5 + margin`` of decisive games"
+    against "bot1 wins ``0.5 - margin``", with both error rates at ``1 - confidence``.
+
+    Valid however often it is checked, so it can stop after any game. It only chooses between those
+    two hypotheses: evenly matched bots are decided too, for whichever side the games happened to
+    favour, so ``conclusion`` states the hypothesis accepted rather than calling a bot stronger.
+    """
+
+    name = "sprt"
+
+    def __init__(self, confidence=0.95, margin=0.1):
+        super().__init__(confidence)
+        if not 0 < margin < 0.5:
+            raise ValueError("margin must be between 0 and 0.5")
+        self.margin = margin
+        error = 1 - confidence
+        self.lower = math.log(error / (1 - error))
+        self.upper = math.log((1 - error) / error)
+        stronger, weaker = 0.5 + margin, 0.5 - margin
+        self._win = math.log(stronger / weaker)
+        self._loss = math.log(weaker / stronger)
+
+    @property
+    def llr(self):
+        """Log-likelihood ratio of "bot1 is stronger" over "bot2 is stronger"."""
+        return self.wins * self._win + self.losses * self._loss
+
+    def conclusion(self, bot1_name, bot2_name):
+        favoured, other = (bot1_name, bot2_name) if self.decision == BOT1 else (bot2_name, bot1_name)
+        return (
+            f"accepted {favoured} winning at least {0.5 + self.margin:.0%} of decisive games against {other}, "
+            f"over at most {0.5 - self.margin:.0%}"
+        )
+
+    def _decide(self):
+        llr = self.llr
+        if llr >= self.upper:
+            return BOT1
+        if llr <= self.lower:
+            return BOT2
+        return None
+
+
+class WilsonStop(EarlyStop):
+    """Stops once the Wilson interval of bot1's decisive win rate no longer contains 50%.
+
+    Checking after every game makes this looser than its nominal confidence, so it waits for
+    ``min_games`` decisive games first; prefer ``SPRT`` when the error rate matters.
+    """
+
+    name = "wilson"
+
+    def __init__(self, confidence=0.95, min_games=20):
+        super().__init__(confidence)
+        self.min_games = min_games
+
+    def _decide(self):
+        if self.decisive < self.min_games:
+            return None
+        low, high = self.interval()
+        if low > 0.5:
+            return BOT1
+        if high < 0.5:
+            return BOT2
+        return None
+
+
+EARLY_STOPS = {test.name: test for test in (SPRT, WilsonStop)}
@@ -1,7 +1,16 @@
+import os
+import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
 from game.engine import GameEngine
+from game.snapshots import SNAPSHOT_ANIMATION, SNAPSHOT_NONE
 
-def run_match(bot1, bot2, max_turns=100, verbose=False):
-    engine = GameEngine(bot1, bot2)
+def run_match(bot1, bot2, max_turns=100, verbose=False, snapshot_policy=SNAPSHOT_ANIMATION, sinks=None, decisions=None,
+              rng=None, seed=None):
+    engine = GameEngine(
+        bot1, bot2, snapshot_policy=snapshot_policy, sinks=sinks, rng=rng, decisions=decisions, seed=seed
+    )
     winner = None
 
     for _ in range(max_turns):
@@ -9,9 +18,49 @@ def run_match(bot1, bot2, max_turns=100, verbose=False):
         if winner:
             break
 
+    if snapshot_policy == SNAPSHOT_NONE:
+        # Keep the final state as the match summary (turns fought, final HP)
+        engine.logger.log_state(engine.build_input(engine.wizard1, engine.wizard2))
+
     engine.logger.finalize()
 
     if verbose:
         engine.logger.print_log()
 
     return winner or "Draw", engine.logger
+
+
+def gil_enabled():
+    """False on a free-threaded CPython build (3.13t+) running with the GIL off."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def run_matches(pairings, seeds=None, workers=None, **kwargs):
+    """Play ``(bot1, bot2)`` pairings on a thread pool and return their ``run_match`` results in order.
+
+    Every match has its own engine, RNG and minion ids, so matches share nothing but the bots
+    handed in: give each pairing its own bot objects. ``seeds`` (one per pairing) seed the match
+    RNGs; bots that draw from the global ``random`` module are still not reproducible when run
+    concurrently. ``workers`` defaults to one thread per CPU on a free-threaded build and to one
+    (play in order on this thread) when the GIL would serialise the matches anyway. Other keyword
+    arguments go to ``run_match``; a ``decisions`` runner must not be shared between threads.
+    """
+    pairings = list(pairings)
+    if seeds is None:
+        seeds = [None] * len(pairings)
+    elif len(seeds) != len(pairings):
+        raise ValueError(f"Expected {len(pairings)} seeds, got {len(seeds)}")
+    if workers is None:
+        workers = 1 if gil_enabled() else os.cpu_count() or 1
+    # Draw the default seeds up front, in pairing order, so random.seed() still fixes every match
+    seeds = [random.getrandbits(64) if seed is None else seed for seed in seeds]
+
+    def play(i):
+        bot1, bot2 = pairings[i]
+        return run_match(bot1, bot2, seed=seeds[i], **kwargs)
+
+    if workers <= 1:
+        return [play(i) for i in range(len(pairings))]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="match") as pool:
+        return list(pool.map(play, range(len(pairings))))
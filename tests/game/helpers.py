@@ -0,0 +1,15 @@
+import copy
+
+
+class RecordingBot:
+    """Wrap a bot and keep a copy of the last action it returned."""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.name = bot.name
+        self.last_action = None
+
+    def decide(self, state):
+        action = self.bot.decide(state)
+        self.last_action = copy.deepcopy(action)
+        return action
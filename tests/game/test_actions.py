@@ -0,0 +1,114 @@
+import copy
+import random
+import unittest
+
+import numpy as np
+
+from bots.sample_bot1.sample_bot_1 import SampleBot1
+from bots.sample_bot2.sample_bot_2 import SampleBot2
+from game.actions import IDLE, NO_SPELL, Action, parse_action
+from game.engine import GameEngine
+from game.logger import NullLogger
+from game.rules import Spell
+
+
+class ListLogger(NullLogger):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def log(self, message):
+        self.messages.append(message)
+
+
+class ActionBot:
+    """Wrap a bot and hand its decisions to the engine as parsed Actions."""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.name = bot.name
+
+    def decide(self, state):
+        return parse_action(self.bot.decide(state))
+
+
+class TupleFireballBot:
+    """Fireball the opponent, giving its position as a tuple."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def decide(self, state):
+        return {"move": [0, 0], "spell": {"name": "fireball", "target": tuple(state["opponent"]["position"])}}
+
+
+class IdleBot:
+    def __init__(self, name):
+        self.name = name
+
+    def decide(self, state):
+        return {"move": [0, 0], "spell": None}
+
+
+class TestParseAction(unittest.TestCase):
+    def test_parses_moves_and_spells(self):
+        action = parse_action({"move": [1, -1], "spell": {"name": "fireball", "target": [3, 4]}})
+        self.assertEqual(action, Action((1, -1), Spell.FIREBALL, (3, 4)))
+        self.assertEqual(action.spell_name, "fireball")
+        self.assertEqual(parse_action({"move": (0, 1), "spell": {"name": "heal"}}), Action((0, 1), Spell.HEAL))
+        self.assertEqual(parse_action({}), IDLE)
+        self.assertIsNone(IDLE.spell_name)
+
+    def test_action_passes_through(self):
+        action = Action((1, 0), Spell.SHIELD)
+        self.assertIs(parse_action(action), action)
+
+    def test_bot_dict_is_not_modified(self):
+        raw = {"move": [5, 0], "spell": {"name": "blink", "target": [2, 2]}}
+        before = copy.deepcopy(raw)
+        self.assertEqual(parse_action(raw).move, (0, 0))
+        self.assertEqual(raw, before)
+
+    def test_invalid_input_is_logged_and_dropped(self):
+        logger = ListLogger()
+        self.assertEqual(parse_action({"move": [2, 0]}, logger).move, (0, 0))
+        self.assertEqual(parse_action({"move": "up"}, logger).move, (0, 0))
+        self.assertEqual(parse_action({"move": [0, 0]}, logger).move, (0, 0))
+        self.assertIsNone(parse_action({"move": []}, logger).move)
+        self.assertEqual(parse_action({"spell": {"name": "meteor"}}, logger).spell, NO_SPELL)
+        self.assertEqual(parse_action({"spell": "heal"}, logger).spell, NO_SPELL)
+        self.assertEqual(parse_action({"spell": {"name": "fireball"}}, logger).spell, NO_SPELL)
+        self.assertEqual(parse_action({"spell": {"name": "teleport", "target": "x"}}, logger).spell, NO_SPELL)
+        self.assertEqual(parse_action(None, logger), IDLE)
+        self.assertEqual(len(logger.messages), 7)
+
+    def test_numpy_coordinates(self):
+        action = parse_action({"spell": {"name": "melee_attack", "target": np.array([4, 5])}})
+        self.assertEqual(action.target, (4, 5))
+        self.assertIs(type(action.target[0]), int)
+
+
+class TestEngineActions(unittest.TestCase):
+    def test_bots_returning_actions_play_the_same_game(self):
+        for seed in range(4):
+            results = []
+            for wrap in (lambda bot: bot, ActionBot):
+                random.seed(seed)
+                engine = GameEngine(wrap(SampleBot1()), wrap(SampleBot2()), rng=random.Random(seed))
+                winner = None
+                while not winner and engine.turn < 100:
+                    winner = engine.run_turn()
+                results.append((engine.get_state(), engine.logger.get_event_logs()))
+            self.assertEqual(results[0], results[1], f"seed {seed}")
+
+    def test_tuple_targets_hit(self):
+        # Targets were compared with list positions as given, so a tuple always missed
+        engine = GameEngine(TupleFireballBot("A"), IdleBot("B"))
+        engine.set_position(engine.wizard2, [3, 3])
+        hp = engine.wizard2.hp
+        engine.run_turn()
+        self.assertEqual(engine.wizard2.hp, hp - 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import random
+import unittest
+
+from game import board
+from game.artifacts import ARTIFACT_TYPES, ArtifactManager
+from game.rules import BOARD_SIZE
+from game.wizard import Wizard
+
+
+def reference_spawn(rng, occupied_positions, artifacts):
+    """The original list-based spawn_random draw."""
+    occupied = {tuple(p) for p in occupied_positions} | {tuple(a["position"]) for a in artifacts}
+    if len(occupied) > 10:
+        return None
+    free = [(x, y) for x in range(BOARD_SIZE) for y in range(BOARD_SIZE) if (x, y) not in occupied]
+    x, y = rng.choice(free)
+    return [x, y], rng.choice(ARTIFACT_TYPES)
+
+
+class TestArtifactManager(unittest.TestCase):
+    def test_spawns_match_the_list_based_draw(self):
+        manager = ArtifactManager(random.Random(11))
+        reference_rng = random.Random(11)
+        occupied = [[0, 0], [9, 9], [4, 4]]
+        for turn in range(12):
+            expected = reference_spawn(reference_rng, occupied, manager.artifacts)
+            spawned = manager.spawn_random(occupied, turn)
+            self.assertEqual(spawned, expected is not None)
+            if expected:
+                self.assertEqual((manager.artifacts[-1]["position"], manager.artifacts[-1]["type"]), expected)
+        self.assertEqual(len(manager.artifacts), 8)  # stops once more than 10 tiles are taken
+
+    def test_pickup_removes_by_position_and_keeps_spawn_order(self):
+        manager = ArtifactManager(random.Random(0))
+        manager.artifacts = [
+            {"type": "mana", "position": [1, 1], "spawn_turn": 3},
+            {"type": "health", "position": [2, 2], "spawn_turn": 6},
+            {"type": "cooldown", "position": [3, 3], "spawn_turn": 9},
+        ]
+        wizard = Wizard("A", [2, 2])
+        wizard.hp = 50
+
+        artifact = manager.check_pickup(wizard)
+        self.assertEqual(artifact["type"], "health")
+        self.assertEqual(wizard.hp, 70)
+        self.assertIsNone(manager.check_pickup(wizard))
+        self.assertEqual([a["spawn_turn"] for a in manager.artifacts], [3, 9])
+        self.assertEqual(manager.occupied, board.to_mask([(1, 1), (3, 3)]))
+        self.assertIs(manager.at([3, 3]), manager.artifacts[-1])
+
+    def test_active_artifacts_are_copies(self):
+        manager = ArtifactManager(random.Random(0))
+        manager.artifacts = [{"type": "health", "position": [2, 2], "spawn_turn": 6}]
+        view = manager.active_artifacts()
+        view[0]["position"][0] = 5
+        view[0]["type"] = "mana"
+        view.clear()
+
+        wizard = Wizard("A", [2, 2])
+        wizard.hp = 50
+        self.assertEqual(manager.check_pickup(wizard)["type"], "health")
+        self.assertEqual(wizard.hp, 70)
+
+    def test_copy_is_independent(self):
+        manager = ArtifactManager(random.Random(0))
+        manager.spawn_random([], 3)
+        clone = manager.copy()
+        clone.check_pickup(Wizard("A", manager.artifacts[0]["position"]))
+        self.assertEqual(len(manager.artifacts), 1)
+        self.assertEqual(clone.artifacts, [])
+        self.assertEqual(clone.occupied, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
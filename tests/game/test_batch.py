@@ -0,0 +1,86 @@
+import random
+import unittest
+
+from bots.sample_bot1.sample_bot_1 import SampleBot1
+from bots.sample_bot2.sample_bot_2 import SampleBot2
+from bots.sample_bot3.sample_bot_3 import SampleBot3
+from bots.tactical_bot.tactical_bot import TacticalBot
+from game.batch import DRAW, NO_WINNER, WIZARD1, WIZARD2, BatchGameEngine, encode_actions
+from game.engine import GameEngine
+from tests.game.helpers import RecordingBot
+
+BOT_CLASSES = [SampleBot1, SampleBot2, SampleBot3, TacticalBot]
+
+
+def play_recorded(seed, max_turns=100):
+    """Play a GameEngine match and return its initial state, per-turn actions and per-turn states."""
+    bot1 = RecordingBot(BOT_CLASSES[seed % len(BOT_CLASSES)]())
+    bot2 = RecordingBot(BOT_CLASSES[(seed + 1) % len(BOT_CLASSES)]())
+    random.seed(seed)
+    engine = GameEngine(bot1, bot2, rng=random.Random(seed))
+    initial = engine.get_state()
+    turns = []
+    for _ in range(max_turns):
+        winner = engine.run_turn()
+        turns.append(((bot1.last_action, bot2.last_action), engine.get_state(), getattr(winner, "name", winner)))
+        if winner:
+            break
+    return initial, turns
+
+
+class TestBatchGameEngine(unittest.TestCase):
+    def test_matches_game_engine_for_identical_seeds(self):
+        seeds = range(16)
+        games = [play_recorded(seed) for seed in seeds]
+        batch = BatchGameEngine(
+            [(g[0].wizard1.name, g[0].wizard2.name) for g in games], [random.Random(s) for s in seeds]
+        )
+        for i, (initial, _) in enumerate(games):
+            self.assertEqual(batch.get_state(i), initial)
+
+        idle = ({"move": [0, 0], "spell": None}, {"move": [0, 0], "spell": None})
+        for turn in range(max(len(turns) for _, turns in games)):
+            pairs = [turns[turn][0] if turn < len(turns) else idle for _, turns in games]
+            winners = batch.step(encode_actions(pairs))
+            for i, (_, turns) in enumerate(games):
+                if turn >= len(turns):
+                    continue
+                _, state, winner = turns[turn]
+                with self.subTest(match=i, turn=turn + 1):
+                    self.assertEqual(batch.get_state(i), state)
+                    expected = {
+                        None: NO_WINNER, "Draw": DRAW, state.wizard1.name: WIZARD1, state.wizard2.name: WIZARD2
+                    }[winner]
+                    self.assertEqual(winners[i], expected)
+
+    def test_finished_matches_are_frozen(self):
+        batch = BatchGameEngine([("A", "B"), ("C", "D")])
+        batch.hp[1, WIZARD2] = 0
+        batch.step([({"move": [1, 1], "spell": None}, {"move": [0, 0], "spell": None})] * 2)
+        self.assertEqual(batch.winner.tolist(), [NO_WINNER, WIZARD1])
+        frozen = batch.get_state(1)
+
+        batch.step([({"move": [1, 1], "spell": {"name": "summon"}}, {"move": [-1, 0], "spell": None})] * 2)
+        self.assertEqual(batch.get_state(1), frozen)
+        self.assertEqual(batch.get_state(0).turn, 2)
+
+    def test_build_input_matches_engine(self):
+        class Bot:
+            def __init__(self, name):
+                self.name = name
+
+        engine = GameEngine(Bot("A"), Bot("B"), rng=random.Random(5))
+        batch = BatchGameEngine([("A", "B")], [random.Random(5)])
+        actions = ({"move": [1, 1], "spell": {"name": "summon"}}, {"move": [-1, -1], "spell": {"name": "shield"}})
+        for _ in range(4):
+            engine.play_turn(dict(actions[0]), dict(actions[1]))
+            batch.step([actions])
+        self.assertEqual(batch.build_input(0, 1), engine.build_input(engine.wizard2, engine.wizard1))
+
+    def test_wizards_need_distinct_names(self):
+        with self.assertRaises(ValueError):
+            BatchGameEngine([("A", "A")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+from game import board
+from game.rules import BOARD_SIZE, DIRECTIONS
+
+TILES = [(x, y) for x in range(BOARD_SIZE) for y in range(BOARD_SIZE)]
+
+
+def cheb(a, b):
+    return max(abs(a[0] - b[0]), abs(a[1] - b[1]))
+
+
+class TestBitboards(unittest.TestCase):
+    """Precomputed masks must agree with the distance loops they replace."""
+
+    def test_within_and_rings_match_chebyshev_distance(self):
+        for pos in TILES + [(-1, 4), (10, 10), (3, -2)]:
+            for radius in range(4):
+                within = {tuple(p) for p in board.positions(board.within(pos, radius))}
+                ring = {tuple(p) for p in board.positions(board.ring(pos, radius))}
+                self.assertEqual(within, {t for t in TILES if cheb(pos, t) <= radius})
+                self.assertEqual(ring, {t for t in TILES if cheb(pos, t) == radius})
+
+    def test_named_masks(self):
+        sq = board.square((4, 7))
+        self.assertEqual(board.FIREBALL_RANGE[sq], board.within((4, 7), 5))
+        self.assertEqual(board.BLINK_RANGE[sq], board.within((4, 7), 2))
+        self.assertEqual(board.ADJACENT[sq], board.ring((4, 7), 1))
+        self.assertEqual(board.splash((-1, 0)), board.bit((0, 0)) | board.bit((0, 1)))
+
+    def test_bit_order_follows_directions(self):
+        x, y = 5, 5
+        expected = [[x + dx, y + dy] for dx, dy in DIRECTIONS]
+        self.assertEqual(board.positions(board.NEIGHBOURHOOD[board.square((x, y))]), expected)
+
+    def test_set_operations(self):
+        mask = board.to_mask([(0, 0), (9, 9), (0, 0), (12, 3)])
+        self.assertEqual(board.popcount(mask), 2)
+        self.assertEqual(board.lowest(mask), 0)
+        self.assertEqual(board.nth(mask, 1), 99)
+        self.assertIsNone(board.lowest(0))
+        with self.assertRaises(IndexError):
+            board.nth(mask, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,205 @@
+import os
+import random
+import threading
+import time
+import unittest
+
+from bots.sample_bot1.sample_bot_1 import SampleBot1
+from bots.sample_bot2.sample_bot_2 import SampleBot2
+from game.actions import IDLE, Action
+from game.decisions import WORKER_PROCESS, WORKER_THREAD, DecisionRunner
+from game.engine import GameEngine
+
+
+class ScriptedBot:
+    def __init__(self, name, decide):
+        self.name = name
+        self._decide = decide
+
+    def decide(self, state):
+        return self._decide(state)
+
+
+class PidBot:
+    name = "Pid"
+
+    def decide(self, state):
+        return {"pid": os.getpid(), "turn": state["turn"]}
+
+
+class FragileBot:
+    name = "Fragile"
+
+    def decide(self, state):
+        if state["turn"] == 1:
+            os._exit(1)
+        return {"pid": os.getpid()}
+
+
+class LearningBot:
+    name = "Learner"
+
+    def __init__(self):
+        self.results = []
+
+    def decide(self, state):
+        return {"results": self.results, "board_size": state["board_size"]}
+
+    def game_over(self, won):
+        self.results.append(won)
+
+
+class DiceBot:
+    name = "Dice"
+
+    def decide(self, state):
+        return {"roll": random.random()}
+
+
+class HungryBot:
+    name = "Hungry"
+
+    def decide(self, state):
+        hoard = bytearray(state["mb"] * 1024 * 1024)
+        return {"mb": len(hoard) // (1024 * 1024)}
+
+
+class SleepyBot:
+    name = "Sleepy"
+
+    def decide(self, state):
+        time.sleep(30)
+
+
+def spin(seconds):
+    end = time.thread_time() + seconds
+    while time.thread_time() < end:
+        pass
+
+
+class TestDecisionRunner(unittest.TestCase):
+    def runner(self, **kwargs):
+        runner = DecisionRunner(**kwargs)
+        self.addCleanup(runner.close)
+        return runner
+
+    def test_no_budget_calls_inline(self):
+        caller = []
+        bot = ScriptedBot("A", lambda state: caller.append(threading.current_thread()) or {"move": [1, 0]})
+        self.assertEqual(self.runner().decide(bot, {}), {"move": [1, 0]})
+        self.assertIs(caller[0], threading.current_thread())
+
+    def test_fast_decisions_pass_through(self):
+        runner = self.runner(timeout=5)
+        bot = ScriptedBot("A", lambda state: {"move": [state["turn"], 0]})
+        self.assertEqual([runner.decide(bot, {"turn": t})["move"] for t in (0, 1)], [[0, 0], [1, 0]])
+        self.assertEqual(runner.overruns, {})
+
+    def test_slow_bot_idles_until_it_returns(self):
+        release = threading.Event()
+        bot = ScriptedBot("Slow", lambda state: release.wait() and {"move": [1, 1]})
+        runner = self.runner(timeout=0.01, default_action=Action((0, 0)))
+
+        self.assertEqual(runner.decide(bot, {}), Action((0, 0)))
+        # Still stuck in the first call: no new call is started
+        self.assertEqual(runner.decide(bot, {}), Action((0, 0)))
+        self.assertEqual(runner.overruns["Slow"], 2)
+
+        release.set()
+        runner._workers[id(bot)].call.done.wait(5)
+        self.assertEqual(runner.decide(bot, {}), {"move": [1, 1]})
+        self.assertEqual(runner.overruns["Slow"], 2)
+
+    def test_cpu_budget(self):
+        bot = ScriptedBot("Busy", lambda state: spin(0.05) or {"move": [1, 0]})
+        runner = self.runner(timeout=5, cpu_timeout=0.01)
+        self.assertIs(runner.decide(bot, {}), IDLE)
+        self.assertEqual(runner.overruns, {"Busy": 1})
+
+    def test_errors_propagate(self):
+        def fail(state):
+            raise ValueError("bad bot")
+
+        with self.assertRaisesRegex(ValueError, "bad bot"):
+            self.runner(timeout=5).decide(ScriptedBot("A", fail), {})
+
+    def test_parallel_bots_decide_at_the_same_time(self):
+        barrier = threading.Barrier(2, timeout=5)
+        bots = [ScriptedBot(name, lambda state: {"turn": state["turn"], "slot": barrier.wait()}) for name in "AB"]
+        runner = self.runner(parallel=True)
+        actions = runner.decide_all(bots, [{"turn": 1}, {"turn": 2}])
+        self.assertEqual([a["turn"] for a in actions], [1, 2])
+        self.assertEqual({a["slot"] for a in actions}, {0, 1})
+
+    def test_process_workers_are_persistent(self):
+        runner = self.runner(workers=WORKER_PROCESS)
+        bot = PidBot()
+        first, second = (runner.decide(bot, {"turn": t}) for t in (1, 2))
+        self.assertNotEqual(first["pid"], os.getpid())
+        self.assertEqual(first["pid"], second["pid"])
+        self.assertEqual(second["turn"], 2)
+
+    def test_dead_process_is_replaced(self):
+        runner = self.runner(workers=WORKER_PROCESS)
+        bot = FragileBot()
+        self.assertIs(runner.decide(bot, {"turn": 1}), IDLE)
+        self.assertEqual(runner.crashes, {"Fragile": 1})
+        self.assertNotEqual(runner.decide(bot, {"turn": 2})["pid"], os.getpid())
+
+    @unittest.skipUnless(os.path.exists("/proc/self/statm"), "needs /proc to measure the worker")
+    def test_memory_limit_is_on_top_of_the_worker(self):
+        # Far less than an interpreter maps by itself, yet enough for a small bot
+        runner = self.runner(workers=WORKER_PROCESS, memory_limit_mb=64)
+        bot = HungryBot()
+        self.assertEqual(runner.decide(bot, {"mb": 16}), {"mb": 16})
+        with self.assertRaises(MemoryError):
+            runner.decide(bot, {"mb": 256})
+
+    def test_process_workers_are_seeded_from_this_process(self):
+        rolls = []
+        for _ in range(2):
+            random.seed(4)
+            runner = self.runner(workers=WORKER_PROCESS)
+            rolls.append([runner.decide(DiceBot(), {"turn": t})["roll"] for t in range(3)])
+            runner.close()
+        self.assertEqual(rolls[0], rolls[1])
+
+    def test_game_over_reaches_the_worker_copy(self):
+        engine = GameEngine(SampleBot1(), SampleBot2())
+        state = engine.build_input(engine.wizard1, engine.wizard2)
+        for runner in (self.runner(), self.runner(workers=WORKER_PROCESS)):
+            bot = LearningBot()
+            runner.decide(bot, state)
+            runner.game_over(bot, True)
+            runner.game_over(bot, False)
+            self.assertEqual(runner.decide(bot, state), {"results": [True, False], "board_size": 10})
+
+    def test_close_kills_a_stuck_process(self):
+        runner = DecisionRunner(timeout=0.05, workers=WORKER_PROCESS)
+        bot = SleepyBot()
+        self.assertIs(runner.decide(bot, {}), IDLE)
+        process = runner._workers[id(bot)].process
+        runner.close()
+        process.join(5)
+        self.assertFalse(process.is_alive())
+
+    def test_engine_plays_the_same_game_through_a_runner(self):
+        results = []
+        runners = [
+            self.runner(timeout=5),
+            self.runner(parallel=True, workers=WORKER_THREAD),
+            self.runner(parallel=True, workers=WORKER_PROCESS),
+        ]
+        for decisions in [None] + runners:
+            random.seed(1)
+            engine = GameEngine(SampleBot1(), SampleBot2(), rng=random.Random(1), decisions=decisions)
+            winner = None
+            while not winner and engine.turn < 100:
+                winner = engine.run_turn()
+            results.append(engine.get_state())
+        for result in results[1:]:
+            self.assertEqual(result, results[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
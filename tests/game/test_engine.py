@@ -0,0 +1,165 @@
+import copy
+import random
+import unittest
+
+from game.engine import GameEngine
+from game.minion import Minion
+from game.snapshots import SNAPSHOT_ANIMATION, SNAPSHOT_NONE, SNAPSHOT_PER_TURN
+from simulator.match import run_match
+
+
+class StubBot:
+    def __init__(self, name):
+        self.name = name
+
+    def decide(self, state):
+        return {"move": [0, 0], "spell": None}
+
+
+class TestOccupancyGrid(unittest.TestCase):
+    """The engine's occupancy grid must answer the same questions as a scan of all entities."""
+
+    def setUp(self):
+        self.engine = GameEngine(StubBot("A"), StubBot("B"))
+
+    def test_wizards_are_indexed(self):
+        self.assertIs(self.engine.get_entity_at_position([0, 0]), self.engine.wizard1)
+        self.assertIs(self.engine.get_entity_at_position([9, 9]), self.engine.wizard2)
+        self.assertIsNone(self.engine.get_entity_at_position([5, 5]))
+        self.assertIsNone(self.engine.get_entity_at_position([-1, 5]))
+
+    def test_moves_update_grid(self):
+        self.engine.set_position(self.engine.wizard1, [3, 4])
+        self.assertIsNone(self.engine.get_entity_at_position([0, 0]))
+        self.assertIs(self.engine.get_entity_at_position((3, 4)), self.engine.wizard1)
+        self.assertTrue(self.engine.tile_occupied([3, 4]))
+
+    def test_wizard_wins_over_minion_on_shared_tile(self):
+        minion = Minion("B", [3, 4], "B-1")
+        self.engine.add_minion(minion)
+        self.engine.set_position(self.engine.wizard1, [3, 4])
+        self.assertIs(self.engine.get_entity_at_position([3, 4]), self.engine.wizard1)
+        self.assertIs(self.engine.grid.at_except([3, 4], [self.engine.wizard1]), minion)
+
+    def test_dead_minions_are_compacted(self):
+        minion = Minion("A", [1, 1], "A-1")
+        self.engine.add_minion(minion)
+        self.assertIs(self.engine.get_entity_at_position([1, 1]), minion)
+
+        minion.hp = 0
+        self.assertIsNone(self.engine.get_entity_at_position([1, 1]))
+        self.engine.remove_dead_minions()
+        self.assertEqual(self.engine.minions, [])
+        self.assertFalse(self.engine.tile_occupied([1, 1]))
+
+
+class TestSnapshotPolicy(unittest.TestCase):
+    def test_per_turn_records_one_state_per_turn(self):
+        _, logger = run_match(StubBot("A"), StubBot("B"), max_turns=5, snapshot_policy=SNAPSHOT_PER_TURN)
+        self.assertEqual([s["turn"] for s in logger.get_snapshots()], [0, 1, 2, 3, 4, 5])
+
+    def test_none_keeps_only_the_summary_state(self):
+        _, logger = run_match(StubBot("A"), StubBot("B"), max_turns=5, snapshot_policy=SNAPSHOT_NONE)
+        snapshots = logger.get_snapshots()
+        self.assertEqual(len(snapshots), 1)
+        self.assertEqual(snapshots[-1]["turn"], 5)
+
+    def test_animation_records_intermediate_states(self):
+        _, logger = run_match(StubBot("A"), StubBot("B"), max_turns=5, snapshot_policy=SNAPSHOT_ANIMATION)
+        self.assertGreater(len(logger.get_snapshots()), 6)
+
+    def test_unknown_policy_is_rejected(self):
+        with self.assertRaises(ValueError):
+            GameEngine(StubBot("A"), StubBot("B"), snapshot_policy="sometimes")
+
+
+class ScriptedBot(StubBot):
+    def decide(self, state):
+        return {"move": [1, 1], "spell": {"name": "fireball", "target": state["opponent"]["position"]}}
+
+
+def rules_state(engine):
+    return copy.deepcopy((
+        engine.turn,
+        engine.build_input(engine.wizard1, engine.wizard2),
+        [m.to_dict() for m in engine.minions],
+    ))
+
+
+class TestCloneAndUndo(unittest.TestCase):
+    def setUp(self):
+        self.engine = GameEngine(ScriptedBot("A"), ScriptedBot("B"))
+        for _ in range(3):
+            self.engine.run_turn()
+
+    def test_clone_plays_like_the_engine(self):
+        clone = self.engine.clone()
+        self.assertEqual(rules_state(clone), rules_state(self.engine))
+
+        action1 = {"move": [1, 0], "spell": {"name": "fireball", "target": [9, 9]}}
+        action2 = {"move": [0, -1], "spell": {"name": "shield"}}
+        random.seed(7)
+        clone.play_turn(dict(action1), dict(action2))
+        random.seed(7)
+        self.engine.play_turn(dict(action1), dict(action2))
+        self.assertEqual(rules_state(clone), rules_state(self.engine))
+
+    def test_clone_does_not_touch_the_original(self):
+        before = rules_state(self.engine)
+        events = len(self.engine.logger.get_event_logs())
+        clone = self.engine.clone()
+        for _ in range(5):
+            clone.play_turn({"move": [1, 1], "spell": {"name": "summon"}}, {"move": [-1, -1], "spell": None})
+        self.assertEqual(rules_state(self.engine), before)
+        self.assertEqual(len(self.engine.logger.get_event_logs()), events)
+
+    def test_pop_state_undoes_turns(self):
+        before = rules_state(self.engine)
+        self.engine.push_state()
+        for _ in range(4):
+            self.engine.run_turn()
+        self.engine.pop_state()
+        self.assertEqual(rules_state(self.engine), before)
+        self.assertIs(self.engine.get_entity_at_position(self.engine.wizard1.position), self.engine.wizard1)
+
+
+class MutatingBot(StubBot):
+    def decide(self, state):
+        state["self"]["hp"] = 1
+        state["self"]["position"][0] = 7
+        state["self"]["cooldowns"]["fireball"] = 99
+        return super().decide(state)
+
+
+class RecordingBot(StubBot):
+    def decide(self, state):
+        self.seen = copy.deepcopy(state)
+        return super().decide(state)
+
+
+class TestBotInputs(unittest.TestCase):
+    def test_bots_cannot_change_each_others_inputs(self):
+        mutator, observer = MutatingBot("A"), RecordingBot("B")
+        engine = GameEngine(mutator, observer)
+        start = engine.wizard1.position
+        engine.run_turn()
+        self.assertEqual(observer.seen["opponent"]["hp"], 100)
+        self.assertEqual(observer.seen["opponent"]["position"], start)
+        self.assertEqual(observer.seen["opponent"]["cooldowns"]["fireball"], 0)
+        self.assertEqual(engine.wizard1.hp, 100)
+        self.assertEqual(engine.wizard1.position, start)
+        self.assertEqual(engine.wizard1.cooldowns["fireball"], 0)
+
+
+
+class TestMinionSteps(unittest.TestCase):
+    def test_minion_steps_toward_its_target(self):
+        engine = GameEngine(StubBot("A"), StubBot("B"))
+        minion = Minion("A", [4, 4], "A-1")
+        for (dx, dy), step in [((3, 5), [5, 5]), ((0, -2), [4, 3]), ((-6, 1), [3, 5]), ((0, 0), [4, 4])]:
+            with self.subTest(dx=dx, dy=dy):
+                self.assertEqual(engine.get_minion_next_position(minion, dx, dy), step)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+
+from game.minion import Minion
+from game.rules import SPELLS, Spell
+from game.wizard import Wizard
+
+
+class TestWizard(unittest.TestCase):
+    def test_to_dict_follows_mutation(self):
+        wizard = Wizard("A", [0, 0])
+        view = wizard.to_dict()
+        self.assertEqual(wizard.to_dict(), view)
+        self.assertEqual(list(view["cooldowns"]), list(SPELLS))
+
+        wizard.hp -= 10
+        updated = wizard.to_dict()
+        self.assertEqual(view["hp"], 100)
+        self.assertEqual(updated["hp"], 90)
+
+    def test_to_dict_copies_are_independent(self):
+        wizard = Wizard("A", [0, 0])
+        view = wizard.to_dict()
+        view["hp"] = 1
+        view["position"][0] = 5
+        view["cooldowns"]["fireball"] = 99
+        self.assertEqual(wizard.to_dict(), {
+            "name": "A", "hp": 100, "mana": 100, "position": [0, 0],
+            "cooldowns": dict.fromkeys(SPELLS, 0), "shield_active": False,
+        })
+        self.assertEqual(wizard.position, [0, 0])
+
+        minion = Minion("A", [1, 1], "A-1")
+        minion.to_dict()["position"][0] = 5
+        self.assertEqual(minion.to_dict()["position"], [1, 1])
+
+    def test_cooldowns_are_indexed_by_spell_id(self):
+        wizard = Wizard("A", [0, 0])
+        wizard.cast_spell("fireball")
+        self.assertEqual(wizard.cooldown(Spell.FIREBALL), SPELLS["fireball"]["cooldown"])
+        self.assertEqual(wizard.to_dict()["cooldowns"]["fireball"], SPELLS["fireball"]["cooldown"])
+        self.assertFalse(wizard.can_cast("fireball"))
+
+        wizard.reduce_cooldowns()
+        self.assertEqual(wizard.cooldowns["fireball"], SPELLS["fireball"]["cooldown"] - 1)
+
+    def test_entities_are_slotted(self):
+        with self.assertRaises(AttributeError):
+            Wizard("A", [0, 0]).speed = 1
+        with self.assertRaises(AttributeError):
+            Minion("A", [0, 0], "A-1").speed = 1
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+
+from game.events import KIND_SPELL_CAST, EventStore
+from game.logger import GameLogger
+from game.minion import Minion
+from game.wizard import Wizard
+
+
+class TestEventStore(unittest.TestCase):
+    def setUp(self):
+        self.logger = GameLogger()
+        self.logger.new_turn(3)
+        self.wizard1 = Wizard("A", [0, 0])
+        self.wizard2 = Wizard("B", [9, 9])
+
+    def test_event_views_match_the_old_dict_layout(self):
+        self.logger.log_event_wizard_move(3, self.wizard1, [1, 1], self.wizard2, [8, 8])
+        self.logger.log_event_spell(3, "A", "fireball", [8, 8])
+        self.logger.log_event_wizard_damage(3, 20, "B", 80)
+
+        self.assertEqual(self.logger.get_event_logs(), [
+            {"turn": 3, "event": "wizard_move", "details": {
+                "wizard1": {"name": "A", "move": "[0, 0]->[1, 1]"},
+                "wizard2": {"name": "B", "move": "[9, 9]->[8, 8]"},
+            }},
+            {"turn": 3, "event": "spell_cast", "details": {"caster": "A", "spell": "fireball", "target": [8, 8]}},
+            {"turn": 3, "event": "damage", "details": {
+                "entity": "wizard", "amount": 20, "name": "B", "remaining_hp": 80,
+            }},
+        ])
+
+    def test_collision_event_merges_both_entities(self):
+        minion = Minion("B", [5, 5], "B-1")
+        self.logger.log_event_collision(3, [5, 5], self.wizard1, [4, 4], minion, [6, 6])
+        (event,) = self.logger.get_event_logs()
+        self.assertEqual(event["details"], {
+            "position": [5, 5],
+            "entity1_type": "wizard",
+            "entity1": "A",
+            "entity1_bounce_position": [4, 4],
+            "entity2_type": "minion",
+            "entity2": minion.id,
+            "entity2_bounce_position": [6, 6],
+        })
+
+    def test_records_carry_the_turn_number(self):
+        self.logger.log_spell(self.wizard1, "heal", None, False)
+        self.logger.log_damage([9, 9], 4, "B")
+        self.assertEqual(self.logger.spells[0]["turn"], 3)
+        self.assertIs(self.logger.spells[0]["hit"], False)
+        self.assertEqual(self.logger.damage_events[0]["turn"], 3)
+
+    def test_malformed_positions_are_kept_verbatim(self):
+        self.logger.log_spell(self.wizard1, "fireball", "nowhere", False)
+        self.assertEqual(self.logger.spells[0]["target"], "nowhere")
+
+    def test_names_are_interned(self):
+        store = EventStore()
+        for _ in range(5):
+            store.add(KIND_SPELL_CAST, 1, actor="A", subject="fireball", pos=[1, 1])
+        self.assertEqual(store.names, ["A", "fireball"])
+        self.assertEqual(len(store), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import copy
+import random
+import unittest
+
+from bots.sample_bot1.sample_bot_1 import SampleBot1
+from bots.sample_bot2.sample_bot_2 import SampleBot2
+from bots.sample_bot3.sample_bot_3 import SampleBot3
+from bots.tactical_bot.tactical_bot import TacticalBot
+from game.engine import GameEngine
+from game.forward import step
+from tests.game.helpers import RecordingBot
+
+BOT_CLASSES = [SampleBot1, SampleBot2, SampleBot3, TacticalBot]
+
+
+class TestForwardModel(unittest.TestCase):
+    """``step`` must reproduce ``GameEngine.run_turn`` exactly, turn by turn."""
+
+    def play_and_compare(self, seed, bot1, bot2, max_turns=100):
+        random.seed(seed)
+        engine = GameEngine(RecordingBot(bot1), RecordingBot(bot2), rng=random.Random(seed))
+        for _ in range(max_turns):
+            state = engine.get_state()
+            rng = random.Random()
+            rng.setstate(engine.rng.getstate())
+
+            winner = engine.run_turn()
+            next_state, step_winner = step(state, engine.bots[0].last_action, engine.bots[1].last_action, rng)
+
+            self.assertEqual(next_state, engine.get_state(), f"seed {seed}, turn {state.turn}")
+            self.assertEqual(step_winner, getattr(winner, "name", winner))
+            self.assertEqual(rng.getstate(), engine.rng.getstate())
+            if winner:
+                break
+
+    def test_matches_run_turn_across_seeded_matches(self):
+        for seed in range(12):
+            bot1 = BOT_CLASSES[seed % len(BOT_CLASSES)]()
+            bot2 = BOT_CLASSES[(seed + 1) % len(BOT_CLASSES)]()
+            with self.subTest(seed=seed):
+                self.play_and_compare(seed, bot1, bot2)
+
+    def test_step_does_not_modify_its_inputs(self):
+        engine = GameEngine(SampleBot1(), SampleBot2(), rng=random.Random(3))
+        engine.run_turn()
+        state = engine.get_state()
+        action1 = {"move": [5, 5], "spell": {"name": "summon"}}
+        action2 = {"move": [-1, 0], "spell": {"name": "fireball", "target": [0, 0]}}
+        before = copy.deepcopy((action1, action2))
+
+        first = step(state, action1, action2, random.Random(1))
+        second = step(state, action1, action2, random.Random(1))
+
+        self.assertEqual(first, second)
+        self.assertEqual((action1, action2), before)
+        self.assertEqual(state, engine.get_state())
+
+    def test_states_are_hashable_values(self):
+        engine = GameEngine(SampleBot1(), SampleBot2(), rng=random.Random(0))
+        self.assertEqual(hash(engine.get_state()), hash(GameEngine.from_state(engine.get_state()).get_state()))
+
+
+if __name__ == "__main__":
+    unittest.main()
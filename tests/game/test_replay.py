@@ -0,0 +1,100 @@
+import random
+import unittest
+
+from bots.sample_bot1.sample_bot_1 import SampleBot1
+from bots.sample_bot3.sample_bot_3 import SampleBot3
+from bots.tactical_bot.tactical_bot import TacticalBot
+from game.actions import Action
+from game.engine import GameEngine
+from game.replay import Replay, decode_action, encode_action
+from game.replayer import Replayer
+from game.rules import Spell
+from game.snapshots import SNAPSHOT_NONE, SNAPSHOT_PER_TURN
+from simulator.match import run_match
+
+
+def play(seed, **kwargs):
+    """Run a seeded match and record the state after every turn."""
+    engine = GameEngine(SampleBot3(), TacticalBot(), seed=seed, **kwargs)
+    states = [engine.get_state()]
+    winner = None
+    while not winner and engine.turn < 100:
+        winner = engine.run_turn()
+        states.append(engine.get_state())
+    return engine, states
+
+
+class TestReplay(unittest.TestCase):
+    def test_actions_round_trip(self):
+        for action in [
+            Action(), Action((1, 0)), Action((0, 0)), Action(None, Spell.HEAL),
+            Action((-1, 1), Spell.FIREBALL, (3, 4)), Action(None, Spell.TELEPORT, (0, 9)),
+        ]:
+            self.assertEqual(decode_action(encode_action(action)), action)
+        self.assertEqual(encode_action(Action()), [])
+
+    def test_dict_round_trip(self):
+        engine, _ = play(4)
+        replay = Replay.from_dict(engine.replay.to_dict())
+        self.assertEqual(replay.seed, 4)
+        self.assertEqual(replay.names, (engine.wizard1.name, engine.wizard2.name))
+        self.assertEqual(replay.actions, engine.replay.actions)
+
+    def test_replayed_logger_matches_the_match(self):
+        for seed, policy in [(0, SNAPSHOT_PER_TURN), (1, SNAPSHOT_NONE), (2, None)]:
+            kwargs = {} if policy is None else {"snapshot_policy": policy}
+            _winner, logger = run_match(SampleBot1(), TacticalBot(), seed=seed, **kwargs)
+            replayed = Replayer(Replay.from_dict(logger.replay.to_dict())).logger(**kwargs)
+            self.assertEqual(list(replayed.get_snapshots()), list(logger.get_snapshots()))
+            self.assertEqual(replayed.get_event_logs(), logger.get_event_logs())
+            self.assertEqual(replayed.replay.actions, logger.replay.actions)
+
+    def test_seeking_any_turn(self):
+        engine, states = play(6)
+        replayer = Replayer(engine.replay, checkpoint_every=4)
+        # Out of order, so later seeks start from checkpoints filled in by earlier ones
+        for turn in [len(states) - 1, 3, 9, 0, 8, len(states) // 2]:
+            self.assertEqual(replayer.state(turn), states[turn])
+        self.assertEqual(replayer.winner(), engine.check_winner().name)
+        with self.assertRaises(IndexError):
+            replayer.state(len(states))
+
+    def test_turn_snapshots(self):
+        _winner, logger = run_match(SampleBot3(), TacticalBot(), seed=8)
+        snapshots = [{k: v for k, v in s.items() if k != "state_index"} for s in logger.get_snapshots()]
+        replayer = Replayer(logger.replay, checkpoint_every=5)
+        for turn in (1, 7, replayer.turns):
+            turn_snapshots = replayer.turn_snapshots(turn)
+            self.assertEqual([s["state_index"] for s in turn_snapshots], list(range(len(turn_snapshots))))
+            for snapshot in turn_snapshots:
+                snapshot = {k: v for k, v in snapshot.items() if k != "state_index"}
+                self.assertIn(snapshot, snapshots)
+
+    def test_engines_with_their_own_rng_record_its_state(self):
+        engine = GameEngine(SampleBot3(), TacticalBot(), rng=random.Random(3))
+        states = [engine.get_state()]
+        for _ in range(15):
+            engine.run_turn()
+            states.append(engine.get_state())
+        self.assertIsNone(engine.replay.seed)
+        replay = Replay.from_dict(engine.replay.to_dict())
+        self.assertEqual(Replayer(replay).state(15), states[15])
+
+    def test_undone_turns_are_dropped(self):
+        engine, _ = play(9, snapshot_policy=SNAPSHOT_NONE)
+        turns = engine.replay.turns
+        engine.push_state()
+        engine.play_turn(Action(), Action())
+        engine.pop_state()
+        self.assertEqual(engine.replay.turns, turns)
+        self.assertIs(engine.logger.replay, engine.replay)
+
+    def test_other_rules_versions_are_refused(self):
+        engine, _ = play(1)
+        replay = Replay.from_dict(dict(engine.replay.to_dict(), rules_version=0))
+        with self.assertRaises(ValueError):
+            Replayer(replay)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import random
+import unittest
+
+from bots.sample_bot1.sample_bot_1 import SampleBot1
+from bots.sample_bot3.sample_bot_3 import SampleBot3
+from game.engine import GameEngine
+from game.shared_state import MAX_MINIONS, SharedStateBuffer
+
+
+def bot_inputs(seeds, max_turns=100):
+    """Yield the inputs both bots see over seeded matches."""
+    for seed in seeds:
+        engine = GameEngine(SampleBot1(), SampleBot3(), rng=random.Random(seed))
+        winner = None
+        while not winner and engine.turn < max_turns:
+            yield engine.build_input(engine.wizard1, engine.wizard2)
+            yield engine.build_input(engine.wizard2, engine.wizard1)
+            winner = engine.run_turn()
+
+
+class TestSharedStateBuffer(unittest.TestCase):
+    def setUp(self):
+        self.writer = SharedStateBuffer()
+        self.reader = SharedStateBuffer(self.writer.name)
+        self.addCleanup(self.writer.unlink)
+        self.addCleanup(self.writer.close)
+        self.addCleanup(self.reader.close)
+
+    def test_round_trips_bot_inputs(self):
+        seen_minions = seen_artifacts = False
+        for state in bot_inputs(range(8)):
+            self.assertTrue(self.writer.write(state))
+            read = self.reader.read()
+            self.assertEqual(read, state)
+            self.assertEqual(list(read["self"]), list(state["self"]))
+            seen_minions |= bool(state["minions"])
+            seen_artifacts |= bool(state["artifacts"])
+        self.assertTrue(seen_minions and seen_artifacts)
+
+    def test_states_outside_the_layout_are_refused(self):
+        state = next(bot_inputs([0]))
+        minion = {"id": f"{state['self']['name']}-1", "owner": state["self"]["name"], "hp": 30, "position": [1, 1]}
+        refused = [
+            {"turn": 1},
+            dict(state, minions=[minion] * (MAX_MINIONS + 1)),
+            dict(state, minions=[dict(minion, id="custom")]),
+            dict(state, minions=[dict(minion, owner="Nobody", id="Nobody-1")]),
+            dict(state, artifacts=[{"type": "gold", "position": [0, 0], "spawn_turn": 0}]),
+            dict(state, turn=2**40),
+            dict(state, self=dict(state["self"], name="x" * 100)),
+        ]
+        for bad in refused:
+            self.assertFalse(self.writer.write(bad))
+        # A refused write leaves the previous state in place
+        self.assertTrue(self.writer.write(state))
+        self.assertFalse(self.writer.write(refused[-1]))
+        self.assertEqual(self.reader.read(), state)
+
+
+if __name__ == "__main__":
+    unittest.main()
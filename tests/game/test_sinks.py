@@ -0,0 +1,56 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from game.sinks import ConsoleSink, JsonlFileSink, ListSink, NullSink
+from simulator.match import run_match
+from tests.game.test_engine import StubBot
+
+
+class MovingBot(StubBot):
+    def decide(self, state):
+        return {"move": [1, 1], "spell": None}
+
+
+class CountingSink(ListSink):
+    def __init__(self):
+        super().__init__()
+        self.flushes = 0
+
+    def flush(self):
+        self.flushes += 1
+
+
+class TestEventSinks(unittest.TestCase):
+    def test_sinks_receive_every_event_once(self):
+        sink = ListSink()
+        _, logger = run_match(MovingBot("A"), MovingBot("B"), max_turns=6, sinks=[sink, NullSink()])
+        self.assertTrue(sink.events)
+        self.assertEqual(sink.events, logger.get_event_logs())
+
+    def test_sinks_flush_once_per_match(self):
+        sink = CountingSink()
+        run_match(MovingBot("A"), MovingBot("B"), max_turns=6, sinks=[sink])
+        self.assertEqual(sink.flushes, 1)
+
+    def test_console_sink_format(self):
+        stream = io.StringIO()
+        ConsoleSink(stream).write([{"turn": 1, "event": "spell_cast", "details": {"spell": "heal"}}])
+        self.assertEqual(stream.getvalue(), "Turn 1 | EVENT: spell_cast | {'spell': 'heal'}\n")
+
+    def test_jsonl_sink_appends_lines(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "events.jsonl")
+            with JsonlFileSink(path) as sink:
+                _, logger = run_match(MovingBot("A"), MovingBot("B"), max_turns=6, sinks=[sink])
+            self.assertIsNone(sink._file)
+            with open(path, encoding="utf-8") as f:
+                lines = [json.loads(line) for line in f]
+        self.assertEqual(len(lines), len(logger.get_event_logs()))
+        self.assertEqual(lines[0]["event"], "wizard_move")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+
+from game.snapshots import KEYFRAME_INTERVAL, SnapshotStore
+
+
+def make_state(turn, hp, minions):
+    return {
+        "turn": turn,
+        "self": {"name": "A", "hp": hp, "position": [0, 0], "cooldowns": {"fireball": 0}},
+        "minions": minions,
+    }
+
+
+class TestSnapshotStore(unittest.TestCase):
+    def test_round_trips_states(self):
+        store = SnapshotStore()
+        states = [
+            make_state(t, 100 - t, [{"id": "A-1", "hp": 30}] if t % 5 else []) for t in range(KEYFRAME_INTERVAL * 3)
+        ]
+        for state in states:
+            store.append(state)
+
+        self.assertEqual(len(store), len(states))
+        self.assertEqual(list(store), states)
+        self.assertEqual([store[i] for i in reversed(range(len(store)))], states[::-1])
+        self.assertEqual(store[-1], states[-1])
+        self.assertEqual(store[3:6], states[3:6])
+
+    def test_unchanged_fields_are_shared(self):
+        store = SnapshotStore()
+        store.append(make_state(1, 100, []))
+        store.append(make_state(2, 90, []))
+        first, second = store[0], store[1]
+        self.assertIs(first["minions"], second["minions"])
+        self.assertIs(first["self"]["cooldowns"], second["self"]["cooldowns"])
+        self.assertIs(first["self"]["position"], second["self"]["position"])
+        self.assertEqual(second["self"]["hp"], 90)
+
+    def test_snapshots_do_not_alias_live_state(self):
+        store = SnapshotStore()
+        position = [0, 0]
+        state = make_state(1, 100, [])
+        state["self"]["position"] = position
+        store.append(state)
+        position[0] = 5
+        self.assertEqual(store[0]["self"]["position"], [0, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import random
+import unittest
+
+from game import zobrist
+from game.actions import Action
+from game.engine import GameEngine
+from game.logger import NullLogger
+from game.rules import SPELL_IDS, SPELLS, Spell
+from game.spells import SPELL_HANDLERS, Heal, SpellHandler, register_spell, unregister_spell
+
+
+class Bot:
+    def __init__(self, name):
+        self.name = name
+
+
+class Drain(SpellHandler):
+    """Test spell: take HP from the opponent."""
+
+    name = "drain"
+
+    def cast(self, engine, caster, target):
+        opponent = engine.wizard2 if caster is engine.wizard1 else engine.wizard1
+        opponent.hp -= self.params["amount"]
+        caster.hp += self.params["amount"]
+        return True
+
+
+class TestSpellRegistry(unittest.TestCase):
+    def test_builtin_spells_are_dispatched_by_id(self):
+        for spell in Spell:
+            self.assertEqual(SPELL_HANDLERS[spell].name, spell.name.lower())
+            self.assertEqual(SPELL_HANDLERS[spell].cost, SPELLS[spell.name.lower()]["cost"])
+
+    def test_new_spell_plugs_in_without_engine_changes(self):
+        register_spell(Drain(), cost=40, cooldown=3, amount=15)
+        self.addCleanup(unregister_spell, "drain")
+
+        engine = GameEngine(Bot("A"), Bot("B"), rng=random.Random(0))
+        engine.wizard1.hp = 50
+        engine.play_turn({"move": None, "spell": {"name": "drain"}}, {"move": None, "spell": None})
+
+        self.assertEqual(engine.wizard1.hp, 65)
+        self.assertEqual(engine.wizard2.hp, 85)
+        self.assertEqual(engine.wizard1.cooldowns["drain"], 2)
+        self.assertEqual(engine.wizard1.mana, 70)
+        self.assertTrue(engine.logger.spells[-1]["hit"])
+
+    def test_spells_registered_late_reach_live_engines(self):
+        engine = GameEngine(Bot("A"), Bot("B"), rng=random.Random(0))
+        register_spell(Drain(), cost=40, cooldown=3, amount=15)
+        self.addCleanup(unregister_spell, "drain")
+
+        self.assertEqual(engine.wizard1.cooldowns["drain"], 0)
+        self.assertEqual(engine.build_input(engine.wizard1, engine.wizard2)["self"]["cooldowns"]["drain"], 0)
+        engine.play_turn({"move": None, "spell": {"name": "drain"}}, {"move": None, "spell": None})
+        self.assertEqual(engine.wizard2.hp, 85)
+        self.assertEqual(engine.wizard1.cooldowns["drain"], 2)
+        self.assertEqual(engine.zobrist, zobrist.hash_state(engine.get_state()))
+
+        engine.play_turn({"move": None, "spell": {"name": "drain"}}, {"move": None, "spell": None})
+        self.assertEqual(engine.wizard2.hp, 85)  # still cooling down
+
+    def test_handlers_can_be_replaced(self):
+        class BigHeal(Heal):
+            def cast(self, engine, caster, target):
+                caster.hp = 100
+                return False
+
+        original = SPELL_HANDLERS[SPELL_IDS["heal"]]
+        register_spell(BigHeal())
+        self.addCleanup(register_spell, original)
+
+        engine = GameEngine(Bot("A"), Bot("B"))
+        engine.logger = NullLogger()
+        engine.wizard1.hp = 10
+        engine.process_spell(engine.wizard1, Action(spell=Spell.HEAL))
+        self.assertEqual(engine.wizard1.hp, 100)
+
+    def test_new_spell_needs_cost_and_cooldown(self):
+        with self.assertRaises(ValueError):
+            register_spell(Drain())
+        self.assertNotIn("drain", SPELL_IDS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import random
+import unittest
+
+from bots.sample_bot3.sample_bot_3 import SampleBot3
+from bots.tactical_bot.tactical_bot import TacticalBot
+from game.engine import GameEngine
+from game.zobrist import hash_state
+
+
+class Bot:
+    def __init__(self, name):
+        self.name = name
+
+
+class TestZobrist(unittest.TestCase):
+    def test_incremental_hash_matches_full_hash(self):
+        for seed in range(10):
+            engine = GameEngine(SampleBot3(), TacticalBot(), rng=random.Random(seed))
+            winner = None
+            while not winner and engine.turn < 100:
+                winner = engine.run_turn()
+                self.assertEqual(engine.zobrist, hash_state(engine.get_state()), f"seed {seed}, turn {engine.turn}")
+
+    def test_transpositions_hash_the_same(self):
+        a = GameEngine.from_state(GameEngine(Bot("A"), Bot("B")).get_state(), random.Random(0))
+        b = a.clone()
+        a.play_turn({"move": [1, 0]}, {"move": [0, -1]})
+        a.play_turn({"move": [0, 1]}, {"move": [-1, 0]})
+        b.play_turn({"move": [0, 1]}, {"move": [-1, 0]})
+        b.play_turn({"move": [1, 0]}, {"move": [0, -1]})
+        self.assertEqual(a.wizard1.position, b.wizard1.position)
+        self.assertEqual(a.zobrist, b.zobrist)
+
+    def test_changes_change_the_hash(self):
+        engine = GameEngine(Bot("A"), Bot("B"))
+        seen = {engine.zobrist}
+        engine.wizard1.hp -= 10
+        seen.add(engine.zobrist)
+        engine.wizard2.shield_active = True
+        seen.add(engine.zobrist)
+        engine.wizard1.cast_spell("heal")
+        seen.add(engine.zobrist)
+        engine.summon_minion(engine.wizard2, [8, 8])
+        seen.add(engine.zobrist)
+        engine.turn += 1
+        seen.add(engine.zobrist)
+        self.assertEqual(len(seen), 6)
+
+        # Undoing a change restores the hash
+        before = engine.zobrist
+        engine.wizard1.hp += 5
+        engine.wizard1.hp -= 5
+        self.assertEqual(engine.zobrist, before)
+
+    def test_swapped_wizards_hash_differently(self):
+        engine = GameEngine(Bot("A"), Bot("B"))
+        engine.wizard1.hp = 50
+        state = engine.get_state()
+        swapped = state._replace(wizard1=state.wizard2, wizard2=state.wizard1)
+        self.assertNotEqual(hash_state(state), hash_state(swapped))
+
+    def test_copies_keep_the_hash(self):
+        engine = GameEngine(SampleBot3(), TacticalBot(), rng=random.Random(2))
+        for _ in range(12):
+            engine.run_turn()
+        before = engine.zobrist
+        self.assertEqual(engine.clone().zobrist, before)
+        engine.push_state()
+        engine.run_turn()
+        engine.pop_state()
+        self.assertEqual(engine.zobrist, before)
+        self.assertEqual(GameEngine.from_state(engine.get_state()).zobrist, before)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import random
+import unittest
+
+from simulator.bracket import Bracket, pick_lucky_loser
+
+
+class Bot:
+    def __init__(self, name):
+        self.name = name
+
+
+def bots(n):
+    return [Bot(f"bot{i:02d}") for i in range(n)]
+
+
+def play(bracket, order=min):
+    """Run ``bracket`` to the end; each match is won by the lower name and matches finish in ``order``."""
+    running = []
+    while not bracket.done:
+        for node in bracket.ready():
+            if len(bracket.start(node)) == 2:
+                running.append(node)
+        node = order(running, key=lambda n: (n.round, n.index))
+        running.remove(node)
+        winner, loser = sorted(node.entrants, key=lambda b: b.name)
+        bracket.finish(node, winner, [(loser.name, len(loser.name) + node.round)])
+    return bracket.final.winner
+
+
+class TestBracket(unittest.TestCase):
+    def test_shape(self):
+        bracket = Bracket(bots(11), random.Random(0))
+        self.assertEqual([len(nodes) for nodes in bracket.rounds], [6, 3, 2, 1])
+        self.assertEqual(sorted(len(node.entrants) for node in bracket.rounds[0]), [1, 2, 2, 2, 2, 2])
+        self.assertEqual([len(node.feeders) for node in bracket.rounds[2]], [2, 1])
+        self.assertEqual(play(bracket).name, "bot00")
+
+    def test_matches_start_when_their_feeders_are_done(self):
+        bracket = Bracket(bots(8), random.Random(1))
+        first = bracket.ready()
+        self.assertEqual(len(first), 4)
+        for node in first:
+            bracket.start(node)
+        feeders = bracket.rounds[1][0].feeders
+        for node in feeders:
+            bracket.finish(node, node.entrants[0], [(node.entrants[1].name, 10)])
+        # The rest of round 1 is still playing
+        self.assertEqual(bracket.ready(), [bracket.rounds[1][0]])
+
+    def test_bye_slots_wait_for_earlier_rounds(self):
+        bracket = Bracket(bots(6), random.Random(2))
+        bye_slot = bracket.rounds[1][1]
+        self.assertTrue(bye_slot.is_bye_slot)
+        nodes = bracket.ready()
+        for node in nodes:
+            bracket.start(node)
+        bracket.finish(bye_slot.feeders[0], bye_slot.feeders[0].entrants[0])
+        self.assertNotIn(bye_slot, bracket.ready())
+        for node in nodes:
+            if not node.done:
+                bracket.finish(node, node.entrants[0], [(node.entrants[1].name, 5)])
+        self.assertIn(bye_slot, bracket.ready())
+        self.assertEqual(len(bracket.start(bye_slot)), 1)
+        self.assertTrue(bye_slot.done)
+
+    def test_finishing_order_does_not_matter(self):
+        results = []
+        for order in (min, max):
+            bracket = Bracket(bots(13), random.Random(3))
+            winner = play(bracket, order)
+            results.append((winner.name, [bracket.losers_stats(r) for r in range(2, len(bracket.rounds) + 1)]))
+        self.assertEqual(results[0], results[1])
+
+    def test_disqualified_pairings_leave_a_walkover(self):
+        bracket = Bracket(bots(4), random.Random(4))
+        first, second = bracket.ready()
+        for node in (first, second):
+            bracket.start(node)
+        bracket.finish(first, None, [(bot.name, 100) for bot in first.entrants])
+        bracket.finish(second, second.entrants[1], [(second.entrants[0].name, 20)])
+        final = bracket.final
+        self.assertEqual(bracket.start(final), [second.entrants[1]])
+        self.assertTrue(bracket.done)
+        self.assertIs(final.winner, second.entrants[1])
+
+    def test_pick_lucky_loser(self):
+        participants = bots(3)
+        self.assertIsNone(pick_lucky_loser(participants, {}))
+        self.assertIsNone(pick_lucky_loser(participants, {"other": 9}))
+        self.assertIs(pick_lucky_loser(participants, {"bot01": 9, "bot02": 3}), participants[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
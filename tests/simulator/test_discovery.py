@@ -0,0 +1,142 @@
+import importlib
+import itertools
+import os
+import sys
+import tempfile
+import unittest
+
+from simulator.discovery import BotManifest
+
+HEADER = "from bots.bot_interface import BotInterface\n"
+
+BOT_CLASS = '''
+
+class {cls}(BotInterface):
+    @property
+    def name(self):
+        return "{name}"
+
+    def decide(self, state):
+        return {{"move": [0, 0], "spell": None}}
+'''
+
+_packages = itertools.count()
+
+
+def bot_source(cls, name):
+    return HEADER + BOT_CLASS.format(cls=cls, name=name)
+
+
+class TestBotManifest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = self.tmp.name
+        self.package = f"manifest_bots_{next(_packages)}"
+        self.bots_dir = os.path.join(self.root, self.package)
+        os.makedirs(os.path.join(self.bots_dir, "pair"))
+        for directory in (self.bots_dir, os.path.join(self.bots_dir, "pair")):
+            open(os.path.join(directory, "__init__.py"), "w").close()
+        self.write("alpha.py", bot_source("AlphaBot", "Alpha"))
+        self.write("pair/pair.py", bot_source("BetaBot", "Beta") + BOT_CLASS.format(cls="GammaBot", name="Gamma"))
+        sys.path.insert(0, self.root)
+        importlib.invalidate_caches()
+
+    def tearDown(self):
+        sys.path.remove(self.root)
+        self.forget_modules()
+        self.tmp.cleanup()
+
+    def write(self, path, source):
+        with open(os.path.join(self.bots_dir, path), "w") as f:
+            f.write(source)
+
+    def forget_modules(self):
+        for name in [m for m in sys.modules if m.startswith(self.package + ".")]:
+            del sys.modules[name]
+
+    def imported(self):
+        return sorted(m[len(self.package) + 1:] for m in sys.modules if m.startswith(self.package + "."))
+
+    def manifest(self):
+        return BotManifest(self.bots_dir, root=self.root)
+
+    def names(self, manifest):
+        return sorted(entry.name for entry in manifest.entries())
+
+    def test_names_come_from_the_cache_without_imports(self):
+        self.assertEqual(self.names(self.manifest()), ["Alpha", "Beta", "Gamma"])
+        self.assertTrue(os.path.exists(os.path.join(self.bots_dir, ".bot_manifest.json")))
+        self.forget_modules()
+
+        manifest = self.manifest()
+        self.assertEqual(self.names(manifest), ["Alpha", "Beta", "Gamma"])
+        self.assertEqual(self.imported(), [])
+        self.assertEqual(manifest.errors, [])
+
+    def test_load_imports_only_the_requested_bot(self):
+        self.manifest().entries()
+        self.forget_modules()
+
+        manifest = self.manifest()
+        entry = manifest.find("gamma")
+        self.assertEqual((entry.module, entry.class_name), (f"{self.package}.pair.pair", "GammaBot"))
+        self.assertEqual(self.imported(), [])
+        bot = manifest.load(entry)
+        self.assertEqual(bot.name, "Gamma")
+        self.assertEqual(self.imported(), ["pair", "pair.pair"])
+        self.assertIsNone(manifest.find("Delta"))
+
+    def test_changed_files_are_read_again(self):
+        self.manifest().entries()
+        self.forget_modules()
+
+        self.write("alpha.py", bot_source("AlphaBot", "Alpha Prime"))
+        os.utime(os.path.join(self.bots_dir, "alpha.py"), ns=(1, 1))
+        self.write("delta.py", bot_source("DeltaBot", "Delta"))
+        os.remove(os.path.join(self.bots_dir, "pair", "pair.py"))
+        importlib.invalidate_caches()
+        self.assertEqual(self.names(self.manifest()), ["Alpha Prime", "Delta"])
+        self.forget_modules()
+
+        self.assertEqual(self.names(self.manifest()), ["Alpha Prime", "Delta"])
+        self.assertEqual(self.imported(), [])
+
+    def test_touched_files_are_not_imported_again(self):
+        self.manifest().entries()
+        self.forget_modules()
+
+        os.utime(os.path.join(self.bots_dir, "alpha.py"), ns=(1, 1))
+        self.assertEqual(self.names(self.manifest()), ["Alpha", "Beta", "Gamma"])
+        self.assertEqual(self.imported(), [])
+
+    def test_missing_dependencies_are_remembered(self):
+        self.write("needy.py", "import no_such_dependency_here\n" + bot_source("NeedyBot", "Needy"))
+        self.write("broken.py", "def broken(:\n")
+        manifest = self.manifest()
+        self.assertEqual(self.names(manifest), ["Alpha", "Beta", "Gamma"])
+        self.assertEqual(
+            sorted((module.rsplit(".", 1)[1], type(e)) for module, e in manifest.errors),
+            [("broken", SyntaxError), ("needy", ModuleNotFoundError)],
+        )
+        self.forget_modules()
+
+        manifest = self.manifest()
+        self.assertEqual(self.names(manifest), ["Alpha", "Beta", "Gamma"])
+        self.assertEqual(self.imported(), [])
+        errors = {module.rsplit(".", 1)[1]: e for module, e in manifest.errors}
+        self.assertIsInstance(errors["broken"], SyntaxError)
+        self.assertEqual(str(errors["needy"]), "No module named 'no_such_dependency_here'")
+
+        # Installing the dependency makes the module worth importing again
+        with open(os.path.join(self.root, "no_such_dependency_here.py"), "w"):
+            pass
+        importlib.invalidate_caches()
+        try:
+            manifest = self.manifest()
+            self.assertEqual(self.names(manifest), ["Alpha", "Beta", "Gamma", "Needy"])
+        finally:
+            sys.modules.pop("no_such_dependency_here", None)
+
+
+if __name__ == "__main__":
+    unittest.main()
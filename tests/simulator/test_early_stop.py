@@ -0,0 +1,98 @@
+import random
+import unittest
+
+from simulator.early_stop import BOT1, BOT2, DRAW, SPRT, WilsonStop, wilson_interval
+
+
+def run(test, p_win, rng, max_games=10000):
+    """Feed ``test`` decisive games that bot1 wins with probability ``p_win`` until it decides."""
+    while not test.add(BOT1 if rng.random() < p_win else BOT2) and test.games < max_games:
+        pass
+    return test.decision
+
+
+class TestWilsonInterval(unittest.TestCase):
+    def test_known_values(self):
+        low, high = wilson_interval(8, 10)
+        self.assertAlmostEqual(low, 0.4902, places=4)
+        self.assertAlmostEqual(high, 0.9433, places=4)
+        self.assertEqual(wilson_interval(0, 0), (0.0, 1.0))
+        low, high = wilson_interval(0, 5, 0.99)
+        self.assertEqual(low, 0.0)
+        self.assertLess(high, 0.6)
+
+
+class TestSPRT(unittest.TestCase):
+    def test_a_winning_streak_decides(self):
+        test = SPRT()
+        decided = [test.add(BOT1) for _ in range(8)]
+        self.assertEqual(decided, [False] * 7 + [True])
+        self.assertEqual(test.decision, BOT1)
+
+        test = SPRT()
+        while not test.add(BOT2):
+            pass
+        self.assertEqual((test.decision, test.games), (BOT2, 8))
+
+    def test_draws_carry_no_evidence(self):
+        test = SPRT()
+        for _ in range(50):
+            self.assertFalse(test.add(DRAW))
+        self.assertEqual(test.llr, 0)
+        self.assertEqual(test.decisive, 0)
+
+    def test_error_rate(self):
+        # At the boundary hypothesis the wrong bot is picked about (1 - confidence) of the time
+        rng = random.Random(0)
+        wrong = sum(run(SPRT(confidence=0.9), 0.4, rng) == BOT1 for _ in range(400))
+        self.assertLess(wrong, 400 * 0.1 * 1.5)
+        # A clearly stronger bot is found quickly
+        games = []
+        for _ in range(50):
+            test = SPRT()
+            self.assertEqual(run(test, 0.8, rng), BOT1)
+            games.append(test.games)
+        self.assertLess(sum(games) / len(games), 20)
+
+    def test_even_bots_are_decided_without_a_stronger_bot(self):
+        # Not an equality test: with p = 0.5 it still picks a side, after about 53 decisive games
+        rng = random.Random(3)
+        tests = [SPRT() for _ in range(200)]
+        decisions = [run(test, 0.5, rng) for test in tests]
+        self.assertNotIn(None, decisions)
+        self.assertTrue(40 < sum(test.games for test in tests) / len(tests) < 70)
+        self.assertTrue(60 < decisions.count(BOT1) < 140)
+
+        test = next(test for test in tests if test.decision == BOT2)
+        conclusion = test.conclusion("A", "B")
+        self.assertEqual(conclusion, "accepted B winning at least 60% of decisive games against A, over at most 40%")
+        self.assertNotIn("stronger", conclusion)
+
+    def test_arguments(self):
+        with self.assertRaises(ValueError):
+            SPRT(confidence=1)
+        with self.assertRaises(ValueError):
+            SPRT(margin=0.5)
+
+
+class TestWilsonStop(unittest.TestCase):
+    def test_waits_for_min_games(self):
+        test = WilsonStop(min_games=10)
+        self.assertEqual([test.add(BOT1) for _ in range(10)], [False] * 9 + [True])
+        self.assertEqual(test.decision, BOT1)
+        self.assertGreater(test.interval()[0], 0.5)
+
+    def test_even_bots_stay_undecided(self):
+        test = WilsonStop()
+        for _ in range(30):
+            self.assertFalse(test.add(BOT1) or test.add(BOT2))
+
+    def test_conclusion_names_the_stronger_bot(self):
+        test = WilsonStop(min_games=5)
+        while not test.add(BOT2):
+            pass
+        self.assertEqual(test.conclusion("A", "B"), "B is stronger")
+
+
+if __name__ == "__main__":
+    unittest.main()
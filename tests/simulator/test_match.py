@@ -0,0 +1,51 @@
+import random
+import unittest
+
+from bots.sample_bot1.sample_bot_1 import SampleBot1
+from bots.sample_bot3.sample_bot_3 import SampleBot3
+from bots.tactical_bot.tactical_bot import TacticalBot
+from game.snapshots import SNAPSHOT_NONE
+from simulator.match import run_match, run_matches
+
+
+def summary(result):
+    winner, logger = result
+    return getattr(winner, "name", winner), logger.get_snapshots()[-1], logger.get_event_logs()
+
+
+class TestRunMatches(unittest.TestCase):
+    def pairings(self, n):
+        classes = [SampleBot1, SampleBot3, TacticalBot]
+        return [(classes[i % 3](), classes[(i + 1) % 3]()) for i in range(n)]
+
+    def test_threads_play_the_same_matches_as_run_match(self):
+        seeds = list(range(12))
+        expected = [
+            summary(run_match(bot1, bot2, snapshot_policy=SNAPSHOT_NONE, rng=random.Random(seed)))
+            for (bot1, bot2), seed in zip(self.pairings(12), seeds)
+        ]
+        for workers in (1, 4):
+            results = run_matches(self.pairings(12), seeds, workers=workers, snapshot_policy=SNAPSHOT_NONE)
+            self.assertEqual([summary(r) for r in results], expected)
+
+    def test_global_seed_fixes_unseeded_matches(self):
+        runs = []
+        for _ in range(2):
+            random.seed(5)
+            runs.append([summary(r) for r in run_matches(self.pairings(6), workers=3, snapshot_policy=SNAPSHOT_NONE)])
+        self.assertEqual(runs[0], runs[1])
+
+    def test_concurrent_matches_do_not_share_state(self):
+        # The same match played four times at once numbers its minions and draws its RNG the same way
+        pairings = [(SampleBot3(), TacticalBot()) for _ in range(4)]
+        results = [summary(r) for r in run_matches(pairings, [7] * 4, workers=4)]
+        self.assertTrue(any(event["event"] == "minion_move" for event in results[0][2]))
+        self.assertEqual(results, [results[0]] * 4)
+
+    def test_seed_count_must_match(self):
+        with self.assertRaises(ValueError):
+            run_matches(self.pairings(2), [1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,242 @@
+import contextlib
+import importlib.util
+import io
+import random
+import unittest
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+
+from bots.sample_bot1.sample_bot_1 import SampleBot1
+from bots.sample_bot3.sample_bot_3 import SampleBot3
+from bots.tactical_bot.tactical_bot import TacticalBot
+from game.decisions import DecisionRunner
+from game.snapshots import SNAPSHOT_NONE
+from simulator.early_stop import BOT1, EarlyStop
+
+HAS_PYGAME = importlib.util.find_spec("pygame") is not None
+if HAS_PYGAME:  # main.py imports the visualizer
+    import main
+
+
+# Stateless bots under their own names, so in-process and pool tournaments play the same games
+class Apprentice(SampleBot1):
+    def __init__(self):
+        super().__init__()
+        self._name = "Apprentice"
+
+
+class Adept(SampleBot3):
+    def __init__(self):
+        super().__init__()
+        self._name = "Adept"
+
+
+class Conjurer(SampleBot1):
+    def __init__(self):
+        super().__init__()
+        self._name = "Conjurer"
+
+
+class Sorcerer(SampleBot3):
+    def __init__(self):
+        super().__init__()
+        self._name = "Sorcerer"
+
+
+class Warlock(SampleBot3):
+    def __init__(self):
+        super().__init__()
+        self._name = "Warlock"
+
+
+class Sluggard(SampleBot1):
+    """Only fights its first game and idles through every later one."""
+
+    def __init__(self):
+        super().__init__()
+        self._name = "Sluggard"
+        self.games = 0
+
+    def decide(self, state):
+        if self.games:
+            return {"move": [0, 0], "spell": None}
+        return super().decide(state)
+
+    def game_over(self, won):
+        self.games += 1
+
+
+def quietly(function, *args, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return function(*args, **kwargs)
+
+
+def output(function, *args, **kwargs):
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        function(*args, **kwargs)
+    return out.getvalue()
+
+
+class RecordingPool(ProcessPoolExecutor):
+    """A process pool that keeps its futures and how it was shut down."""
+
+    instances = []
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.futures = []
+        self.shutdowns = []
+        RecordingPool.instances.append(self)
+
+    def submit(self, *args, **kwargs):
+        future = super().submit(*args, **kwargs)
+        self.futures.append(future)
+        return future
+
+    def shutdown(self, *args, **kwargs):
+        self.shutdowns.append(kwargs)
+        super().shutdown(*args, **kwargs)
+
+
+class FirstGameDecides(EarlyStop):
+    name = "first"
+
+    def _decide(self):
+        return BOT1
+
+
+@unittest.skipUnless(HAS_PYGAME, "main.py needs pygame")
+class TestPairingTasks(unittest.TestCase):
+    def setUp(self):
+        self.decisions = DecisionRunner()
+        self.addCleanup(self.decisions.close)
+
+    def test_task_plays_the_pairing_like_this_process(self):
+        b1, b2 = SampleBot1(), TacticalBot()
+        games = main.play_pairing(b1, b2, SNAPSHOT_NONE, self.decisions, 7)
+        settings = main.decision_settings(self.decisions)
+        results, overruns, crashes = main.play_pairing_task(SampleBot1, TacticalBot, 7, settings, True)
+
+        slots = {b1: 1, b2: 2}
+        self.assertEqual(
+            [(slot, turns) for slot, turns, _replay in results],
+            [(slots.get(winner, winner), turns) for winner, turns, _logger in games],
+        )
+        self.assertEqual((overruns, crashes), (Counter(), Counter()))
+
+        collected = main.collect_pairing((results, overruns, crashes), b1, b2, self.decisions)
+        self.assertEqual([(w, t) for w, t, _ in collected], [(w, t) for w, t, _ in games])
+        for (_, _, replayed), (_, _, logger) in zip(collected, games):
+            # The replay is logged with animation snapshots, so only the state itself matches
+            final, expected = replayed.get_snapshots()[-1], logger.get_snapshots()[-1]
+            self.assertEqual(dict(final, state_index=None), dict(expected, state_index=None))
+
+    def test_task_without_replays_sends_no_logs(self):
+        settings = main.decision_settings(self.decisions)
+        results, _, _ = main.play_pairing_task(SampleBot1, TacticalBot, 7, settings, False)
+        self.assertTrue(all(replay is None for _, _, replay in results))
+
+    def test_collect_pairing_maps_slots_and_books_problems(self):
+        b1, b2 = SampleBot1(), TacticalBot()
+        result = ([("Draw", 100, None), (2, 31, None)], Counter({b2.name: 2}), Counter({b1.name: 1}))
+        games = main.collect_pairing(result, b1, b2, self.decisions)
+        self.assertEqual(games, [("Draw", 100, None), (b2, 31, None)])
+        self.assertEqual(self.decisions.overruns, Counter({b2.name: 2}))
+        self.assertEqual(self.decisions.crashes, Counter({b1.name: 1}))
+
+
+@unittest.skipUnless(HAS_PYGAME, "main.py needs pygame")
+class TestTournamentWorkers(unittest.TestCase):
+    def tournament(self, seed=5, **kwargs):
+        bots = [Apprentice(), Adept(), Conjurer(), Sorcerer(), Warlock()]
+        with mock.patch.object(main, "discover_bots", return_value=bots):
+            winner, stats = quietly(main.run_tournament, headless=True, seed=seed, **kwargs)
+        # The dag schedule books pool matches as they finish
+        matches = sorted(
+            (m["round"], m["bot1"], m["bot2"], getattr(m["winner"], "name", m["winner"]), m["turns"])
+            for m in stats["matches"]
+        )
+        return getattr(winner, "name", None), matches, stats["rounds"]
+
+    def test_pool_plays_the_same_tournament(self):
+        for schedule in main.SCHEDULES:
+            with self.subTest(schedule=schedule):
+                expected = self.tournament(schedule=schedule)
+                self.assertEqual(self.tournament(schedule=schedule, workers=1), expected)
+                self.assertEqual(self.tournament(schedule=schedule, workers=3), expected)
+
+    def test_seed_fixes_the_bracket(self):
+        self.assertEqual(self.tournament(), self.tournament())
+        self.assertNotEqual(self.tournament()[2], self.tournament(seed=6)[2])
+
+
+@unittest.skipUnless(HAS_PYGAME, "main.py needs pygame")
+class TestSeriesWorkers(unittest.TestCase):
+    def series(self, run=quietly, bot2="adept", **kwargs):
+        bots = {"apprentice": Apprentice, "adept": Adept, "sluggard": Sluggard}
+        with mock.patch.object(main, "find_bot_by_name", side_effect=lambda name, _manifest: bots[name]()):
+            return run(main.run_single_match, "apprentice", bot2, headless=True, seed=11, **kwargs)
+
+    def test_results_are_counted_in_match_order(self):
+        stats = self.series(count=6)
+        decisions = DecisionRunner()
+        self.addCleanup(decisions.close)
+        series_seeds = random.Random(11)
+        bot1, bot2 = Apprentice(), Adept()
+        expected = []
+        turns = 0
+        for _ in range(6):
+            winner, turns_fought, _logger = main.play_series_game(
+                bot1, bot2, decisions, series_seeds.getrandbits(64), SNAPSHOT_NONE, False
+            )
+            expected.append({bot1: "bot1", bot2: "bot2"}.get(winner, "draw"))
+            turns += turns_fought
+        self.assertEqual(stats["match_results"], expected)
+        self.assertEqual(
+            (stats["bot1_wins"], stats["bot2_wins"], stats["draws"], stats["total_turns"]),
+            (expected.count("bot1"), expected.count("bot2"), expected.count("draw"), turns),
+        )
+
+    def test_pool_plays_the_same_series(self):
+        expected = self.series(count=6)
+        for workers in (1, 3):
+            with self.subTest(workers=workers):
+                self.assertEqual(self.series(count=6, workers=workers), expected)
+
+    def test_pool_matches_do_not_depend_on_the_worker_count(self):
+        # Every pool match gets fresh bots, so what a bot learnt never leaks into another match
+        expected = self.series(bot2="sluggard", count=8, workers=1)
+        self.assertEqual(self.series(bot2="sluggard", count=8, workers=3), expected)
+
+        settings = main.decision_settings(DecisionRunner())
+        seeds = random.Random(11)
+        fresh = [main.play_series_match(Apprentice, Sluggard, settings, seeds.getrandbits(64), False) for _ in range(8)]
+        self.assertEqual(
+            expected["match_results"], [{1: "bot1", 2: "bot2"}.get(slot, "draw") for slot, *_ in fresh]
+        )
+
+    def test_early_stop_cancels_the_remaining_matches(self):
+        RecordingPool.instances = []
+        with mock.patch.object(main, "ProcessPoolExecutor", RecordingPool):
+            stats = self.series(count=40, workers=1, early_stop=FirstGameDecides())
+        self.assertEqual(len(stats["match_results"]), 1)
+        (pool,) = RecordingPool.instances
+        self.assertEqual(pool.shutdowns, [{"cancel_futures": True}])
+        self.assertEqual(len(pool.futures), 40)
+        self.assertTrue(any(future.cancelled() for future in pool.futures))
+
+    def test_verbose_logs_are_printed_by_this_process_in_match_order(self):
+        def verbose_series(**kwargs):
+            text = self.series(run=output, verbose=True, count=3, **kwargs)
+            # The winner line shows the winning object's repr
+            return [line for line in text.splitlines() if not line.startswith("Game Over:")]
+
+        expected = verbose_series()
+        self.assertIn("Turn 1 | EVENT:", "\n".join(expected))
+        self.assertEqual(verbose_series(workers=2), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()